@@ -0,0 +1,35 @@
+"""
+Compares the vectorized bind path of the temporal types against the previous
+implementation, which built one pymeos instant per row.
+
+Run using: python -m benchmarks.bench_bind
+"""
+from mobilitydb_sqlalchemy import TBool, TFloat, TGeomPoint, TInt
+
+from .common import best_of, legacy_bind, make_frame
+
+
+CASES = [
+    ("TInt", TInt(), "int"),
+    ("TFloat", TFloat(), "value"),
+    ("TBool", TBool(), "bool"),
+    ("TGeomPoint", TGeomPoint(), "geometry"),
+]
+
+
+def main(sizes=(1000, 50000)):
+    for name, column_type, column in CASES:
+        process = column_type.bind_processor(None)
+        for n in sizes:
+            df = make_frame(column, n)
+            legacy = best_of(legacy_bind, column_type, df, repeat=1)
+            vectorized = best_of(process, df)
+            print(
+                "{:<12} n={:<8} legacy={:.4f}s vectorized={:.4f}s speedup={:.1f}x".format(
+                    name, n, legacy, vectorized, legacy / vectorized
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
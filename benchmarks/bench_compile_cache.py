@@ -0,0 +1,75 @@
+"""
+Compares compiling a repeated geofence query with SQLAlchemy's statement cache
+against compiling it from scratch every time, which is what happened for every
+statement using the MobilityDB types before they were cacheable.
+
+Run using: python -m benchmarks.bench_compile_cache
+"""
+from functools import partial
+
+from sqlalchemy import Column, Integer, MetaData, Table, bindparam, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.util import LRUCache
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint
+
+from .common import best_of
+
+metadata = MetaData()
+trips = Table(
+    "trips",
+    metadata,
+    Column("car_id", Integer),
+    Column("trip", TGeomPoint),
+    Column("speed", TFloat),
+)
+
+
+def geofence_query(box):
+    """
+    The query built by the application for every request: the cars whose trips
+    crossed a box, and how close they got to it, while driving slowly.
+    """
+    return select([trips.c.car_id, trips.c.trip.distance(box)]).where(
+        trips.c.trip.bboxes_overlap(bindparam("box", box))
+        & trips.c.speed.temporal_less_than(50).ever_equal_to(True)
+    )
+
+
+def compile_queries(dialect, boxes, compiled_cache):
+    # The same call Connection.execute makes before running a statement
+    hits = 0
+    for box in boxes:
+        compiled, _, hit = geofence_query(box)._compile_w_cache(
+            dialect, compiled_cache=compiled_cache, column_keys=[]
+        )
+        hits += hit is dialect.CACHE_HIT
+    return hits
+
+
+def main(count=2000):
+    dialect = postgresql.dialect()
+    boxes = ["STBOX(({0}, {0}), ({1}, {1}))".format(i, i + 1) for i in range(count)]
+
+    uncached = best_of(partial(compile_queries, dialect, boxes, None), repeat=3)
+    cache = LRUCache(500)
+    cold_hits = compile_queries(dialect, boxes, cache)
+    cached = best_of(partial(compile_queries, dialect, boxes, cache), repeat=3)
+    warm_hits = compile_queries(dialect, boxes, cache)
+    print(
+        "queries={} uncached={:.4f}s cached={:.4f}s speedup={:.1f}x "
+        "cache hits: cold={}/{} warm={}/{}".format(
+            count,
+            uncached,
+            cached,
+            uncached / cached,
+            cold_hits,
+            count,
+            warm_hits,
+            count,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Compares building movingpandas Trajectories for a fleet of trips from decoded
+arrays, the way it was done before (a DataFrame of shapely Points converted to a
+GeoDataFrame) against building the GeoDataFrame straight from the coordinates.
+
+Run using: python -m benchmarks.bench_movingpandas
+"""
+import sys
+
+from mobilitydb_sqlalchemy import TGeomPoint
+from mobilitydb_sqlalchemy.types.TBaseGeomPoint import CRS_METRIC, MOVING_PANDAS
+
+from .common import best_of, make_trip
+
+
+def legacy_trajectories(column_type, trips):
+    import movingpandas as mpd
+    from geopandas import GeoDataFrame
+
+    for times, coords in trips:
+        df = column_type.to_temporal_array(times, coords).to_dataframe()
+        mpd.Trajectory(GeoDataFrame(df, crs=CRS_METRIC), 1)
+
+
+def direct_trajectories(column_type, trips):
+    for times, coords in trips:
+        column_type.from_arrays(times, coords)
+
+
+def main(fleets=((1000, 100), (200, 5000))):
+    if not MOVING_PANDAS:
+        sys.exit("movingpandas is not installed")
+    column_type = TGeomPoint(use_movingpandas=True)
+    for count, instants in fleets:
+        trips = [make_trip(instants, seed=i) for i in range(count)]
+        legacy = best_of(legacy_trajectories, column_type, trips, repeat=3)
+        direct = best_of(direct_trajectories, column_type, trips, repeat=3)
+        print(
+            "trips={:<6} instants={:<6} legacy={:.4f}s direct={:.4f}s "
+            "speedup={:.1f}x".format(count, instants, legacy, direct, legacy / direct)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares decoding a large result of temporal points in the current process
+against decoding it in pools of 1 to 16 processes, with and without the
+small-result bypass.
+
+Run using: python -m benchmarks.bench_parallel
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from mobilitydb_sqlalchemy import TGeomPoint
+from mobilitydb_sqlalchemy.parallel import decode_values
+
+from .common import best_of, make_trip, trip_as_text
+
+WORKERS = (1, 2, 4, 8, 16)
+
+
+def make_rows(rows, instants):
+    return [trip_as_text(*make_trip(instants, seed=i)) for i in range(rows)]
+
+
+def main(sizes=((10, 100), (1000, 1000), (200, 10000))):
+    column_type = TGeomPoint()
+    for rows, instants in sizes:
+        values = make_rows(rows, instants)
+        serial = best_of(
+            partial(decode_values, min_bytes=float("inf")),
+            column_type,
+            values,
+            repeat=3,
+        )
+        print("rows={:<6} instants={:<7} serial={:.4f}s".format(rows, instants, serial))
+        for workers in WORKERS:
+            # The pool is started beforehand, as it would be reused across queries
+            with ProcessPoolExecutor(workers) as executor:
+                executor.submit(int).result()
+                pooled = best_of(
+                    partial(decode_values, min_bytes=0),
+                    column_type,
+                    values,
+                    executor,
+                    repeat=3,
+                )
+                bypass = best_of(decode_values, column_type, values, executor, repeat=3)
+            print(
+                "    workers={:<3} pool={:.4f}s ({:.1f}x) with bypass={:.4f}s".format(
+                    workers, pooled, serial / pooled, bypass
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares parsing Period and STBox values with and without the parse cache, for
+results where a few distinct values repeat across many rows.
+
+Run using: python -m benchmarks.bench_parse_cache
+"""
+import numpy as np
+
+from mobilitydb_sqlalchemy import Period, STBox
+
+from .common import best_of
+
+
+def make_periods(distinct):
+    return [
+        "[2020-01-{:02d} {:02d}:00:00+00, 2020-01-{:02d} {:02d}:30:00+00)".format(
+            1 + i // 24 % 28, i % 24, 1 + i // 24 % 28, i % 24
+        )
+        for i in range(distinct)
+    ]
+
+
+def make_boxes(distinct):
+    return [
+        "STBOX T(({0}, {1}, 2020-01-01 00:00:00+00), ({2}, {3}, 2020-01-02 00:00:00+00))".format(
+            i, i + 1, i + 10, i + 11
+        )
+        for i in range(distinct)
+    ]
+
+
+def make_rows(values, n, seed=0):
+    """
+    ``n`` values drawn from ``values`` with a skewed (Zipf like) distribution,
+    as in schedule tables where some periods are much more common than others.
+    """
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, len(values) + 1)
+    return [values[i] for i in rng.choice(len(values), n, p=weights / weights.sum())]
+
+
+def run(column_type, rows):
+    column_type.cache_clear()
+    process = column_type.result_processor(None, None)
+    for value in rows:
+        process(value)
+
+
+def main(n=200000, distinct=(100, 5000, 100000), cache_size=8192):
+    for column_type, make_values in ((Period, make_periods), (STBox, make_boxes)):
+        for count in distinct:
+            rows = make_rows(make_values(count), n)
+            uncached = best_of(run, column_type(), rows, repeat=3)
+            cached_type = column_type(cache_size=cache_size)
+            cached = best_of(run, cached_type, rows, repeat=3)
+            info = cached_type.cache_info()
+            print(
+                "{:<7} distinct={:<7} uncached={:.4f}s cached={:.4f}s speedup={:.1f}x "
+                "hit ratio={:.2f}".format(
+                    column_type.__name__,
+                    count,
+                    uncached,
+                    cached,
+                    uncached / cached,
+                    info.hits / (info.hits + info.misses),
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
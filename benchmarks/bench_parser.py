@@ -0,0 +1,26 @@
+"""
+Compares parsing temporal points received as text using the native parser
+against the pymeos deserializer.
+
+Run using: python -m benchmarks.bench_parser
+"""
+from mobilitydb_sqlalchemy import TGeomPoint
+
+from .common import best_of, make_trip, trip_as_text
+
+
+def main(sizes=(100, 10000, 100000)):
+    column_type = TGeomPoint()
+    for n in sizes:
+        text = trip_as_text(*make_trip(n))
+        native = best_of(column_type.read_temporal, text, repeat=3)
+        pymeos = best_of(column_type.read_temporal_pymeos, text, repeat=3)
+        print(
+            "n={:<8} native={:.4f}s pymeos={:.4f}s speedup={:.1f}x".format(
+                n, native, pymeos, pymeos / native
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares fetching a fleet of trips as a movingpandas TrajectoryCollection row by
+row (one Trajectory per row, then grouped) against decoding all the rows at once
+with read_trajectory_collection.
+
+Run using: python -m benchmarks.bench_trajectory_collection
+"""
+import sys
+
+from sqlalchemy import Column, Integer, MetaData, Table, select
+
+from mobilitydb_sqlalchemy import TGeomPoint
+from mobilitydb_sqlalchemy.query import read_trajectory_collection
+from mobilitydb_sqlalchemy.types.TBaseGeomPoint import MOVING_PANDAS
+
+from .common import FakeConnection, best_of, make_trip, trip_as_binary
+
+
+def per_row(column_type, rows):
+    import movingpandas as mpd
+
+    process = column_type.result_processor(None, None)
+    trajectories = []
+    for car_id, trip in rows:
+        trajectory = process(trip)
+        trajectory.id = car_id
+        trajectories.append(trajectory)
+    return mpd.TrajectoryCollection(trajectories)
+
+
+def main(fleets=((5000, 20), (1000, 500))):
+    if not MOVING_PANDAS:
+        sys.exit("movingpandas is not installed")
+    column_type = TGeomPoint(wire_format="binary", use_movingpandas=True)
+    trips = Table(
+        "trips", MetaData(), Column("car_id", Integer), Column("trip", column_type)
+    )
+    statement = select([trips.c.car_id, trips.c.trip])
+    for count, instants in fleets:
+        rows = [(i, trip_as_binary(*make_trip(instants, seed=i))) for i in range(count)]
+        row_by_row = best_of(per_row, column_type, rows, repeat=3)
+        collection = best_of(
+            read_trajectory_collection, FakeConnection(rows), statement, repeat=3
+        )
+        print(
+            "trips={:<6} instants={:<6} per row={:.4f}s collection={:.4f}s "
+            "speedup={:.1f}x".format(
+                count, instants, row_by_row, collection, row_by_row / collection
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Compares decoding temporal points fetched using asText against asBinary.
+
+Run using: python -m benchmarks.bench_wire_format
+"""
+from mobilitydb_sqlalchemy import TGeomPoint
+
+from .common import best_of, make_trip, trip_as_binary, trip_as_text
+
+
+def main(sizes=(100, 10000, 100000)):
+    text_process = TGeomPoint().result_processor(None, None)
+    binary_process = TGeomPoint(wire_format="binary").result_processor(None, None)
+    for n in sizes:
+        times, coords = make_trip(n)
+        text, binary = trip_as_text(times, coords), trip_as_binary(times, coords)
+        text_time = best_of(text_process, text, repeat=3)
+        binary_time = best_of(binary_process, binary, repeat=3)
+        print(
+            "n={:<8} text={:.4f}s ({} bytes) binary={:.4f}s ({} bytes) speedup={:.1f}x".format(
+                n,
+                text_time,
+                len(text),
+                binary_time,
+                len(binary),
+                text_time / binary_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import datetime
+import time
+
+import numpy as np
+import pandas as pd
+from shapely.geometry import Point
+
+from mobilitydb_sqlalchemy import wkb
+
+
+def make_frame(column, n, seed=0):
+    """
+    Builds a time indexed DataFrame of ``n`` instants, one second apart, the way
+    users pass data to the temporal column types.
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(datetime.datetime(2020, 1, 1), periods=n, freq="s")
+    if column == "geometry":
+        xy = np.cumsum(rng.normal(scale=5, size=(n, 2)), axis=0).round(6)
+        values = [Point(x, y) for x, y in xy]
+    elif column == "int":
+        column, values = "value", rng.integers(0, 100, n)
+    elif column == "bool":
+        column, values = "value", rng.random(n) > 0.5
+    else:
+        values = rng.normal(size=n).round(4)
+    return pd.DataFrame({column: values}, index=index.rename("t"))
+
+
+def make_trip(n, seed=0):
+    """
+    Returns the timestamps (microseconds since the unix epoch) and coordinates of
+    a random walk of ``n`` instants, one second apart.
+    """
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp(2020, 1, 1).value // 1000
+    times = start + np.arange(n, dtype=np.int64) * 1000000
+    coords = np.cumsum(rng.normal(scale=5, size=(n, 2)), axis=0).round(6)
+    return times, coords
+
+
+def trip_as_text(times, coords):
+    """
+    The trip the way ``asText`` returns it from the server.
+    """
+    stamps = pd.to_datetime(times, unit="us").strftime("%Y-%m-%d %H:%M:%S+00")
+    return "[{}]".format(
+        ", ".join(
+            "POINT({} {})@{}".format(x, y, t)
+            for (x, y), t in zip(coords.tolist(), stamps)
+        )
+    )
+
+
+def trip_as_binary(times, coords):
+    """
+    The trip the way ``asBinary`` returns it from the server.
+    """
+    return wkb.write_sequence(wkb.T_GEOMPOINT, times, coords)
+
+
+def best_of(fn, *args, repeat=5):
+    """
+    Returns the best wall clock time (in seconds) of calling ``fn(*args)``.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_bind(column_type, df):
+    """
+    Serializes a DataFrame the way the column types did before the bind path was
+    vectorized, building one pymeos instant per row.
+    """
+    from pymeos import GeomPoint
+
+    df = df.sort_index()
+    instants = set()
+    for t in df.index:
+        value = getattr(df.loc[t], column_type.pandas_value_column)
+        if column_type.pandas_value_column == "geometry":
+            value = GeomPoint(value.wkt)
+        instants.add(column_type.pymeos_instant_type(value, t))
+    sequence = column_type.pymeos_sequence_type(
+        instants, column_type.left_closed, column_type.right_closed
+    )
+    return str(sequence)
+
+
+class FakeConnection:
+    """
+    Returns the given rows for any statement, so only decoding is measured.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, statement):
+        return self
+
+    def fetchall(self):
+        return self.rows
@@ -0,0 +1,225 @@
+"""
+Benchmarks of serializing (bind) and deserializing (result) values of all the
+column types, across sizes, reporting throughput and peak memory. It runs
+offline, without a database.
+
+For the temporal types the size is the number of instants in a value, for
+PeriodSet and TimestampSet the number of elements in a value, and for the other
+types the number of values processed.
+
+Run using: python -m benchmarks.suite [--sizes 10,1000] [--filter TFloat] [--json out.json]
+
+Saving the results as JSON, and comparing them between releases, shows
+regressions in any of the hot paths.
+"""
+import argparse
+import json
+import platform
+import tracemalloc
+from collections import namedtuple
+
+from mobilitydb_sqlalchemy import (
+    Period,
+    PeriodSet,
+    RangeFloat,
+    RangeInt,
+    STBox,
+    TBool,
+    TBox,
+    TFloat,
+    TGeogPoint,
+    TGeomPoint,
+    TInt,
+    TimestampSet,
+)
+from mobilitydb_sqlalchemy.types.TBaseGeomPoint import MOVING_PANDAS
+
+from .common import best_of, make_frame
+
+SIZES = (10, 1000, 100000, 1000000)
+
+Case = namedtuple("Case", ["name", "setup"])
+
+
+def temporal_cases(name, column_type, column):
+    def bind(n):
+        return column_type.bind_processor(None), make_frame(column, n)
+
+    def result(n):
+        text = column_type.bind_processor(None)(make_frame(column, n))
+        return column_type.result_processor(None, None), text
+
+    yield Case(name + " bind", bind)
+    yield Case(name + " result", result)
+
+
+def binary_cases(name, column_type):
+    def result(n):
+        binary = column_type.write_binary(make_frame("geometry", n))
+        return column_type.result_processor(None, None), binary
+
+    yield Case(name + " result", result)
+
+
+def movingpandas_cases(name, column_type):
+    # The columns using movingpandas bind Trajectories, not DataFrames
+    plain_type = type(column_type)()
+
+    def bind(n):
+        text = plain_type.bind_processor(None)(make_frame("geometry", n))
+        trajectory = column_type.result_processor(None, None)(text)
+        return column_type.bind_processor(None), trajectory
+
+    def result(n):
+        text = plain_type.bind_processor(None)(make_frame("geometry", n))
+        return column_type.result_processor(None, None), text
+
+    yield Case(name + " bind", bind)
+    yield Case(name + " result", result)
+
+
+def timestamp(i):
+    return "2020-01-01 00:{:02d}:{:02d}.{:06d}+00".format(
+        i // 60000000 % 60, i // 1000000 % 60, i % 1000000
+    )
+
+
+def period(i):
+    return "[{}, {})".format(timestamp(2 * i), timestamp(2 * i + 1))
+
+
+BASE_VALUES = {
+    "Period": (Period, period),
+    "TBox": (
+        TBox,
+        lambda i: "TBOX(({}, {}), ({}, {}))".format(
+            i, timestamp(i), i + 1, timestamp(i + 1)
+        ),
+    ),
+    "STBox": (
+        STBox,
+        lambda i: "STBOX T(({}, {}, {}), ({}, {}, {}))".format(
+            i, i, timestamp(i), i + 1, i + 1, timestamp(i + 1)
+        ),
+    ),
+    "RangeInt": (RangeInt, lambda i: "[{}, {})".format(i, i + 10)),
+    "RangeFloat": (RangeFloat, lambda i: "[{}, {})".format(i + 0.5, i + 10.5)),
+}
+
+
+def run_all(process, values):
+    for value in values:
+        process(value)
+
+
+def base_cases(name, column_type, make_value):
+    def bind(n):
+        values = list(map(column_type.base_class, map(make_value, range(n))))
+        return run_all, column_type.bind_processor(None), values
+
+    def result(n):
+        return (
+            run_all,
+            column_type.result_processor(None, None),
+            [make_value(i) for i in range(n)],
+        )
+
+    yield Case(name + " bind", bind)
+    yield Case(name + " result", result)
+
+
+def set_cases(name, column_type, make_element):
+    def result(n):
+        text = "{" + ", ".join(make_element(i) for i in range(n)) + "}"
+        return column_type.result_processor(None, None), text
+
+    def bind(n):
+        process, text = result(n)
+        return column_type.bind_processor(None), process(text)
+
+    yield Case(name + " bind", bind)
+    yield Case(name + " result", result)
+
+
+def all_cases():
+    yield from temporal_cases("TInt", TInt(), "int")
+    yield from temporal_cases("TFloat", TFloat(), "value")
+    yield from temporal_cases("TBool", TBool(), "bool")
+    yield from temporal_cases("TGeomPoint", TGeomPoint(), "geometry")
+    yield from temporal_cases("TGeogPoint", TGeogPoint(), "geometry")
+    yield from binary_cases("TGeomPoint[binary]", TGeomPoint(wire_format="binary"))
+    if MOVING_PANDAS:
+        yield from movingpandas_cases(
+            "TGeomPoint[movingpandas]", TGeomPoint(use_movingpandas=True)
+        )
+    for name, (column_type, make_value) in BASE_VALUES.items():
+        yield from base_cases(name, column_type(), make_value)
+    yield from set_cases("PeriodSet", PeriodSet(), period)
+    yield from set_cases("TimestampSet", TimestampSet(), timestamp)
+
+
+def measure(fn, args, repeat):
+    """
+    Returns the best time of calling ``fn(*args)`` and its peak memory usage in
+    bytes. The memory is measured in a separate call, as tracing slows it down.
+    """
+    seconds = best_of(fn, *args, repeat=repeat)
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def run(sizes=SIZES, pattern=None, repeat=3):
+    results = []
+    for case in all_cases():
+        if pattern and pattern.lower() not in case.name.lower():
+            continue
+        for n in sizes:
+            fn, *args = case.setup(n)
+            seconds, peak = measure(fn, args, repeat)
+            result = {
+                "case": case.name,
+                "size": n,
+                "seconds": seconds,
+                "instants_per_second": n / seconds,
+                "peak_memory": peak,
+            }
+            print(
+                "{case:<32} n={size:<8} {seconds:>9.4f}s "
+                "{instants_per_second:>12.0f} instants/s "
+                "peak={peak:>8.1f} MiB".format(peak=peak / 2**20, **result)
+            )
+            results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, SIZES)),
+        help="Comma separated sizes to run (default: %(default)s)",
+    )
+    parser.add_argument("--filter", help="Only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Save the results to this file")
+    args = parser.parse_args(argv)
+
+    if not MOVING_PANDAS:
+        print("movingpandas is not installed, skipping its cases")
+    results = run(
+        [int(size) for size in args.sizes.split(",")], args.filter, args.repeat
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {"python": platform.python_version(), "results": results}, f, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,39 @@
-# Box Types
-from .types.TBox import TBox
-from .types.STBox import STBox
+"""
+The column types are imported on first access, so that importing the package
+does not import pandas, pymeos or any of the optional dependencies.
+"""
+_TYPES = {
+    # Box Types
+    "TBox": "types.TBox",
+    "STBox": "types.STBox",
+    # Range Types
+    "RangeFloat": "types.RangeFloat",
+    "RangeInt": "types.RangeInt",
+    # Time Types
+    "Period": "types.Period",
+    "PeriodSet": "types.PeriodSet",
+    "TimestampSet": "types.TimestampSet",
+    # Temporal Types
+    "TBool": "types.TBool",
+    "TGeomPoint": "types.TGeomPoint",
+    "TGeogPoint": "types.TGeogPoint",
+    "TFloat": "types.TFloat",
+    "TInt": "types.TInt",
+}
 
-# Range Types
-from .types.RangeFloat import RangeFloat
-from .types.RangeInt import RangeInt
+__all__ = list(_TYPES)
 
-# Time Types
-from .types.Period import Period
-from .types.PeriodSet import PeriodSet
-from .types.TimestampSet import TimestampSet
 
-# Temporal Types
-from .types.TBool import TBool
-from .types.TGeomPoint import TGeomPoint
-from .types.TGeogPoint import TGeogPoint
-from .types.TFloat import TFloat
-from .types.TInt import TInt
+def __getattr__(name):
+    if name not in _TYPES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    # __import__ rather than importlib, so that the imports are reported by
+    # python -X importtime
+    module = __import__(_TYPES[name], globals(), fromlist=[name], level=1)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TYPES))
@@ -0,0 +1,197 @@
+"""
+Bulk loading of rows using PostgreSQL's ``COPY ... FROM STDIN``, which is much
+faster than inserting rows one statement at a time.
+
+Values are serialized using the column types' own bind processors (text format),
+or their binary representation (binary format). Rows are encoded and sent in
+chunks, so that memory usage does not depend on the number of rows loaded.
+"""
+import datetime
+import itertools
+import struct
+from collections.abc import Mapping
+
+from sqlalchemy import types as sqltypes
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+
+from mobilitydb_sqlalchemy.types.TBaseType import TBaseType
+
+BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+BINARY_TRAILER = struct.pack("!h", -1)
+
+POSTGRES_EPOCH = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+class ChunkedReader:
+    """
+    A minimal read-only file-like object over an iterator of bytes chunks, as
+    expected by psycopg2's ``cursor.copy_expert``.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._chunk = b""
+        self._position = 0
+
+    def read(self, size=-1):
+        parts = []
+        while size != 0:
+            if self._position >= len(self._chunk):
+                self._chunk = next(self._chunks, b"")
+                self._position = 0
+                if not self._chunk:
+                    break
+            end = len(self._chunk)
+            if size > 0:
+                end = min(end, self._position + size)
+                size -= end - self._position
+            parts.append(self._chunk[self._position : end])
+            self._position = end
+        return b"".join(parts)
+
+
+def _text_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value).translate(_TEXT_ESCAPES)
+
+
+def _datetime_to_binary(value):
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return struct.pack("!q", (value - POSTGRES_EPOCH) // datetime.timedelta(0, 0, 1))
+
+
+def _text_encoder(column_type, dialect):
+    processor = column_type.bind_processor(dialect)
+    if processor is None:
+        return _text_value
+    return lambda value: _text_value(None if value is None else processor(value))
+
+
+def _binary_encoder(column_type):
+    if isinstance(column_type, TBaseType):
+        return column_type.write_binary
+    if isinstance(column_type, sqltypes.Boolean):
+        return lambda value: b"\x01" if value else b"\x00"
+    if isinstance(column_type, sqltypes.BigInteger):
+        return struct.Struct("!q").pack
+    if isinstance(column_type, sqltypes.SmallInteger):
+        return struct.Struct("!h").pack
+    if isinstance(column_type, sqltypes.Integer):
+        return struct.Struct("!i").pack
+    if isinstance(column_type, sqltypes.REAL):
+        return struct.Struct("!f").pack
+    if isinstance(column_type, sqltypes.Float):
+        return struct.Struct("!d").pack
+    if isinstance(column_type, sqltypes.String):
+        return lambda value: value.encode("utf-8")
+    if isinstance(column_type, sqltypes.DateTime):
+        return _datetime_to_binary
+    raise TypeError(
+        "Binary COPY is not supported for columns of type {}, use format='text'".format(
+            column_type
+        )
+    )
+
+
+def _text_chunks(rows, encoders, chunk_size):
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield "".join(
+            "\t".join(encode(value) for encode, value in zip(encoders, row)) + "\n"
+            for row in chunk
+        ).encode("utf-8")
+
+
+def _binary_chunks(rows, encoders, chunk_size):
+    field_count = struct.pack("!h", len(encoders))
+    yield BINARY_HEADER
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        parts = []
+        for row in chunk:
+            parts.append(field_count)
+            for encode, value in zip(encoders, row):
+                if value is None:
+                    parts.append(b"\xff\xff\xff\xff")
+                else:
+                    data = encode(value)
+                    parts.append(struct.pack("!i", len(data)))
+                    parts.append(data)
+        yield b"".join(parts)
+    yield BINARY_TRAILER
+
+
+def copy_rows(connection, table, rows, columns=None, format="text", chunk_size=1000):
+    """
+    Loads rows into a table using ``COPY ... FROM STDIN``.
+
+    ``connection`` is a SQLAlchemy Connection or a psycopg2 connection, ``table``
+    a Table (for example ``Trips.__table__``) and ``rows`` an iterable of
+    mappings keyed by column name, or of tuples with values in the same order as
+    ``columns``. ``columns`` defaults to all the columns of the table.
+
+    ``format`` is either "text" or "binary". Values are encoded ``chunk_size`` rows
+    at a time, so ``rows`` can be a generator of any length.
+
+    Returns the number of rows copied.
+    """
+    if format not in ("text", "binary"):
+        raise ValueError("format must be 'text' or 'binary'. Got: {}".format(format))
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1. Got: {}".format(chunk_size))
+
+    if isinstance(connection, Connection):
+        dialect, dbapi_connection = connection.dialect, connection.connection
+    else:
+        dialect, dbapi_connection = postgresql.dialect(), connection
+
+    columns = [
+        table.c[column] if isinstance(column, str) else column
+        for column in (columns if columns is not None else table.columns)
+    ]
+    names = [column.name for column in columns]
+
+    count = 0
+
+    def counted(rows):
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield [row.get(name) for name in names] if isinstance(row, Mapping) else row
+
+    preparer = dialect.identifier_preparer
+    sql = "COPY {} ({}) FROM STDIN".format(
+        preparer.format_table(table),
+        ", ".join(preparer.quote(name) for name in names),
+    )
+    if format == "binary":
+        sql += " WITH (FORMAT binary)"
+        chunks = _binary_chunks(
+            counted(rows), [_binary_encoder(c.type) for c in columns], chunk_size
+        )
+    else:
+        chunks = _text_chunks(
+            counted(rows),
+            [_text_encoder(c.type, dialect) for c in columns],
+            chunk_size,
+        )
+
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(sql, ChunkedReader(chunks))
+    finally:
+        cursor.close()
+    return count
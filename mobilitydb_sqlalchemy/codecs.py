@@ -0,0 +1,149 @@
+"""
+Codecs for asyncpg, so that MobilityDB values are encoded and decoded by the
+driver itself. They are needed to use the types with raw asyncpg connections,
+and with SQLAlchemy's asyncio extension (SQLAlchemy 1.4.30 or later) on top of
+asyncpg.
+
+Values are exchanged in text format, using the bind and result processors of the
+column types. Values which were already decoded by a codec are passed through
+unchanged by the result processors.
+
+Temporal points are exchanged in binary format instead, as the text output of
+MobilityDB's ``tgeompoint`` and ``tgeogpoint`` types is hex encoded binary, not
+the text read by the column types. Their codecs are registered for the column
+types created with ``wire_format="binary"``.
+"""
+from sqlalchemy import event
+
+from mobilitydb_sqlalchemy import parser, wkb
+from mobilitydb_sqlalchemy.types.Period import Period
+from mobilitydb_sqlalchemy.types.PeriodSet import PeriodSet
+from mobilitydb_sqlalchemy.types.RangeFloat import RangeFloat
+from mobilitydb_sqlalchemy.types.RangeInt import RangeInt
+from mobilitydb_sqlalchemy.types.STBox import STBox
+from mobilitydb_sqlalchemy.types.TBool import TBool
+from mobilitydb_sqlalchemy.types.TBox import TBox
+from mobilitydb_sqlalchemy.types.TFloat import TFloat
+from mobilitydb_sqlalchemy.types.TGeogPoint import TGeogPoint
+from mobilitydb_sqlalchemy.types.TGeomPoint import TGeomPoint
+from mobilitydb_sqlalchemy.types.TimestampSet import TimestampSet
+from mobilitydb_sqlalchemy.types.TInt import TInt
+
+
+def default_types():
+    """
+    The column types codecs are registered for by default.
+    """
+    return [
+        TBool(),
+        TInt(),
+        TFloat(),
+        TGeomPoint(wire_format="binary"),
+        TGeogPoint(wire_format="binary"),
+        Period(),
+        PeriodSet(),
+        TimestampSet(),
+        TBox(),
+        STBox(),
+        RangeInt(),
+        RangeFloat(),
+    ]
+
+
+def text_codec(column_type):
+    """
+    Returns the encoder and decoder functions of a column type, for a text format
+    asyncpg codec.
+    """
+    # Only temporal points have a wire format, and they use binary codecs
+    if hasattr(column_type, "wire_format"):
+        raise ValueError("Temporal points need binary codecs, see binary_codec")
+
+    bind = column_type.bind_processor(None)
+    decoder = column_type.result_processor(None, None)
+
+    def encoder(value):
+        # Values bound through SQLAlchemy are already serialized by the type
+        if isinstance(value, str):
+            return value
+        return bind(value)
+
+    return encoder, decoder
+
+
+def encode_literal(column_type, text):
+    """
+    Encodes the text of a temporal point into MobilityDB's binary format, keeping
+    its subtype, interpolation and bounds.
+    """
+    times, values, segments = parser.parse_temporal(text, column_type.text_value_kind)
+    subtype, stepwise, lower_inc, upper_inc = parser.parse_layout(text)
+    temptype, linear = column_type.wkb_temptype, column_type.linear and not stepwise
+    if subtype == "instant":
+        return wkb.write_instant(temptype, times, values)
+    if subtype == "instantset":
+        return wkb.write_instant_set(temptype, times, values)
+    if subtype == "sequenceset":
+        return wkb.write_sequence_set(
+            temptype, times, values, segments, lower_inc, upper_inc, linear
+        )
+    return wkb.write_sequence(
+        temptype, times, values, lower_inc[0], upper_inc[0], linear
+    )
+
+
+def binary_codec(column_type):
+    """
+    Returns the encoder and decoder functions of a temporal point column type
+    created with ``wire_format="binary"``, for a binary format asyncpg codec.
+    """
+    if getattr(column_type, "wire_format", "text") != "binary":
+        raise ValueError("Binary codecs need a column type with wire_format='binary'")
+
+    decoder = column_type.result_processor(None, None)
+
+    def encoder(value):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return value
+        # Values bound through SQLAlchemy are already serialized by the type of
+        # their column, as text
+        if isinstance(value, str):
+            return encode_literal(column_type, value)
+        return column_type.write_binary(value)
+
+    return encoder, decoder
+
+
+async def register_codecs(connection, column_types=None, schema="public"):
+    """
+    Registers codecs for the given column types (all the MobilityDB types by
+    default) on an asyncpg connection.
+    """
+    for column_type in column_types if column_types is not None else default_types():
+        wire_format = getattr(column_type, "wire_format", "text")
+        if wire_format == "binary":
+            encoder, decoder = binary_codec(column_type)
+        else:
+            encoder, decoder = text_codec(column_type)
+        await connection.set_type_codec(
+            column_type.get_col_spec().lower(),
+            schema=schema,
+            encoder=encoder,
+            decoder=decoder,
+            format=wire_format,
+        )
+
+
+def register_engine_codecs(engine, column_types=None, schema="public"):
+    """
+    Registers the codecs on every connection an asyncio engine (created using
+    ``create_async_engine`` with asyncpg) opens.
+    """
+
+    @event.listens_for(getattr(engine, "sync_engine", engine), "connect")
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.run_async(
+            lambda connection: register_codecs(connection, column_types, schema)
+        )
+
+    return on_connect
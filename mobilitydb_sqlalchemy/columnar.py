@@ -0,0 +1,301 @@
+import numpy as np
+
+from mobilitydb_sqlalchemy.geometry import points_frame, points_from_coords
+from mobilitydb_sqlalchemy.utils import to_datetime_index
+
+
+class TemporalArray:
+    """
+    A lightweight, array backed alternative to the DataFrames returned for temporal
+    columns. Returned by columns created with ``return_type="numpy"``.
+
+    ``t`` holds the timestamps as an int64 array of microseconds since the unix
+    epoch (in UTC), and ``values`` the values as an (N,) array, or an (N, 2)/(N, 3)
+    array of coordinates for temporal points.
+
+    Points are returned in DataFrames in the given ``geometry`` format (see
+    :func:`mobilitydb_sqlalchemy.geometry.points_frame`), and as shapely objects by
+    ``to_points``.
+
+    GeoDataFrames are created in the given ``crs``.
+
+    The index of the DataFrame is a ``datetime64[ns]`` DatetimeIndex in the
+    timezone ``tz`` (UTC by default, or naive UTC if None).
+
+    For sequence sets, ``segments`` holds the offsets of the sequences in the
+    arrays: the i-th sequence is made of the instants between ``segments[i]`` and
+    ``segments[i + 1]``. It is None for other values.
+
+    The equivalent DataFrame is only built when asked for, using ``to_dataframe``.
+    """
+
+    __slots__ = (
+        "t",
+        "values",
+        "value_column",
+        "segments",
+        "geometry",
+        "tz",
+        "crs",
+        "_df",
+    )
+
+    def __init__(
+        self,
+        t,
+        values,
+        value_column="value",
+        segments=None,
+        geometry="shapely",
+        tz="UTC",
+        crs=None,
+    ):
+        self.t = np.asarray(t, dtype=np.int64)
+        self.values = np.asarray(values)
+        self.value_column = value_column
+        self.segments = None if segments is None else np.asarray(segments, np.int64)
+        self.geometry = geometry
+        self.tz = tz
+        self.crs = crs
+        self._df = None
+
+    def __len__(self):
+        return len(self.t)
+
+    def __repr__(self):
+        if self.segments is not None:
+            return "<TemporalArray of {} instants in {} sequences>".format(
+                len(self), len(self.segments) - 1
+            )
+        return "<TemporalArray of {} instants>".format(len(self))
+
+    @property
+    def segment_ids(self):
+        """
+        The number of the sequence each instant belongs to, or None if the value
+        is not a sequence set.
+        """
+        if self.segments is None:
+            return None
+        return np.repeat(
+            np.arange(len(self.segments) - 1, dtype=np.int64), np.diff(self.segments)
+        )
+
+    @property
+    def timestamps(self):
+        """
+        The timestamps as a ``datetime64[us]`` array (in UTC), without copying.
+        """
+        return self.t.view("datetime64[us]")
+
+    def to_points(self):
+        """
+        Returns the coordinates of a temporal point as an array of shapely Points.
+        """
+        return points_from_coords(self.values)
+
+    def to_dataframe(self):
+        """
+        Returns the value as a time indexed DataFrame, the same as the one returned
+        by default for temporal columns. The DataFrame is built only once.
+
+        The DataFrame of a sequence set has a ``segment`` column, with the number
+        of the sequence each instant belongs to.
+        """
+        if self._df is None:
+            import pandas as pd
+
+            index = to_datetime_index(self.t, self.tz).rename("t")
+            columns = {}
+            if self.segments is not None:
+                columns["segment"] = self.segment_ids
+            if self.values.ndim == 2:
+                self._df = points_frame(
+                    self.values,
+                    index,
+                    self.value_column,
+                    self.geometry,
+                    self.crs,
+                    **columns,
+                )
+            else:
+                self._df = pd.DataFrame(
+                    dict({self.value_column: self.values}, **columns), index=index
+                )
+        return self._df
+
+
+class TemporalBatch:
+    """
+    The values of a temporal column for several rows, decoded together.
+
+    The instants of all the rows are stored in the concatenated arrays ``t`` and
+    ``values``. The instants of the i-th row are the ones between ``offsets[i]``
+    and ``offsets[i + 1]``. ``null`` marks the rows which were NULL.
+
+    If any of the rows is a sequence set, ``segment`` holds the number of the
+    sequence each instant belongs to within its row (as in the ``segment`` column
+    of DataFrames), so that the gaps between sequences are kept. It is None
+    otherwise.
+
+    ``geometry``, ``tz`` and ``crs`` are the ones of the column, as in
+    TemporalArray.
+
+    Indexing a batch returns the TemporalArray of that row, as a view on the
+    concatenated arrays, or None if the row was NULL.
+    """
+
+    __slots__ = (
+        "t",
+        "values",
+        "offsets",
+        "null",
+        "value_column",
+        "segment",
+        "geometry",
+        "tz",
+        "crs",
+    )
+
+    def __init__(
+        self,
+        t,
+        values,
+        offsets,
+        null=None,
+        value_column="value",
+        segment=None,
+        geometry="shapely",
+        tz="UTC",
+        crs=None,
+    ):
+        self.t = np.asarray(t, dtype=np.int64)
+        self.values = np.asarray(values)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.null = (
+            np.zeros(len(self.offsets) - 1, dtype=bool)
+            if null is None
+            else np.asarray(null, dtype=bool)
+        )
+        self.value_column = value_column
+        self.segment = None if segment is None else np.asarray(segment, np.int64)
+        self.geometry = geometry
+        self.tz = tz
+        self.crs = crs
+
+    @classmethod
+    def concatenate(
+        cls,
+        sequences,
+        value_column="value",
+        value_shape=(),
+        geometry="shapely",
+        tz="UTC",
+        crs=None,
+    ):
+        """
+        Builds a batch from a list of ``(times, values)`` or ``(times, values,
+        segments)`` arrays, one per row, or None for NULL rows. ``segments`` are
+        the offsets of the sequences of a sequence set, as in ``TemporalArray``.
+        ``value_shape`` is the shape of each value, used when there are no
+        instants at all. The other arguments are the ones of TemporalBatch.
+        """
+        null = np.array([sequence is None for sequence in sequences], dtype=bool)
+        sequences = [sequence for sequence in sequences if sequence is not None]
+
+        lengths = np.zeros(len(null), dtype=np.int64)
+        lengths[~null] = [len(sequence[0]) for sequence in sequences]
+        offsets = np.zeros(len(null) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        segments = [
+            [0, len(sequence[0])]
+            if len(sequence) < 3 or sequence[2] is None
+            else sequence[2]
+            for sequence in sequences
+        ]
+        segment = None
+        if any(len(row_segments) > 2 for row_segments in segments):
+            segment = np.concatenate(
+                [
+                    np.repeat(
+                        np.arange(len(row_segments) - 1, dtype=np.int64),
+                        np.diff(row_segments),
+                    )
+                    for row_segments in segments
+                ]
+            )
+
+        if sequences:
+            t = np.concatenate([sequence[0] for sequence in sequences])
+            values = np.concatenate([sequence[1] for sequence in sequences])
+        else:
+            t, values = np.empty(0, dtype=np.int64), np.empty((0,) + value_shape)
+        return cls(t, values, offsets, null, value_column, segment, geometry, tz, crs)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if self.null[i]:
+            return None
+        start, end = self.offsets[i], self.offsets[i + 1]
+        segments = None
+        if self.segment is not None:
+            ids = self.segment[start:end]
+            if len(ids) and ids[-1] > 0:
+                segments = np.concatenate(
+                    [[0], np.flatnonzero(np.diff(ids)) + 1, [len(ids)]]
+                )
+        return TemporalArray(
+            self.t[start:end],
+            self.values[start:end],
+            self.value_column,
+            segments,
+            self.geometry,
+            self.tz,
+            self.crs,
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def to_dataframe(self, keys=None, names=None):
+        """
+        Returns the instants of all the rows as a single "long" DataFrame, indexed
+        by the row they belong to and their timestamp, ``t``.
+
+        ``keys`` is a list of arrays with one key per row, used as the levels of
+        the index (named by ``names``). Rows are numbered by default. The index
+        and the value column are built from the concatenated arrays directly.
+        Points and timestamps are returned as in the DataFrames of the rows. If
+        any row is a sequence set, the DataFrame has a ``segment`` column.
+        """
+        import pandas as pd
+
+        if keys is None:
+            keys, names = [np.arange(len(self))], ["row"]
+        lengths = np.diff(self.offsets)
+        index = pd.MultiIndex.from_arrays(
+            [np.repeat(np.asarray(key), lengths) for key in keys]
+            + [to_datetime_index(self.t, self.tz)],
+            names=list(names) + ["t"],
+        )
+        columns = {}
+        if self.segment is not None:
+            columns["segment"] = self.segment
+        if self.values.ndim == 2:
+            return points_frame(
+                self.values,
+                index,
+                self.value_column,
+                self.geometry,
+                self.crs,
+                **columns,
+            )
+        return pd.DataFrame(
+            dict({self.value_column: self.values}, **columns), index=index
+        )
+
+    def __repr__(self):
+        return "<TemporalBatch of {} rows, {} instants>".format(len(self), len(self.t))
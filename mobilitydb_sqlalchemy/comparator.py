@@ -1,3 +1,7 @@
+import functools
+import importlib
+
+from sqlalchemy import cast, func
 from sqlalchemy import types as sqltypes
 from sqlalchemy.types import UserDefinedType
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
@@ -58,6 +62,18 @@ BBOXES_EQUAL = operators.custom_op("~=")
 SMALLEST_DISTANCE_EVER_BETWEEN = operators.custom_op("|=|")
 DISTANCE = operators.custom_op("<->")
 
+TIMESTAMPTZ = sqltypes.DateTime(timezone=True)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_type(name):
+    """
+    Returns a shared instance of the column type ``name``, used as the type of
+    expressions. The types are imported on first use, as they import this module.
+    """
+    module = importlib.import_module("mobilitydb_sqlalchemy.types." + name)
+    return getattr(module, name)()
+
 
 class Comparator(UserDefinedType.Comparator):
     """
@@ -157,49 +173,43 @@ class Comparator(UserDefinedType.Comparator):
         """
         The "#=" operator.
         """
-        from mobilitydb_sqlalchemy.types.TBool import TBool
-
-        return self.operate(TEMPORAL_EQUAL, other, result_type=TBool)
+        return self.operate(TEMPORAL_EQUAL, other, result_type=shared_type("TBool"))
 
     def temporal_not_equal(self, other):
         """
         The "#<>" operator.
         """
-        from mobilitydb_sqlalchemy.types.TBool import TBool
-
-        return self.operate(TEMPORAL_NOT_EQUAL, other, result_type=TBool)
+        return self.operate(TEMPORAL_NOT_EQUAL, other, result_type=shared_type("TBool"))
 
     def temporal_less_than(self, other):
         """
         The "#<" operator.
         """
-        from mobilitydb_sqlalchemy.types.TBool import TBool
-
-        return self.operate(TEMPORAL_LESS_THAN, other, result_type=TBool)
+        return self.operate(TEMPORAL_LESS_THAN, other, result_type=shared_type("TBool"))
 
     def temporal_greater_than(self, other):
         """
         The "#>" operator.
         """
-        from mobilitydb_sqlalchemy.types.TBool import TBool
-
-        return self.operate(TEMPORAL_GREATER_THAN, other, result_type=TBool)
+        return self.operate(
+            TEMPORAL_GREATER_THAN, other, result_type=shared_type("TBool")
+        )
 
     def temporal_less_than_or_equal_to(self, other):
         """
         The "#<=" operator.
         """
-        from mobilitydb_sqlalchemy.types.TBool import TBool
-
-        return self.operate(TEMPORAL_LESS_THAN_OR_EQUAL_TO, other, result_type=TBool)
+        return self.operate(
+            TEMPORAL_LESS_THAN_OR_EQUAL_TO, other, result_type=shared_type("TBool")
+        )
 
     def temporal_greater_than_or_equal_to(self, other):
         """
         The "#>=" operator.
         """
-        from mobilitydb_sqlalchemy.types.TBool import TBool
-
-        return self.operate(TEMPORAL_GREATER_THAN_OR_EQUAL_TO, other, result_type=TBool)
+        return self.operate(
+            TEMPORAL_GREATER_THAN_OR_EQUAL_TO, other, result_type=shared_type("TBool")
+        )
 
     def bbox_always_strictly_less_than(self, other):
         """
@@ -359,6 +369,71 @@ class Comparator(UserDefinedType.Comparator):
         """
         The "<->" operator.
         """
-        from mobilitydb_sqlalchemy.types.TFloat import TFloat
+        return self.operate(DISTANCE, other, result_type=shared_type("TFloat"))
+
+    def stbox(self):
+        """
+        The spatiotemporal bounding box of a temporal point, as an ``STBox``.
+        """
+        return cast(self.expr, shared_type("STBox"))
+
+    def tbox(self):
+        """
+        The bounding box of a temporal number, as a ``TBox``.
+        """
+        return cast(self.expr, shared_type("TBox"))
 
-        return self.operate(DISTANCE, other, result_type=TFloat)
+    def timespan(self):
+        """
+        The bounding period of the temporal value, as a ``Period``.
+        """
+        return cast(self.expr, shared_type("Period"))
+
+    def duration(self):
+        """
+        The "duration" function, the time the temporal value is defined for,
+        excluding its gaps.
+        """
+        return func.duration(self.expr, type_=sqltypes.Interval)
+
+    def start_timestamp(self):
+        """
+        The "startTimestamp" function.
+        """
+        return func.startTimestamp(self.expr, type_=TIMESTAMPTZ)
+
+    def end_timestamp(self):
+        """
+        The "endTimestamp" function.
+        """
+        return func.endTimestamp(self.expr, type_=TIMESTAMPTZ)
+
+    def start_value(self):
+        """
+        The "startValue" function, returning a value of the base type of the
+        column (for example a geometry for ``TGeomPoint``).
+        """
+        return func.startValue(self.expr, type_=self.type.value_type)
+
+    def end_value(self):
+        """
+        The "endValue" function, returning a value of the base type of the column.
+        """
+        return func.endValue(self.expr, type_=self.type.value_type)
+
+    def num_instants(self):
+        """
+        The "numInstants" function.
+        """
+        return func.numInstants(self.expr, type_=sqltypes.Integer)
+
+    def value_at(self, timestamp):
+        """
+        The "valueAtTimestamp" function, returning the value of the base type of
+        the column at the given timestamp, or NULL if it is not defined then.
+        """
+        return func.valueAtTimestamp(
+            self.expr,
+            cast(timestamp, TIMESTAMPTZ),
+            type_=self.type.value_type,
+        )
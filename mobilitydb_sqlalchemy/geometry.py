@@ -0,0 +1,104 @@
+"""
+Conversions between shapely Points and arrays of coordinates. The vectorized
+functions of shapely 2 are used when available.
+
+shapely, pandas and geopandas are only imported when they are first used.
+"""
+import importlib.util
+
+import numpy as np
+
+GEOPANDAS = importlib.util.find_spec("geopandas") is not None
+
+# The ways points can be returned in DataFrames: as a column of shapely Points, as
+# x, y (and z) coordinate columns, or as a GeoDataFrame
+GEOMETRY_FORMATS = ("shapely", "coords", "geoseries")
+
+
+def check_coords(values):
+    """
+    Raises TypeError unless ``values`` is an (N, 2) or (N, 3) array of coordinates.
+    """
+    if values.ndim != 2 or values.shape[1] not in (2, 3):
+        raise TypeError(
+            "Expected Point geometries or an (N, 2) or (N, 3) array of coordinates. "
+            "Got an array of shape {}".format(values.shape)
+        )
+    return values
+
+
+def coords_from_points(values):
+    """
+    Returns an (N, 2) or (N, 3) array with the coordinates of the given Points.
+    """
+    import shapely
+
+    if hasattr(shapely, "get_coordinates"):
+        values = np.asarray(values, dtype=object)
+        if (shapely.get_type_id(values) != 0).any():
+            raise TypeError("Expected only Point geometries")
+        return shapely.get_coordinates(
+            values, include_z=bool(shapely.has_z(values).all())
+        )
+
+    if any(v.geom_type != "Point" for v in values):
+        raise TypeError("Expected only Point geometries")
+    return np.array([v.coords[0] for v in values], dtype=float)
+
+
+def points_from_coords(coords):
+    """
+    Returns an array of Points built from an (N, 2) or (N, 3) array of coordinates.
+    """
+    import shapely
+
+    if hasattr(shapely, "points"):
+        return shapely.points(coords)
+
+    from shapely.geometry import Point
+
+    result = np.empty(len(coords), dtype=object)
+    result[:] = [Point(*c) for c in coords.tolist()]
+    return result
+
+
+def points_frame(
+    coords, index, value_column="geometry", geometry="shapely", crs=None, **columns
+):
+    """
+    Builds a DataFrame with the points of an (N, 2) or (N, 3) array of coordinates
+    in the given ``geometry`` format, followed by the other given columns.
+    GeoDataFrames are created in the given ``crs``.
+    """
+    import pandas as pd
+
+    if geometry == "coords":
+        return pd.DataFrame(dict(zip("xyz", coords.T), **columns), index=index)
+    if geometry == "geoseries":
+        if not GEOPANDAS:
+            raise ModuleNotFoundError(
+                "geopandas is optional dependency. Add it using pip install geopandas"
+            )
+        import geopandas
+
+        points = geopandas.points_from_xy(*coords.T, crs=crs)
+        return geopandas.GeoDataFrame(
+            dict({value_column: points}, **columns),
+            index=index,
+            geometry=value_column,
+            crs=crs,
+        )
+    return pd.DataFrame(
+        dict({value_column: points_from_coords(coords)}, **columns), index=index
+    )
+
+
+def coords_from_columns(df):
+    """
+    Returns the x, y (and z) columns of a DataFrame as an array of coordinates, or
+    None if it does not have them.
+    """
+    if "x" not in df.columns or "y" not in df.columns:
+        return None
+    columns = ["x", "y", "z"] if "z" in df.columns else ["x", "y"]
+    return df[columns].to_numpy(dtype=float)
@@ -0,0 +1,157 @@
+"""
+Opt-in instrumentation of the bind and result processing of the column types, to
+tell how much time is spent serializing and decoding values, compared to the time
+spent in the database.
+
+Counters are kept per column type name and operation:
+
+- ``bind``: values serialized before they are sent to the database
+- ``result``: values decoded after they are received from the database, when
+  they are decoded (so lazy values are counted when they are first used)
+- ``movingpandas``: decoded values converted into movingpandas Trajectories.
+  This time is also part of the ``result`` time
+- ``execute``: statements executed, under the name ``"database"``, if
+  :func:`listen` was used on an engine
+
+Instrumentation is disabled by default, and processors only check a flag then.
+
+.. code-block:: python
+
+    from mobilitydb_sqlalchemy import instrumentation
+
+    instrumentation.listen(engine)
+    instrumentation.enable()
+    session.query(Trips).all()
+    instrumentation.snapshot()["TGeomPoint"]["result"]["nanoseconds"]
+"""
+import threading
+from time import perf_counter_ns as clock
+
+from sqlalchemy import event
+
+enabled = False
+
+_lock = threading.Lock()
+_counters = {}
+
+FIELDS = ("values", "instants", "bytes_in", "bytes_out", "nanoseconds")
+
+
+class Counters:
+    """
+    The counters of an operation of a column type: the number of values and of
+    instants processed, the bytes received and returned, and the time spent, in
+    nanoseconds.
+
+    Bytes are the length of the text or bytes exchanged with the database, and
+    the size of the arrays of timestamps and values on the Python side (0 when it
+    is not known, as for pymeos objects).
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for field in FIELDS:
+            setattr(self, field, 0)
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __repr__(self):
+        return "Counters({})".format(
+            ", ".join("{}={}".format(k, v) for k, v in self.as_dict().items())
+        )
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    """
+    Clears all the counters.
+    """
+    with _lock:
+        _counters.clear()
+
+
+def record(name, operation, instants, bytes_in, bytes_out, start):
+    """
+    Records one processed value of the column type ``name``, which started at
+    ``start`` (as returned by :func:`clock`).
+    """
+    elapsed = clock() - start
+    with _lock:
+        counters = _counters.get((name, operation))
+        if counters is None:
+            counters = _counters[name, operation] = Counters()
+        counters.values += 1
+        counters.instants += instants
+        counters.bytes_in += bytes_in
+        counters.bytes_out += bytes_out
+        counters.nanoseconds += elapsed
+
+
+def nbytes(arrays):
+    """
+    Returns the total size of the given arrays, skipping the ones which are None.
+    """
+    return sum(array.nbytes for array in arrays if array is not None)
+
+
+def snapshot():
+    """
+    Returns a copy of the counters, as a dict of column type names to dicts of
+    operations to dicts of counter values.
+    """
+    with _lock:
+        result = {}
+        for (name, operation), counters in _counters.items():
+            result.setdefault(name, {})[operation] = counters.as_dict()
+        return result
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("mobilitydb_execute_start", []).append(clock())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info["mobilitydb_execute_start"].pop()
+    if enabled:
+        record("database", "execute", 0, 0, 0, start)
+
+
+def _handle_error(context):
+    # The statement failed, so after_cursor_execute is not called for it
+    if context.connection is None:
+        return
+    starts = context.connection.info.get("mobilitydb_execute_start")
+    if starts:
+        starts.pop()
+
+
+def listen(engine):
+    """
+    Records the time spent executing statements on an engine (or connection) in
+    the ``"database"`` counters, while instrumentation is enabled.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def remove(engine):
+    """
+    Removes the listeners added by :func:`listen`.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+    event.remove(engine, "handle_error", _handle_error)
@@ -0,0 +1,49 @@
+class LazyTemporal:
+    """
+    A proxy to a temporal value, returned by columns created with ``lazy=True``.
+
+    It keeps the raw value as received from the database and decodes it only when
+    it is first used, caching the result. Attributes, indexing, iteration and
+    ``len`` are forwarded to the decoded value (a DataFrame, TemporalArray or
+    Trajectory), so in most cases the proxy can be used in its place.
+    """
+
+    __slots__ = ("raw", "_decode", "_value")
+
+    def __init__(self, raw, decode):
+        self.raw = raw
+        self._decode = decode
+        self._value = None
+
+    @property
+    def loaded(self):
+        return self._decode is None
+
+    @property
+    def value(self):
+        """
+        The decoded value. The raw value is decoded on first access.
+        """
+        if self._decode is not None:
+            self._value = self._decode(self.raw)
+            self._decode = None
+        return self._value
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name in LazyTemporal.__slots__:
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __getitem__(self, key):
+        return self.value[key]
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        if self.loaded:
+            return repr(self._value)
+        return "<LazyTemporal (not loaded)>"
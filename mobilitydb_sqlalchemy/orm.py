@@ -0,0 +1,106 @@
+"""
+ORM helpers for mapped classes with temporal columns.
+
+Temporal columns are usually by far the largest part of a row, so mapped classes
+can defer loading them using :class:`DeferredTemporalMixin`, and load them for
+many objects at once using :func:`undefer_bulk`.
+"""
+from sqlalchemy import Column, inspect, tuple_
+from sqlalchemy.orm import deferred
+from sqlalchemy.orm.attributes import set_committed_value
+
+from mobilitydb_sqlalchemy.types.TBaseType import TBaseType
+
+TEMPORAL_GROUP = "temporal"
+
+
+class DeferredTemporalMixin:
+    """
+    A declarative mixin which defers loading the temporal columns of a mapped
+    class, in the deferred group "temporal". They are loaded on first access,
+    with ``undefer_group("temporal")`` as a query option, or for many objects at
+    once with :func:`undefer_bulk`.
+
+    A column is loaded as usual if it is created with
+    ``info={"deferred": False}``.
+
+    .. code-block:: python
+
+        class Trips(DeferredTemporalMixin, Base):
+            __tablename__ = "trips"
+            car_id = Column(Integer, primary_key=True)
+            trip = Column(TGeomPoint)
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        # The columns are replaced before the class is mapped, which for
+        # DeclarativeMeta happens after __init_subclass__ returns
+        for name, value in list(vars(cls).items()):
+            if (
+                isinstance(value, Column)
+                and isinstance(value.type, TBaseType)
+                and value.info.get("deferred", True)
+            ):
+                setattr(cls, name, deferred(value, group=TEMPORAL_GROUP))
+        super().__init_subclass__(**kwargs)
+
+
+def deferred_temporal_attributes(mapper):
+    """
+    Returns the keys of the deferred temporal attributes of a mapper.
+    """
+    return [
+        prop.key
+        for prop in mapper.column_attrs
+        if prop.deferred
+        and any(isinstance(column.type, TBaseType) for column in prop.columns)
+    ]
+
+
+def undefer_bulk(session, objects, *attributes, chunk_size=500):
+    """
+    Loads the deferred temporal attributes of many already loaded objects of the
+    same mapped class, using one ``IN`` query per ``chunk_size`` objects instead
+    of one query per object. The loaded values are set as the committed state of
+    the objects, so they are not marked as modified.
+
+    ``attributes`` are the keys of the attributes to load, by default all the
+    deferred temporal ones. Objects which already have them loaded, or which are
+    not persistent, are skipped.
+    """
+    objects = list(objects)
+    if not objects:
+        return
+    mapper = inspect(objects[0]).mapper
+    keys = list(attributes) or deferred_temporal_attributes(mapper)
+
+    states = [
+        state
+        for state in map(inspect, objects)
+        if state.key is not None and state.unloaded.intersection(keys)
+    ]
+    if not keys or not states:
+        return
+
+    primary_key = mapper.primary_key
+    if len(primary_key) == 1:
+        key_column = primary_key[0]
+    else:
+        key_column = tuple_(*primary_key)
+    columns = [mapper.column_attrs[key].expression for key in keys]
+
+    for start in range(0, len(states), chunk_size):
+        chunk = {state.identity: state for state in states[start : start + chunk_size]}
+        identities = [
+            identity[0] if len(primary_key) == 1 else identity for identity in chunk
+        ]
+        rows = session.query(*primary_key, *columns).filter(key_column.in_(identities))
+        for row in rows:
+            state = chunk.get(tuple(row[: len(primary_key)]))
+            if state is None:
+                continue
+            unloaded = state.unloaded
+            for key, value in zip(keys, row[len(primary_key) :]):
+                # Loaded values are kept, as they may have been modified
+                if key in unloaded:
+                    set_committed_value(state.obj(), key, value)
@@ -0,0 +1,101 @@
+"""
+Decoding of large results in a pool of processes, as decoding temporal values is
+CPU bound work which can not run in parallel in threads.
+
+The values are fetched undecoded, as text or bytes, and sent to the workers in
+chunks. The workers parse them into arrays, which are sent back and turned into
+the values returned for the column (DataFrames for example) in order.
+"""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy.orm import Session
+
+from mobilitydb_sqlalchemy.query import raw_statement
+
+# Results smaller than this (in bytes of raw values) are decoded in the current
+# process, as starting workers and sending them the values would take longer
+MIN_PARALLEL_BYTES = 1 << 20
+
+
+def _read_chunk(column_type, values):
+    return [
+        None if value is None else column_type.read_temporal(value) for value in values
+    ]
+
+
+def _chunks(values, size):
+    iterator = iter(values)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def decode_values(
+    column_type,
+    values,
+    executor=None,
+    workers=None,
+    chunk_size=None,
+    min_bytes=MIN_PARALLEL_BYTES,
+):
+    """
+    Decodes a list of raw values of a temporal column type, using a pool of
+    processes. Returns the decoded values, in the same order.
+
+    ``executor`` is an existing executor to use. Otherwise a ProcessPoolExecutor
+    with ``workers`` processes (by default one per CPU) is started, and shut down
+    afterwards. Values are sent to the workers ``chunk_size`` at a time, by
+    default in four chunks per worker, so ``workers`` should be given along with
+    an executor which does not have one worker per CPU.
+
+    Results with less than ``min_bytes`` of raw values, or a single row, are
+    decoded in the current process instead.
+    """
+    raw_bytes = sum(len(value) for value in values if value is not None)
+    if len(values) < 2 or raw_bytes < min_bytes:
+        return [
+            None if value is None else column_type.read_value(value) for value in values
+        ]
+
+    workers = workers or os.cpu_count()
+    chunk_size = chunk_size or max(1, -(-len(values) // (workers * 4)))
+
+    if executor is None:
+        with ProcessPoolExecutor(workers) as executor:
+            return decode_values(column_type, values, executor, workers, chunk_size, 0)
+
+    chunks = executor.map(
+        _read_chunk, itertools.repeat(column_type), _chunks(values, chunk_size)
+    )
+    return [
+        None if arrays is None else column_type.from_arrays(*arrays)
+        for chunk in chunks
+        for arrays in chunk
+    ]
+
+
+def fetch_parallel(connection, statement, **kwargs):
+    """
+    Executes a select and returns its rows, as tuples, with the values of its
+    temporal columns decoded using ``decode_values`` (which ``kwargs`` are
+    passed to).
+
+    ``connection`` can be a SQLAlchemy Connection or Session.
+    """
+    if isinstance(connection, Session):
+        connection = connection.connection()
+
+    columns, temporal, statement = raw_statement(statement)
+    rows = connection.execute(statement).fetchall()
+    values = list(zip(*rows)) or [()] * len(columns)
+    values = [
+        decode_values(column.type, list(column_values), **kwargs)
+        if is_temporal
+        else column_values
+        for column, is_temporal, column_values in zip(columns, temporal, values)
+    ]
+    return list(zip(*values))
@@ -0,0 +1,161 @@
+"""
+Parsing of the MobilityDB text representation of temporal values straight into
+NumPy arrays, without creating a pymeos object for every instant.
+
+Supported inputs are single instants (``v@t``), sequences (``[v@t, ...]`` or with
+exclusive bounds), instant sets (``{v@t, ...}``) and sequence sets
+(``{[v@t, ...], [v@t, ...]}``), optionally prefixed by ``SRID=...;`` and
+``Interp=Stepwise;``. Anything else raises :class:`ParseError`, and callers fall
+back to the pymeos deserializers.
+"""
+import re
+
+import numpy as np
+
+FLOAT = "float"
+INT = "int"
+BOOL = "bool"
+POINT = "point"
+
+_PREFIX = re.compile(r"\s*(?:SRID=\d+;\s*)?(?:Interp=Stepwise;\s*)?", re.IGNORECASE)
+
+_TIMESTAMP = (
+    r"@\s*(\d{4}-\d\d-\d\d)[ T](\d\d:\d\d:\d\d(?:\.\d{1,6})?)"
+    r"\s*([+-]\d\d(?::?\d\d)?|Z)?\s*(?:,|$)"
+)
+
+_INSTANTS = {
+    FLOAT: re.compile(r"\s*([-+0-9.eEinfINFaN]+)\s*" + _TIMESTAMP),
+    INT: re.compile(r"\s*([-+]?\d+)\s*" + _TIMESTAMP),
+    BOOL: re.compile(r"\s*(t|f|true|false)\s*" + _TIMESTAMP, re.IGNORECASE),
+    POINT: re.compile(
+        r"\s*POINT\s*(?:Z\s*)?\(\s*([^()]*?)\s*\)\s*" + _TIMESTAMP, re.IGNORECASE
+    ),
+}
+
+
+_SEQUENCE_SEPARATOR = re.compile(r"[\])]\s*,\s*[\[(]")
+
+
+class ParseError(ValueError):
+    pass
+
+
+def _offset_minutes(offset):
+    if not offset or offset == "Z":
+        return 0
+    sign = -1 if offset[0] == "-" else 1
+    digits = offset[1:].replace(":", "")
+    return sign * (int(digits[:2]) * 60 + int(digits[2:4] or 0))
+
+
+def parse_timestamps(dates, times, offsets):
+    """
+    Converts the date, time and UTC offset parts of timestamps into an int64 array
+    of microseconds since the unix epoch.
+    """
+    local = np.array(
+        [d + "T" + t for d, t in zip(dates, times)], dtype="datetime64[us]"
+    ).view(np.int64)
+    unique = set(offsets)
+    if unique <= {"", "Z", "+00", "+0000", "+00:00"}:
+        return local
+    minutes = {offset: _offset_minutes(offset) for offset in unique}
+    return local - np.array([minutes[o] for o in offsets], dtype=np.int64) * 60000000
+
+
+def _parse_values(kind, values):
+    if kind == FLOAT:
+        return np.array(values, dtype=float)
+    if kind == INT:
+        return np.array(values, dtype=np.int64)
+    if kind == BOOL:
+        return np.array([v[0] in "tT" for v in values], dtype=bool)
+    coords = [v.split() for v in values]
+    dimensions = len(coords[0])
+    if dimensions not in (2, 3) or any(len(c) != dimensions for c in coords):
+        raise ParseError("Points must all have 2 or 3 coordinates")
+    return np.array(coords, dtype=float)
+
+
+def _match_instants(body, kind, text):
+    matches = list(_INSTANTS[kind].finditer(body))
+    # The instants have to cover the whole body, with nothing skipped in between
+    if not matches or sum(m.end() - m.start() for m in matches) != len(body):
+        raise ParseError("Unsupported temporal value: {!r}".format(text[:80]))
+    return matches
+
+
+def parse_temporal(text, kind):
+    """
+    Parses the text of a temporal value of the given kind ("float", "int", "bool"
+    or "point") into a tuple of ``(times, values, segments)``, where times are
+    microseconds since the unix epoch sorted in ascending order. Points are
+    returned as an (N, 2) or (N, 3) array of coordinates.
+
+    ``segments`` holds the offsets of the sequences of a sequence set in the
+    arrays (the i-th sequence is between ``segments[i]`` and ``segments[i + 1]``),
+    and is None for other values.
+
+    Raises ParseError if the text is not in one of the supported forms.
+    """
+    body = text[_PREFIX.match(text).end() :].strip()
+    parts, sequence_set = [body], False
+    if body[:1] in "[({":
+        if body[-1:] not in "])}" or not body[1:-1].strip():
+            raise ParseError("Unsupported temporal value: {!r}".format(text[:80]))
+        parts = [body[1:-1].strip()]
+        if body[0] == "{" and parts[0][:1] in "[(":
+            if parts[0][-1:] not in "])":
+                raise ParseError("Unsupported temporal value: {!r}".format(text[:80]))
+            parts, sequence_set = _SEQUENCE_SEPARATOR.split(parts[0][1:-1]), True
+
+    matches = [_match_instants(part, kind, text) for part in parts]
+    segments = None
+    if sequence_set:
+        segments = np.zeros(len(matches) + 1, dtype=np.int64)
+        np.cumsum([len(m) for m in matches], out=segments[1:])
+
+    values, dates, times, offsets = zip(
+        *(match.groups("") for part in matches for match in part)
+    )
+    times = parse_timestamps(dates, times, offsets)
+    try:
+        values = _parse_values(kind, values)
+    except ValueError as e:
+        raise ParseError(str(e)) from e
+
+    if (times[1:] < times[:-1]).any():
+        if segments is not None:
+            raise ParseError("The sequences of a sequence set are not in order")
+        order = np.argsort(times, kind="stable")
+        times, values = times[order], values[order]
+    return times, values, segments
+
+
+def parse_layout(text):
+    """
+    Returns the subtype of the text of a temporal value ("instant", "instantset",
+    "sequence" or "sequenceset"), whether its interpolation is stepwise, and
+    whether the lower and upper bounds of each of its sequences are inclusive, as
+    lists (empty for instants and instant sets).
+    """
+    prefix = _PREFIX.match(text)
+    stepwise = "interp" in prefix.group().lower()
+    body = text[prefix.end() :].strip()
+    if body[:1] in ("[", "("):
+        return "sequence", stepwise, [body[0] == "["], [body[-1] == "]"]
+    if body[:1] != "{":
+        return "instant", stepwise, [], []
+    body = body[1:-1].strip()
+    if body[:1] not in ("[", "("):
+        return "instantset", stepwise, [], []
+    separators = _SEQUENCE_SEPARATOR.findall(body)
+    lower = [body[0]] + [separator[-1] for separator in separators]
+    upper = [separator[0] for separator in separators] + [body[-1]]
+    return (
+        "sequenceset",
+        stepwise,
+        [bound == "[" for bound in lower],
+        [bound == "]" for bound in upper],
+    )
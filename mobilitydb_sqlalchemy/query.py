@@ -0,0 +1,188 @@
+"""
+Helpers for running queries which return many temporal values, decoding them in
+bulk instead of row by row.
+"""
+import numpy as np
+from sqlalchemy import LargeBinary, Text, type_coerce
+from sqlalchemy.orm import Session
+
+from mobilitydb_sqlalchemy.geometry import points_frame
+from mobilitydb_sqlalchemy.types.TBaseGeomPoint import (
+    CRS_METRIC,
+    MOVING_PANDAS,
+    TBaseGeomPoint,
+)
+from mobilitydb_sqlalchemy.types.TBaseType import TBaseType
+from mobilitydb_sqlalchemy.utils import to_datetime_index
+
+
+def _selected_columns(statement):
+    if hasattr(statement, "selected_columns"):
+        return list(statement.selected_columns)
+    return list(statement.inner_columns)
+
+
+def raw_column(column):
+    """
+    Returns an expression selecting the given temporal column the way its type
+    would (for example using ``asText``), but without its result processor, so
+    that values are fetched undecoded.
+    """
+    column_type = column.type
+    expression = column_type.column_expression(column)
+    if expression is None:
+        expression = column
+    if getattr(column_type, "wire_format", "text") == "binary":
+        return type_coerce(expression, LargeBinary()).label(column.key)
+    return type_coerce(expression, Text()).label(column.key)
+
+
+def raw_statement(statement):
+    """
+    Rewrites a select so that its temporal columns are fetched undecoded. Returns
+    the selected columns, whether each one is temporal, and the new statement.
+    """
+    columns = _selected_columns(statement)
+    temporal = [isinstance(column.type, TBaseType) for column in columns]
+    statement = statement.with_only_columns(
+        [
+            raw_column(column) if is_temporal else column
+            for column, is_temporal in zip(columns, temporal)
+        ]
+    )
+    return columns, temporal, statement
+
+
+def stream_temporal(connection, statement, chunk_size=1000):
+    """
+    Executes a select using a server side cursor and yields its results in chunks
+    of at most ``chunk_size`` rows, so that memory usage depends on the chunk size
+    and not on the size of the result.
+
+    Every chunk is a dict mapping the keys of the selected columns to their values.
+    Temporal columns are fetched undecoded, and then decoded together once per
+    chunk into a :class:`mobilitydb_sqlalchemy.columnar.TemporalBatch`. The values
+    of other columns are returned as lists.
+
+    ``connection`` can be a SQLAlchemy Connection or Session.
+    """
+    if isinstance(connection, Session):
+        connection = connection.connection()
+
+    columns, temporal, statement = raw_statement(statement)
+
+    result = connection.execution_options(stream_results=True).execute(statement)
+    try:
+        while True:
+            rows = result.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield {
+                column.key: column.type.read_batch(values) if is_temporal else values
+                for column, is_temporal, values in zip(
+                    columns, temporal, map(list, zip(*rows))
+                )
+            }
+    finally:
+        result.close()
+
+
+def _read_single_batch(connection, statement):
+    """
+    Executes a select of a single temporal column and decodes its values into a
+    TemporalBatch. Returns the temporal column type, the batch, and the values
+    and keys of the other selected columns.
+    """
+    if isinstance(connection, Session):
+        connection = connection.connection()
+
+    columns, temporal, statement = raw_statement(statement)
+    if sum(temporal) != 1:
+        raise ValueError("Expected exactly one temporal column to be selected")
+
+    rows = connection.execute(statement).fetchall()
+    values = list(zip(*rows)) or [()] * len(columns)
+
+    keys, names = [], []
+    for column, is_temporal, column_values in zip(columns, temporal, values):
+        if is_temporal:
+            column_type = column.type
+            batch = column_type.read_batch(column_values)
+        else:
+            keys.append(column_values)
+            names.append(column.key)
+    return column_type, batch, keys, names
+
+
+def read_long_frame(connection, statement):
+    """
+    Executes a select of a single temporal column, and returns the instants of all
+    the rows as one "long" DataFrame. It is indexed by the other selected columns
+    (the row keys) and the timestamp ``t``, or by the row number and ``t`` if no
+    other columns are selected.
+
+    The values are decoded together and the DataFrame is built in one go, instead
+    of building a DataFrame per row and concatenating them.
+
+    ``connection`` can be a SQLAlchemy Connection or Session.
+    """
+    _, batch, keys, names = _read_single_batch(connection, statement)
+    return batch.to_dataframe(keys or None, names or None)
+
+
+def read_trajectory_collection(connection, statement, min_length=0):
+    """
+    Executes a select of a single TGeomPoint or TGeogPoint column, and returns the
+    rows as one movingpandas TrajectoryCollection.
+
+    The other selected columns identify the trajectories: their values are used
+    as trajectory ids, as tuples if several columns are selected. Rows are
+    numbered if no other columns are selected. NULL values are skipped, and the
+    collection is empty if all of them are NULL.
+
+    The values are decoded together, and the collection is built from a single
+    GeoDataFrame of all the instants, with a column holding the trajectory ids
+    (named after the selected column, or ``trajectory_id``). If any of the values
+    is a sequence set, each of its sequences is a trajectory of its own, so that
+    no movement is interpolated across the gaps between them: trajectory ids are
+    then tuples of the row id and the number of the sequence. Its CRS is the one of
+    the column type, and its timestamps are naive, in UTC, as the ones of the
+    trajectories read by columns using movingpandas.
+
+    ``connection`` can be a SQLAlchemy Connection or Session.
+    """
+    if not MOVING_PANDAS:
+        raise ModuleNotFoundError(
+            "movingpandas is optional dependency. Add it using pip install movingpandas"
+        )
+    import movingpandas as mpd
+
+    column_type, batch, keys, names = _read_single_batch(connection, statement)
+    if not isinstance(column_type, TBaseGeomPoint):
+        raise ValueError("Expected a temporal point column to be selected")
+    if not len(batch.t):
+        return mpd.TrajectoryCollection([], min_length=min_length)
+
+    if not keys:
+        ids, id_column = np.arange(len(batch)), "trajectory_id"
+    elif len(keys) == 1:
+        ids, id_column = keys[0], names[0]
+    else:
+        ids, id_column = list(zip(*keys)), "trajectory_id"
+    trajectory_ids = np.empty(len(ids), dtype=object)
+    trajectory_ids[:] = ids
+    trajectory_ids = np.repeat(trajectory_ids, np.diff(batch.offsets))
+    if batch.segment is not None:
+        trajectory_ids[:] = list(zip(trajectory_ids, batch.segment.tolist()))
+
+    geo_df = points_frame(
+        batch.values,
+        # movingpandas drops the timezone of every trajectory, so the times are
+        # given in naive UTC once here instead
+        to_datetime_index(batch.t, None).rename("t"),
+        column_type.pandas_value_column,
+        "geoseries",
+        column_type.crs or CRS_METRIC,
+        **{id_column: trajectory_ids},
+    )
+    return mpd.TrajectoryCollection(geo_df, id_column, min_length=min_length)
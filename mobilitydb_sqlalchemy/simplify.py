@@ -0,0 +1,132 @@
+"""
+Simplification of trajectories before they are written, dropping the points
+which can be recovered by interpolating between the points which are kept.
+
+The filter is a time aware Douglas-Peucker: the error of dropping a point is the
+distance between the point and the position interpolated at its timestamp
+between the points kept around it (its synchronized euclidean distance), so that
+changes in speed are kept as well as changes in direction.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# Approximate length of a degree of latitude and of longitude at the equator
+METERS_PER_DEGREE_LAT = 110574.0
+METERS_PER_DEGREE_LON = 111320.0
+
+
+class SpatioTemporalTolerance(
+    namedtuple("SpatioTemporalTolerance", ["meters", "seconds"])
+):
+    """
+    The tolerance of trajectory simplification. Points are dropped if they are
+    within ``meters`` of their interpolated position, and if the points kept
+    around them are at most ``seconds`` apart (when given).
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, meters, seconds=None):
+        if meters < 0:
+            raise ValueError("meters must not be negative. Got: {}".format(meters))
+        if seconds is not None and seconds <= 0:
+            raise ValueError("seconds must be positive. Got: {}".format(seconds))
+        return super().__new__(cls, meters, seconds)
+
+
+SimplifyInfo = namedtuple("SimplifyInfo", ["values", "points", "dropped"])
+
+
+def to_meters(coords):
+    """
+    Projects longitude and latitude coordinates to approximate planar coordinates
+    in meters, using an equirectangular projection around their mean latitude.
+    """
+    coords = np.array(coords, dtype=float)
+    latitude = np.radians(coords[:, 1].mean()) if len(coords) else 0.0
+    coords[:, 0] *= METERS_PER_DEGREE_LON * np.cos(latitude)
+    coords[:, 1] *= METERS_PER_DEGREE_LAT
+    return coords
+
+
+def simplify_mask(times, coords, tolerance, geographic=False):
+    """
+    Returns a boolean mask of the points of a trajectory to keep. ``times`` are
+    its time sorted timestamps (``datetime64``) and ``coords`` an (N, 2) or (N, 3)
+    array of coordinates in meters, or in degrees if ``geographic`` is set. The
+    first and last points are always kept.
+    """
+    n = len(times)
+    keep = np.zeros(n, dtype=bool)
+    if n <= 2:
+        keep[:] = True
+        return keep
+
+    t = np.asarray(times, dtype="datetime64[us]").view(np.int64) / 1e6
+    xy = to_meters(coords) if geographic else np.asarray(coords, dtype=float)
+    keep[0] = keep[-1] = True
+
+    # All the intervals between kept points which are still to be checked are
+    # processed together, one level of the recursion at a time
+    starts, ends = np.array([0]), np.array([n - 1])
+    while len(starts):
+        counts = ends - starts - 1
+        starts, ends, counts = starts[counts > 0], ends[counts > 0], counts[counts > 0]
+        if not len(starts):
+            break
+
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        owner = np.repeat(np.arange(len(starts)), counts)
+        i, j = starts[owner], ends[owner]
+        points = i + 1 + np.arange(len(owner)) - offsets[owner]
+
+        span = t[j] - t[i]
+        fraction = np.divide(
+            t[points] - t[i], span, out=np.zeros(len(owner)), where=span > 0
+        )
+        expected = xy[i] + fraction[:, None] * (xy[j] - xy[i])
+        distances = np.sqrt(((xy[points] - expected) ** 2).sum(axis=1))
+
+        # The farthest point of every interval (the first one, on ties)
+        farthest = np.maximum.reduceat(distances, offsets)
+        candidates = np.flatnonzero(distances == farthest[owner])
+        _, first = np.unique(owner[candidates], return_index=True)
+        split = points[candidates[first]]
+
+        split_far = farthest > tolerance.meters
+        split_long = ~split_far
+        if tolerance.seconds is not None:
+            # Split at the middle of the time span instead of the farthest point,
+            # so that long straight stretches are not split one point at a time
+            split_long &= t[ends] - t[starts] > tolerance.seconds
+            middle = np.searchsorted(t, (t[starts] + t[ends]) / 2)
+            split = np.where(split_long, np.clip(middle, starts + 1, ends - 1), split)
+        else:
+            split_long[:] = False
+
+        selected = split_far | split_long
+        starts, ends, split = starts[selected], ends[selected], split[selected]
+        keep[split] = True
+        starts, ends = np.concatenate([starts, split]), np.concatenate([split, ends])
+    return keep
+
+
+def simplify(times, coords, tolerance, segments=None, geographic=False):
+    """
+    Simplifies a trajectory, or each of the sequences of a sequence set given the
+    offsets of its sequences in ``segments``. Returns the kept timestamps and
+    coordinates, and the offsets of the sequences in them (or None).
+    """
+    if segments is None:
+        keep = simplify_mask(times, coords, tolerance, geographic)
+        return times[keep], coords[keep], None
+
+    keep = np.concatenate(
+        [
+            simplify_mask(times[start:end], coords[start:end], tolerance, geographic)
+            for start, end in zip(segments[:-1], segments[1:])
+        ]
+    )
+    kept = np.concatenate([[0], np.cumsum(keep)])
+    return times[keep], coords[keep], kept[segments]
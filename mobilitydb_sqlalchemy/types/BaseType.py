@@ -1,7 +1,48 @@
+import functools
+
 from sqlalchemy.types import UserDefinedType
 
+from mobilitydb_sqlalchemy import instrumentation
+
+
+class CachedKeyMixin:
+    """
+    Computes the key of a type in SQLAlchemy's statement cache once, instead of
+    every time a statement using it is executed. The key is made of the
+    attributes set from the arguments of ``__init__``, which do not change once
+    the type is created.
+
+    These attributes are hashable, so the types set ``cache_ok``. SQLAlchemy only
+    reads it from the class itself, so every subclass sets it too.
+    """
+
+    @property
+    def _static_cache_key(self):
+        key = self.__dict__.get("_cached_key")
+        if key is None:
+            key = self.__dict__["_cached_key"] = super()._static_cache_key
+        return key
+
+
+class BaseType(CachedKeyMixin, UserDefinedType):
+    cache_ok = True
+
+    def __init__(self, cache_size=0):
+        """
+        ``cache_size`` enables a bounded LRU cache of parsed values, keyed by the
+        string returned by the database, for columns where the same values repeat
+        across many rows. Parsed values are then shared between rows, and so must
+        not be modified.
+        """
+        if cache_size < 0:
+            raise ValueError(
+                "cache_size must not be negative. Got: {}".format(cache_size)
+            )
+        self.cache_size = cache_size
+        self._parse = None
+        if cache_size:
+            self._parse = functools.lru_cache(maxsize=cache_size)(self.base_class)
 
-class BaseType(UserDefinedType):
     @property
     def base_class(self):
         raise NotImplementedError()
@@ -13,15 +54,46 @@ class BaseType(UserDefinedType):
                 "Expected: {} Got: {} {}".format(cls.base_class, value.__class__, value)
             )
 
+    def cache_info(self):
+        """
+        Returns the hits, misses, maximum and current size of the parse cache, or
+        None if it is not enabled.
+        """
+        if self._parse is None:
+            return None
+        return self._parse.cache_info()
+
+    def cache_clear(self):
+        if self._parse is not None:
+            self._parse.cache_clear()
+
     def bind_processor(self, dialect):
         def process(value):
             self.validate_type(value)
-            return str(value)
+            if not instrumentation.enabled:
+                return str(value)
+
+            start = instrumentation.clock()
+            text = str(value)
+            instrumentation.record(type(self).__name__, "bind", 0, 0, len(text), start)
+            return text
 
         return process
 
     def result_processor(self, dialect, coltype):
+        parse = self._parse if self._parse is not None else self.base_class
+        name = type(self).__name__
+
         def process(value):
-            return self.base_class(value)
+            # Values which are not text were already decoded by the driver
+            if not isinstance(value, str):
+                return value
+            if not instrumentation.enabled:
+                return parse(value)
+
+            start = instrumentation.clock()
+            result = parse(value)
+            instrumentation.record(name, "result", 0, len(value), 0, start)
+            return result
 
         return process
@@ -5,6 +5,7 @@ from .BaseType import BaseType
 
 
 class Period(BaseType):
+    cache_ok = True
     base_class = MEOSPeriod
 
     def get_col_spec(self):
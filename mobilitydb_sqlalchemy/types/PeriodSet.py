@@ -5,6 +5,7 @@ from .BaseType import BaseType
 
 
 class PeriodSet(BaseType):
+    cache_ok = True
     base_class = MEOSPeriodSet
 
     def get_col_spec(self):
@@ -5,6 +5,7 @@ from .BaseType import BaseType
 
 
 class RangeFloat(BaseType):
+    cache_ok = True
     base_class = MEOSRangeFloat
 
     def get_col_spec(self):
@@ -5,6 +5,7 @@ from .BaseType import BaseType
 
 
 class RangeInt(BaseType):
+    cache_ok = True
     base_class = MEOSRangeInt
 
     def get_col_spec(self):
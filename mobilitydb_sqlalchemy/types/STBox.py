@@ -5,6 +5,7 @@ from .BaseType import BaseType
 
 
 class STBox(BaseType):
+    cache_ok = True
     base_class = MEOSSTBox
 
     def get_col_spec(self):
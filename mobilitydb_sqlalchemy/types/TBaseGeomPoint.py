@@ -1,93 +1,266 @@
+import importlib.util
 import re
 
-import pandas as pd
-from pymeos import GeomPoint
-from pymeos.io import DeserializerGeom
-from pymeos.temporal import TGeomPointInst, TGeomPointSeq
-from shapely.geometry import Point
-from shapely.wkt import loads
 from sqlalchemy import func
 from sqlalchemy.types import UserDefinedType
 
+from mobilitydb_sqlalchemy import instrumentation, parser, wkb
+from mobilitydb_sqlalchemy.columnar import TemporalArray
+from mobilitydb_sqlalchemy.geometry import (
+    GEOMETRY_FORMATS,
+    check_coords,
+    coords_from_columns,
+    coords_from_points,
+    points_frame,
+)
+from mobilitydb_sqlalchemy.simplify import SimplifyInfo, simplify
+from mobilitydb_sqlalchemy.utils import format_floats, to_datetime_index
 from .TBaseType import TBaseType
 
-try:
-    import movingpandas as mpd
-    from fiona.crs import from_epsg
-    from geopandas import GeoDataFrame
+# movingpandas is only imported when it is used, as importing it is slow
+MOVING_PANDAS = importlib.util.find_spec("movingpandas") is not None
 
-    MOVING_PANDAS = True
-    CRS_METRIC = from_epsg(31256)
-except ImportError:
-    MOVING_PANDAS = False
+# The CRS of movingpandas Trajectories, unless a column sets another one
+CRS_METRIC = "EPSG:31256"
 
 
 class TBaseGeomPoint(TBaseType):
-    pymeos_sequence_type = TGeomPointSeq
-    pymeos_instant_type = TGeomPointInst
-    pymeos_deserializer_type = DeserializerGeom
+    """
+    Points are read as a ``geometry`` column of shapely Points by default. With
+    ``geometry="coords"`` they are read as ``x``, ``y`` (and ``z``) columns of
+    coordinates instead, and with ``geometry="geoseries"`` as a GeoDataFrame,
+    without creating a shapely object per point. DataFrames with ``x`` and ``y``
+    columns instead of a ``geometry`` one can be written as well.
+
+    ``crs`` is the CRS of the GeoDataFrames and movingpandas Trajectories that are
+    returned. Trajectories are in EPSG:31256 by default. They are built from a
+    GeoDataFrame created straight from the decoded coordinates. Their times are
+    naive, in UTC whatever ``tz`` is, since movingpandas drops timezones and they
+    are written back as UTC.
+    """
+
+    cache_ok = True
 
     # This is ensure compatibility with movingpandas
     pandas_value_column = "geometry"
+    value_shape = (2,)
+
+    wkb_temptype = wkb.T_GEOMPOINT
+    linear = True
+    text_value_kind = parser.POINT
 
-    def __init__(self, left_closed=True, right_closed=True, use_movingpandas=False):
-        super().__init__(left_closed=left_closed, right_closed=right_closed)
+    # Whether coordinates are longitudes and latitudes, in degrees
+    geographic = False
+
+    def __init__(
+        self,
+        left_closed=True,
+        right_closed=True,
+        use_movingpandas=False,
+        wire_format="text",
+        return_type="pandas",
+        lazy=False,
+        assume_sorted=False,
+        subtype="sequence",
+        max_gap=None,
+        simplify=None,
+        geometry="shapely",
+        tz="UTC",
+        precision=None,
+        compact=False,
+        crs=None,
+    ):
+        super().__init__(
+            left_closed=left_closed,
+            right_closed=right_closed,
+            return_type=return_type,
+            lazy=lazy,
+            assume_sorted=assume_sorted,
+            subtype=subtype,
+            max_gap=max_gap,
+            tz=tz,
+            precision=precision,
+            compact=compact,
+        )
+        if wire_format not in ("text", "binary"):
+            raise ValueError(
+                "wire_format must be 'text' or 'binary'. Got: {}".format(wire_format)
+            )
+        if geometry not in GEOMETRY_FORMATS:
+            raise ValueError(
+                "geometry must be one of {}. Got: {}".format(GEOMETRY_FORMATS, geometry)
+            )
+        if use_movingpandas and return_type != "pandas":
+            raise ValueError("use_movingpandas can only be used with pandas values")
+        if use_movingpandas and geometry == "coords":
+            raise ValueError("use_movingpandas can not be used with coordinate columns")
         self.use_movingpandas = use_movingpandas
+        self.wire_format = wire_format
+        self.simplify = simplify
+        self.geometry = geometry
+        self.crs = crs
+        self._simplify_counts = [0, 0, 0]
 
     def get_col_spec(self):
         return "TGEOMPOINT"
 
+    @property
+    def pymeos_sequence_type(self):
+        from pymeos.temporal import TGeomPointSeq
+
+        return TGeomPointSeq
+
+    @property
+    def pymeos_instant_type(self):
+        from pymeos.temporal import TGeomPointInst
+
+        return TGeomPointInst
+
+    @property
+    def pymeos_deserializer_type(self):
+        from pymeos.io import DeserializerGeom
+
+        return DeserializerGeom
+
+    @property
+    def value_type(self):
+        from geoalchemy2 import Geometry
+
+        return Geometry(geometry_type="POINT")
+
     def column_expression(self, col):
-        # TODO use func.asBinary, as probably that will be more efficient
+        if self.wire_format == "binary":
+            return func.asBinary(col, type_=self)
         return func.asText(col, type_=self)
 
     @staticmethod
     def validate_type(value):
-        # TODO validate Point type in the dataframe
-        pass
+        # The values are checked to be points when their coordinates are read, by
+        # coords_from_points and check_coords
+        if "geometry" not in value.columns:
+            raise TypeError(
+                "Temporal points need a geometry column, or x and y columns. "
+                "Got: {}".format(list(value.columns))
+            )
 
     @staticmethod
-    def write_instant_value(value):
-        return GeomPoint(value.wkt)
+    def write_instant_values(values):
+        if check_coords(values).shape[1] == 3:
+            return [
+                "POINT Z(" + x + " " + y + " " + z + ")"
+                for x, y, z in zip(*map(format_floats, values.T))
+            ]
+        return [
+            "POINT(" + x + " " + y + ")" for x, y in zip(*map(format_floats, values.T))
+        ]
 
     @staticmethod
     def parse_instant_value(value):
+        from shapely.geometry import Point
+        from shapely.wkt import loads
+
         point = loads(value.toWKT())
         if type(point) != Point:
             raise TypeError("Expected Point, got: " + type(point))
-        return point
-
-    def bind_processor(self, dialect):
-        parent_process = super().bind_processor(dialect)
-        use_movingpandas = self.use_movingpandas
-
-        def process(value):
-            if use_movingpandas:
-                if MOVING_PANDAS:
-                    return parent_process(value.df)
-                else:
-                    raise ModuleNotFoundError(
-                        "movingpandas is optional dependency. Add it using pip install movingpandas"
-                    )
-            return parent_process(value)
-
-        return process
-
-    def result_processor(self, dialect, coltype):
-        parent_process = super().result_processor(dialect, coltype)
-        use_movingpandas = self.use_movingpandas
-
-        def process(value):
-            df = parent_process(value)
-            if use_movingpandas:
-                if MOVING_PANDAS:
-                    geo_df = GeoDataFrame(df, crs=CRS_METRIC)
-                    traj = mpd.Trajectory(geo_df, 1)
-                    return traj
-                else:
-                    raise ModuleNotFoundError(
-                        "movingpandas is optional dependency. Add it using pip install movingpandas"
-                    )
-            return df
-
-        return process
+        return point.coords[0]
+
+    def read_temporal(self, value):
+        if self.wire_format == "binary":
+            # Decoded straight into arrays, without going through WKT
+            return wkb.read_temporal(value)
+        return super().read_temporal(value)
+
+    def frame_arrays(self, value):
+        if self.use_movingpandas:
+            if MOVING_PANDAS:
+                value = value.df
+            else:
+                raise ModuleNotFoundError(
+                    "movingpandas is optional dependency. Add it using pip install movingpandas"
+                )
+        if self.pandas_value_column not in value.columns:
+            coords = coords_from_columns(value)
+            if coords is not None:
+                return self.frame_times(value), coords
+        times, values = super().frame_arrays(value)
+        if values.dtype.kind != "f":
+            values = coords_from_points(values)
+        return times, check_coords(values)
+
+    def to_arrays(self, value):
+        """
+        Returns the arrays of a value, as in TBaseType. If the column was created
+        with a ``simplify`` tolerance, the trajectory is simplified first.
+        """
+        times, values, segments = super().to_arrays(value)
+        if self.simplify is None or self.subtype == "instantset":
+            return times, values, segments
+
+        count = len(times)
+        times, values, segments = simplify(
+            times, values, self.simplify, segments, self.geographic
+        )
+        counts = self._simplify_counts
+        counts[0] += 1
+        counts[1] += count
+        counts[2] += count - len(times)
+        return times, values, segments
+
+    def simplify_info(self):
+        """
+        Returns the number of values simplified, of points they had and of points
+        dropped from them, or None if simplification is not enabled.
+        """
+        if self.simplify is None:
+            return None
+        return SimplifyInfo(*self._simplify_counts)
+
+    def to_temporal_array(self, times, values, segments=None):
+        return TemporalArray(
+            times,
+            values,
+            self.pandas_value_column,
+            segments,
+            self.geometry,
+            self.tz,
+            self.crs,
+        )
+
+    def from_arrays(self, times, values, segments=None):
+        if not self.use_movingpandas:
+            return super().from_arrays(times, values, segments)
+        if not MOVING_PANDAS:
+            raise ModuleNotFoundError(
+                "movingpandas is optional dependency. Add it using pip install movingpandas"
+            )
+        import movingpandas as mpd
+
+        start = instrumentation.clock() if instrumentation.enabled else None
+        # The GeoDataFrame is built from the coordinates in one go, instead of
+        # building a DataFrame of shapely Points and converting it. movingpandas
+        # drops the timezone of the index, so the times are given in naive UTC,
+        # which is how they are written back
+        columns = {}
+        if segments is not None:
+            columns["segment"] = TemporalArray(
+                times, values, segments=segments
+            ).segment_ids
+        geo_df = points_frame(
+            values,
+            to_datetime_index(times, None).rename("t"),
+            self.pandas_value_column,
+            "geoseries",
+            self.crs or CRS_METRIC,
+            **columns,
+        )
+        trajectory = mpd.Trajectory(geo_df, 1)
+        if start is not None:
+            instrumentation.record(
+                type(self).__name__,
+                "movingpandas",
+                len(times),
+                instrumentation.nbytes((times, values, segments)),
+                0,
+                start,
+            )
+        return trajectory
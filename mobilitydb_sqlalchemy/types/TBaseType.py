@@ -1,24 +1,78 @@
-import pandas as pd
+import numpy as np
+import pytz
 
 from sqlalchemy.types import UserDefinedType
 
+from mobilitydb_sqlalchemy import instrumentation, parser, wkb
+from mobilitydb_sqlalchemy.columnar import TemporalArray, TemporalBatch
 from mobilitydb_sqlalchemy.comparator import Comparator
+from mobilitydb_sqlalchemy.lazy import LazyTemporal
+from mobilitydb_sqlalchemy.utils import epoch_array, format_timestamps
+from .BaseType import CachedKeyMixin
 
+# The types of values received undecoded from the database
+RAW_TYPES = (str, bytes, bytearray, memoryview)
 
-class TBaseType(UserDefinedType):
+
+class TBaseType(CachedKeyMixin, UserDefinedType):
     """
     TBaseType is a wrapper around UserDefinedType on top of which mobilitydb's
     temporal types can be defined. It uses pandas DataFrames to provide structure
     for the common temporal nature of these types.
 
     Children of this class are expected to implement the functions `validate_type`,
-    `write_instant_value`, `parse_instant_value` and the properties `pymeos_*_type`
+    `write_instant_values`, `parse_instant_value` and the properties `pymeos_*_type`
     must be set accordingly.
+
+    Values are read as DataFrames by default. Setting ``return_type="numpy"``
+    returns them as :class:`mobilitydb_sqlalchemy.columnar.TemporalArray` objects
+    instead, which skip building a DataFrame for every row.
+
+    With ``lazy=True``, values are returned wrapped in a
+    :class:`mobilitydb_sqlalchemy.lazy.LazyTemporal` proxy, and are only decoded
+    when they are first used.
+
+    DataFrames are never modified when they are written. They are sorted by time
+    (on a copy of their arrays) unless their index is already in order, which is
+    checked in linear time. Producers which guarantee ordered data can skip the
+    check with ``assume_sorted=True``.
+
+    Values are written as sequences by default, or as instant sets with
+    ``subtype="instantset"``. They are written as sequence sets when they have
+    gaps: when the DataFrame has a ``segment`` column (a new sequence starts
+    wherever its value changes), when the TemporalArray has ``segments``, or
+    when the time between two instants is larger than ``max_gap``. Sequence sets
+    are read back with a ``segment`` column.
+
+    ``precision`` rounds float values and coordinates to that many decimal
+    digits when they are written as text, and ``compact=True`` writes
+    timestamps with a ``Z`` offset and no spaces between instants, so that
+    large inserts send fewer bytes.
+
+    Timestamps are read into ``datetime64[ns, UTC]`` indexes straight from the
+    parsed arrays, without creating Python datetime objects. ``tz`` converts
+    them to another timezone, or leaves them naive (in UTC) if None.
     """
 
+    cache_ok = True
+
     pandas_value_column = "value"
     comparator_factory = Comparator
 
+    # Shape of each decoded value, such as (2,) for points as coordinates
+    value_shape = ()
+
+    # Used when writing values in MobilityDB's binary format
+    wkb_temptype = None
+    linear = False
+
+    # The SQL type of the values, returned by functions such as startValue
+    value_type = None
+
+    # Kind of values for the native text parser, values are parsed using pymeos
+    # if not set
+    text_value_kind = None
+
     @property
     def pymeos_sequence_type(self):
         raise NotImplementedError()
@@ -36,52 +90,356 @@ class TBaseType(UserDefinedType):
         raise NotImplementedError()
 
     @staticmethod
-    def write_instant_value(value):
-        return value
+    def write_instant_values(values):
+        raise NotImplementedError()
 
     @staticmethod
     def parse_instant_value(value):
         return value
 
-    def __init__(self, left_closed=True, right_closed=True):
+    def __init__(
+        self,
+        left_closed=True,
+        right_closed=True,
+        return_type="pandas",
+        lazy=False,
+        assume_sorted=False,
+        subtype="sequence",
+        max_gap=None,
+        tz="UTC",
+        precision=None,
+        compact=False,
+    ):
+        if return_type not in ("pandas", "numpy"):
+            raise ValueError(
+                "return_type must be 'pandas' or 'numpy'. Got: {}".format(return_type)
+            )
+        if subtype not in ("sequence", "instantset"):
+            raise ValueError(
+                "subtype must be 'sequence' or 'instantset'. Got: {}".format(subtype)
+            )
         self.left_closed = left_closed
         self.right_closed = right_closed
+        self.return_type = return_type
+        self.lazy = lazy
+        self.assume_sorted = assume_sorted
+        self.subtype = subtype
+        self.max_gap = max_gap
+        if isinstance(tz, str):
+            try:
+                pytz.timezone(tz)
+            except pytz.UnknownTimeZoneError as e:
+                raise ValueError("Unknown timezone: {}".format(tz)) from e
+        self.tz = tz
+        if precision is not None and (int(precision) != precision or precision < 0):
+            raise ValueError(
+                "precision must be a non-negative integer. Got: {}".format(precision)
+            )
+        self.precision = precision
+        self.compact = compact
+
+    @staticmethod
+    def unwrap_lazy(value):
+        """
+        Returns the decoded value of a LazyTemporal. If it was never decoded and
+        was received as text, the raw text is returned, as it can be written back
+        unchanged.
+        """
+        if not value.loaded and isinstance(value.raw, str):
+            return value.raw
+        return value.value
+
+    def frame_arrays(self, value):
+        """
+        Returns the timestamps and values of a DataFrame as arrays, in the order
+        of its rows.
+        """
+        self.validate_type(value)
+        return self.frame_times(value), value[self.pandas_value_column].to_numpy()
+
+    @staticmethod
+    def frame_times(value):
+        """
+        Returns the timestamps of a DataFrame, from its index. Raises TypeError if
+        the index does not hold timestamps.
+        """
+        import pandas as pd
+
+        if not pd.api.types.is_datetime64_any_dtype(value.index):
+            raise TypeError(
+                "Expected a DataFrame indexed by time. Got an index of {}".format(
+                    value.index.dtype
+                )
+            )
+        return value.index.values
+
+    @staticmethod
+    def frame_segment_ids(value):
+        """
+        Returns the ``segment`` column of a DataFrame as an array, if it has one.
+        """
+        columns = getattr(value, "columns", None)
+        if columns is not None and "segment" in columns:
+            return value["segment"].to_numpy()
+        return None
+
+    def to_arrays(self, value):
+        """
+        Returns the timestamps and values of a DataFrame or TemporalArray as time
+        sorted arrays, without exact duplicate instants, and the offsets of the
+        sequences in them if the value is to be written as a sequence set (or
+        None otherwise).
+        """
+        if isinstance(value, TemporalArray):
+            times, values, segments = value.timestamps, value.values, value.segments
+            if segments is None and self.max_gap is not None:
+                segments = self.split_gaps(times, None)
+            return times, values, segments
+
+        times, values = self.frame_arrays(value)
+        ids = self.frame_segment_ids(value)
+        if not self.assume_sorted and (times[1:] < times[:-1]).any():
+            order = np.argsort(times, kind="stable")
+            times, values = times[order], values[order]
+            ids = None if ids is None else ids[order]
+
+        # Only look for duplicate instants if some timestamp repeats
+        repeated = times[1:] == times[:-1]
+        if repeated.any():
+            same = values[1:] == values[:-1]
+            if same.ndim == 2:
+                same = same.all(axis=1)
+            keep = np.concatenate([[True], ~(repeated & same)])
+            times, values = times[keep], values[keep]
+            ids = None if ids is None else ids[keep]
+
+        if ids is None and self.max_gap is None:
+            return times, values, None
+        return times, values, self.split_gaps(times, ids)
+
+    def split_gaps(self, times, ids):
+        """
+        Returns the offsets of the sequences of a sequence set, starting a new
+        sequence wherever the segment id changes or the time between instants is
+        larger than ``max_gap``.
+        """
+        import pandas as pd
+
+        breaks = np.zeros(max(len(times) - 1, 0), dtype=bool)
+        if ids is not None:
+            breaks |= ids[1:] != ids[:-1]
+        if self.max_gap is not None:
+            breaks |= np.diff(times) > pd.Timedelta(self.max_gap).to_timedelta64()
+        return np.concatenate([[0], np.flatnonzero(breaks) + 1, [len(times)]])
 
     def bind_processor(self, dialect):
         def process(value):
-            self.validate_type(value)
-            value.sort_index(inplace=True)
-
-            instants = {
-                self.pymeos_instant_type(
-                    self.write_instant_value(
-                        getattr(value.loc[v], self.pandas_value_column)
-                    ),
-                    v,
-                )
-                for v in value.index
-            }
-            sequence = self.pymeos_sequence_type(
-                instants, self.left_closed, self.right_closed
+            if isinstance(value, LazyTemporal):
+                value = self.unwrap_lazy(value)
+                if isinstance(value, str):
+                    return value
+
+            if not instrumentation.enabled:
+                return self.write_text(*self.to_arrays(value))
+
+            start = instrumentation.clock()
+            arrays = self.to_arrays(value)
+            text = self.write_text(*arrays)
+            instrumentation.record(
+                type(self).__name__,
+                "bind",
+                len(arrays[0]),
+                instrumentation.nbytes(arrays),
+                len(text),
+                start,
             )
-            return str(sequence)
+            return text
 
         return process
 
+    def write_binary(self, value):
+        """
+        Serializes a value into MobilityDB's binary format, as accepted by its
+        binary input function (used for example by binary ``COPY``).
+        """
+        if isinstance(value, LazyTemporal):
+            value = value.value
+        times, values, segments = self.to_arrays(value)
+        if self.subtype == "instantset":
+            return wkb.write_instant_set(self.wkb_temptype, times, values)
+        if segments is not None:
+            return wkb.write_sequence_set(
+                self.wkb_temptype,
+                times,
+                values,
+                segments,
+                lower_inc=self.left_closed,
+                upper_inc=self.right_closed,
+                linear=self.linear,
+            )
+        return wkb.write_sequence(
+            self.wkb_temptype,
+            times,
+            values,
+            lower_inc=self.left_closed,
+            upper_inc=self.right_closed,
+            linear=self.linear,
+        )
+
+    def write_instants(self, times, values):
+        if self.precision is not None and values.dtype.kind == "f":
+            values = np.round(values, self.precision)
+        return [
+            v + "@" + t
+            for v, t in zip(
+                self.write_instant_values(values),
+                format_timestamps(times, self.compact),
+            )
+        ]
+
+    def write_sequence(self, times, values, instants=None):
+        """
+        Serializes time sorted arrays of timestamps and values into a MobilityDB
+        sequence literal, without creating any intermediate pymeos objects.
+        """
+        if instants is None:
+            instants = self.write_instants(times, values)
+        # A sequence of a single instant must include its bounds
+        single = len(instants) == 1
+        return "{}{}{}".format(
+            "[" if self.left_closed or single else "(",
+            ("," if self.compact else ", ").join(instants),
+            "]" if self.right_closed or single else ")",
+        )
+
+    def write_text(self, times, values, segments=None):
+        """
+        Serializes time sorted arrays into a MobilityDB literal of the subtype
+        of the column: a sequence, an instant set, or a sequence set if the
+        offsets of its sequences are given.
+        """
+        separator = "," if self.compact else ", "
+        if self.subtype == "instantset":
+            return "{" + separator.join(self.write_instants(times, values)) + "}"
+        if segments is None:
+            return self.write_sequence(times, values)
+        instants = self.write_instants(times, values)
+        return "{{{}}}".format(
+            separator.join(
+                self.write_sequence(None, None, instants[start:end])
+                for start, end in zip(segments[:-1].tolist(), segments[1:].tolist())
+            )
+        )
+
+    def read_temporal(self, value):
+        """
+        Parses a value received from the database into an int64 array of
+        timestamps (microseconds since the unix epoch), an array of values, and
+        the offsets of the sequences in them for sequence sets (or None).
+
+        The text is parsed natively into arrays when possible, and using pymeos
+        otherwise.
+        """
+        if self.text_value_kind is not None:
+            try:
+                return parser.parse_temporal(value, self.text_value_kind)
+            except parser.ParseError:
+                pass
+        return self.read_temporal_pymeos(value)
+
+    def read_temporal_pymeos(self, value):
+        """
+        Parses a value using the pymeos deserializer of the type.
+        """
+        deserializer = self.pymeos_deserializer_type(value)
+        body = value[value.rfind(";") + 1 :].lstrip()
+        segments = None
+        if body.startswith("{") and body[1:].lstrip()[:1] in ("[", "("):
+            sequences = sorted(
+                deserializer.nextTSequenceSet().sequences,
+                key=lambda sequence: sequence.startTimestamp,
+            )
+            sequences = [sorted(sequence.instants) for sequence in sequences]
+            instants = [instant for sequence in sequences for instant in sequence]
+            segments = np.zeros(len(sequences) + 1, dtype=np.int64)
+            np.cumsum([len(sequence) for sequence in sequences], out=segments[1:])
+        elif body.startswith("{"):
+            instants = sorted(deserializer.nextTInstantSet().instants)
+        elif body.startswith(("[", "(")):
+            instants = sorted(deserializer.nextTSequence().instants)
+        else:
+            instants = [deserializer.nextTInstant()]
+        times = epoch_array([i.getTimestamp for i in instants], unit="us")
+        values = np.array([self.parse_instant_value(i.getValue) for i in instants])
+        return times, values, segments
+
+    def read_batch(self, values):
+        """
+        Decodes a list of values received from the database at once, into a
+        single TemporalBatch. NULL values are kept as empty, null marked rows.
+        The sequences of sequence sets are kept in the ``segment`` of the batch.
+        """
+        return TemporalBatch.concatenate(
+            [None if value is None else self.read_temporal(value) for value in values],
+            self.pandas_value_column,
+            self.value_shape,
+            getattr(self, "geometry", "shapely"),
+            self.tz,
+            getattr(self, "crs", None),
+        )
+
+    def to_temporal_array(self, times, values, segments=None):
+        return TemporalArray(
+            times, values, self.pandas_value_column, segments, tz=self.tz
+        )
+
+    def read_value(self, value):
+        """
+        Decodes a value received from the database into a DataFrame, or a
+        TemporalArray if the column was created with ``return_type="numpy"``.
+        """
+        if not instrumentation.enabled:
+            return self.from_arrays(*self.read_temporal(value))
+
+        start = instrumentation.clock()
+        arrays = self.read_temporal(value)
+        result = self.from_arrays(*arrays)
+        instrumentation.record(
+            type(self).__name__,
+            "result",
+            len(arrays[0]),
+            len(value),
+            instrumentation.nbytes(arrays),
+            start,
+        )
+        return result
+
+    def from_arrays(self, times, values, segments=None):
+        """
+        Builds the value returned for a column from its decoded arrays.
+        """
+        array = self.to_temporal_array(times, values, segments)
+        if self.return_type == "numpy":
+            return array
+        return array.to_dataframe()
+
     def result_processor(self, dialect, coltype):
+        read_value = self.read_value
+
+        # Values which are not text or bytes were already decoded by the driver,
+        # using the codecs from mobilitydb_sqlalchemy.codecs
+        if self.lazy:
+
+            def process(value):
+                if not isinstance(value, RAW_TYPES):
+                    return value
+                return LazyTemporal(value, read_value)
+
+            return process
+
         def process(value):
-            tseq = self.pymeos_deserializer_type(value).nextTSequence()
-            df = pd.DataFrame(
-                [
-                    {
-                        self.pandas_value_column: self.parse_instant_value(i.getValue),
-                        "t": i.getTimestamp,
-                    }
-                    for i in sorted(tseq.instants)
-                ]
-            )
-            df["t"] = pd.to_datetime(df["t"])
-            df.set_index("t", inplace=True)
-            return df
+            if not isinstance(value, RAW_TYPES):
+                return value
+            return read_value(value)
 
         return process
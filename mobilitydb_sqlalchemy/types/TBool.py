@@ -1,20 +1,40 @@
-import pandas as pd
-
-from pymeos.io import DeserializerBool
-from pymeos.temporal import TBoolInst, TBoolSeq
-from sqlalchemy.types import UserDefinedType
+from sqlalchemy.types import Boolean, UserDefinedType
 
+from mobilitydb_sqlalchemy import parser, wkb
 from .TBaseType import TBaseType
 
 
 class TBool(TBaseType):
-    pymeos_sequence_type = TBoolSeq
-    pymeos_instant_type = TBoolInst
-    pymeos_deserializer_type = DeserializerBool
+    cache_ok = True
+    value_type = Boolean
+    wkb_temptype = wkb.T_BOOL
+    text_value_kind = parser.BOOL
 
     def get_col_spec(self):
         return "TBOOL"
 
+    @property
+    def pymeos_sequence_type(self):
+        from pymeos.temporal import TBoolSeq
+
+        return TBoolSeq
+
+    @property
+    def pymeos_instant_type(self):
+        from pymeos.temporal import TBoolInst
+
+        return TBoolInst
+
+    @property
+    def pymeos_deserializer_type(self):
+        from pymeos.io import DeserializerBool
+
+        return DeserializerBool
+
+    @staticmethod
+    def write_instant_values(values):
+        return ["t" if v else "f" for v in values.tolist()]
+
     @staticmethod
     def validate_type(value):
         dtype_kind = value["value"].dtypes.kind
@@ -5,6 +5,7 @@ from .BaseType import BaseType
 
 
 class TBox(BaseType):
+    cache_ok = True
     base_class = MEOSTBox
 
     def get_col_spec(self):
@@ -1,23 +1,46 @@
-import pandas as pd
-
-from pymeos.io import DeserializerFloat
-from pymeos.temporal import TFloatInst, TFloatSeq
-from sqlalchemy.types import UserDefinedType
-from pandas.api.types import is_numeric_dtype
+from sqlalchemy.types import Float, UserDefinedType
 
+from mobilitydb_sqlalchemy import parser, wkb
+from mobilitydb_sqlalchemy.utils import format_floats
 from .TBaseType import TBaseType
 
 
 class TFloat(TBaseType):
-    pymeos_sequence_type = TFloatSeq
-    pymeos_instant_type = TFloatInst
-    pymeos_deserializer_type = DeserializerFloat
+    cache_ok = True
+    value_type = Float
+    wkb_temptype = wkb.T_FLOAT
+    text_value_kind = parser.FLOAT
+    linear = True
 
     def get_col_spec(self):
         return "TFLOAT"
 
+    @property
+    def pymeos_sequence_type(self):
+        from pymeos.temporal import TFloatSeq
+
+        return TFloatSeq
+
+    @property
+    def pymeos_instant_type(self):
+        from pymeos.temporal import TFloatInst
+
+        return TFloatInst
+
+    @property
+    def pymeos_deserializer_type(self):
+        from pymeos.io import DeserializerFloat
+
+        return DeserializerFloat
+
+    @staticmethod
+    def write_instant_values(values):
+        return format_floats(values)
+
     @staticmethod
     def validate_type(value):
+        from pandas.api.types import is_numeric_dtype
+
         dtypes = value["value"].dtypes
         if not is_numeric_dtype(dtypes):
             raise TypeError(
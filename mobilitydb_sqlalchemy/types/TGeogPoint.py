@@ -1,6 +1,17 @@
+from mobilitydb_sqlalchemy import wkb
 from .TBaseGeomPoint import TBaseGeomPoint
 
 
 class TGeogPoint(TBaseGeomPoint):
+    cache_ok = True
+    wkb_temptype = wkb.T_GEOGPOINT
+    geographic = True
+
     def get_col_spec(self):
         return "TGEOGPOINT"
+
+    @property
+    def value_type(self):
+        from geoalchemy2 import Geography
+
+        return Geography(geometry_type="POINT")
@@ -2,5 +2,7 @@ from .TBaseGeomPoint import TBaseGeomPoint
 
 
 class TGeomPoint(TBaseGeomPoint):
+    cache_ok = True
+
     def get_col_spec(self):
         return "TGEOMPOINT"
@@ -1,20 +1,40 @@
-import pandas as pd
-
-from pymeos.io import DeserializerInt
-from pymeos.temporal import TIntInst, TIntSeq
-from sqlalchemy.types import UserDefinedType
+from sqlalchemy.types import Integer, UserDefinedType
 
+from mobilitydb_sqlalchemy import parser, wkb
 from .TBaseType import TBaseType
 
 
 class TInt(TBaseType):
-    pymeos_sequence_type = TIntSeq
-    pymeos_instant_type = TIntInst
-    pymeos_deserializer_type = DeserializerInt
+    cache_ok = True
+    value_type = Integer
+    wkb_temptype = wkb.T_INT
+    text_value_kind = parser.INT
 
     def get_col_spec(self):
         return "TINT"
 
+    @property
+    def pymeos_sequence_type(self):
+        from pymeos.temporal import TIntSeq
+
+        return TIntSeq
+
+    @property
+    def pymeos_instant_type(self):
+        from pymeos.temporal import TIntInst
+
+        return TIntInst
+
+    @property
+    def pymeos_deserializer_type(self):
+        from pymeos.io import DeserializerInt
+
+        return DeserializerInt
+
+    @staticmethod
+    def write_instant_values(values):
+        return list(map(str, values.tolist()))
+
     @staticmethod
     def validate_type(value):
         dtype_kind = value["value"].dtypes.kind
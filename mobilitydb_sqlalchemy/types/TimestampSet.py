@@ -5,6 +5,7 @@ from .BaseType import BaseType
 
 
 class TimestampSet(BaseType):
+    cache_ok = True
     base_class = MEOSTimestampSet
 
     def get_col_spec(self):
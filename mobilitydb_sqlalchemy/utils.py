@@ -1,4 +1,6 @@
 import datetime
+
+import numpy as np
 import pytz
 
 
@@ -9,3 +11,64 @@ def epoch(year, month, day, hour=0, minute=0):
         .timestamp()
         * 1000
     )
+
+
+def epoch_array(times, unit="ms"):
+    """
+    Vectorized counterpart of ``epoch``: converts an array of timestamps (a
+    DatetimeIndex, ``datetime64`` values, datetimes or strings) into an int64
+    array of milliseconds (or another ``unit``) since the unix epoch. Naive
+    timestamps are taken as UTC, and aware ones are converted to UTC.
+    """
+    import pandas as pd
+
+    times = pd.to_datetime(times, utc=True)
+    if isinstance(times, pd.Series):
+        times = pd.DatetimeIndex(times)
+    return (
+        times.tz_localize(None).values.astype("datetime64[" + unit + "]").view(np.int64)
+    )
+
+
+def to_datetime_index(times, tz="UTC"):
+    """
+    Converts an int64 array of microseconds since the unix epoch into a
+    ``datetime64[ns]`` DatetimeIndex in the timezone ``tz``, without creating
+    any Python datetime objects.
+    """
+    import pandas as pd
+
+    index = pd.DatetimeIndex(
+        np.asarray(times, dtype=np.int64)
+        .view("datetime64[us]")
+        .astype("datetime64[ns]"),
+        tz="UTC",
+    )
+    if tz is None:
+        return index.tz_localize(None)
+    if str(tz) != "UTC":
+        index = index.tz_convert(tz)
+    return index
+
+
+def format_floats(values):
+    """
+    Formats an array of floats the way MEOS writes them: shortest round-trip
+    representation, without a trailing ``.0`` for integral values.
+    """
+    return [
+        s[:-2] if s.endswith(".0") else s
+        for s in map(repr, np.asarray(values, dtype=float).tolist())
+    ]
+
+
+def format_timestamps(times, compact=False):
+    """
+    Formats an array of ``datetime64`` values (in UTC) as ISO 8601 strings.
+    Fractional seconds are only written if at least one of the timestamps has them.
+    With ``compact`` the UTC offset is written as ``Z`` instead of ``+0000``.
+    """
+    times = np.asarray(times, dtype="datetime64[us]")
+    unit = "us" if (times.view(np.int64) % 1000000).any() else "s"
+    suffix = "Z" if compact else "+0000"
+    return [t + suffix for t in np.datetime_as_string(times, unit=unit).tolist()]
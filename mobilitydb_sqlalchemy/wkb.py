@@ -0,0 +1,212 @@
+"""
+Decoding and encoding of the binary representation of MobilityDB temporal values,
+as returned by ``asBinary`` and accepted by binary ``COPY``.
+
+The layout is (all numbers in the byte order given by the first byte)::
+
+    endian (uint8) | temporal type (uint16) | flags (uint8) | [srid (int32)] | body
+
+The lowest bits of the flags hold the subtype, ``0x10`` marks values with a Z
+dimension, ``0x20`` the presence of a SRID and ``0x40`` linear interpolation. The body of a
+sequence is the number of instants (int32), a bounds byte (``0x01`` lower
+inclusive, ``0x02`` upper inclusive) followed by the instants. The body of an
+instant set is the number of instants followed by the instants, and the one of
+a sequence set the number of sequences followed by their bodies. Every instant
+is its value followed by its timestamp, as microseconds since 2000-01-01
+(PostgreSQL's epoch).
+
+Since all the instants of a sequence have the same size, they are read with a
+single ``numpy.frombuffer`` call instead of being parsed one by one.
+"""
+import struct
+
+import numpy as np
+
+T_BOOL = 1
+T_FLOAT = 5
+T_GEOGPOINT = 6
+T_GEOMPOINT = 7
+T_INT = 8
+
+TINSTANT = 1
+TINSTANTSET = 2
+TSEQUENCE = 3
+TSEQUENCESET = 4
+
+SUBTYPE_MASK = 0x07
+ZFLAG = 0x10
+SRIDFLAG = 0x20
+LINEARFLAG = 0x40
+
+LOWER_INC = 0x01
+UPPER_INC = 0x02
+
+# Microseconds between the unix epoch and PostgreSQL's epoch (2000-01-01)
+POSTGRES_EPOCH_US = 946684800000000
+
+_VALUE_FORMATS = {
+    T_BOOL: "?",
+    T_FLOAT: "f8",
+    T_INT: "i4",
+}
+
+
+class WKBHeader:
+    __slots__ = ("byteorder", "temptype", "subtype", "has_z", "srid", "size")
+
+    def __init__(self, data):
+        self.byteorder = "<" if data[0] == 1 else ">"
+        self.temptype, flags = struct.unpack_from(self.byteorder + "HB", data, 1)
+        self.subtype = flags & SUBTYPE_MASK
+        self.has_z = bool(flags & ZFLAG)
+        self.size = 4
+        self.srid = 0
+        if flags & SRIDFLAG:
+            (self.srid,) = struct.unpack_from(self.byteorder + "i", data, self.size)
+            self.size += 4
+
+    def instant_dtype(self):
+        return instant_dtype(self.temptype, self.has_z, self.byteorder)
+
+
+def instant_dtype(temptype, has_z=False, byteorder="<"):
+    """
+    The numpy dtype of a single instant of the given temporal type.
+    """
+    if temptype in (T_GEOMPOINT, T_GEOGPOINT):
+        value = ("value", byteorder + "f8", (3 if has_z else 2,))
+    elif temptype in _VALUE_FORMATS:
+        value = ("value", byteorder + _VALUE_FORMATS[temptype])
+    else:
+        raise ValueError("Unsupported temporal type: {}".format(temptype))
+    return np.dtype([value, ("t", byteorder + "i8")])
+
+
+def read_instants(data, header, offset, count):
+    """
+    Reads ``count`` consecutive instants starting at ``offset``. Returns the
+    timestamps (as microseconds since the unix epoch) and the values as arrays.
+    """
+    records = np.frombuffer(
+        data, dtype=header.instant_dtype(), count=count, offset=offset
+    )
+    times = records["t"].astype(np.int64) + POSTGRES_EPOCH_US
+    values = records["value"].astype(records.dtype["value"].base.newbyteorder("="))
+    return times, values
+
+
+def read_temporal(data):
+    """
+    Decodes a temporal value of any subtype from its binary representation.
+
+    Returns a tuple of ``(times, values, segments)`` where times are microseconds
+    since the unix epoch, and values is an (N,) array, or an (N, 2)/(N, 3) array
+    of coordinates for temporal points. ``segments`` holds the offsets of the
+    sequences of a sequence set in the arrays (the i-th sequence is between
+    ``segments[i]`` and ``segments[i + 1]``), and is None for other subtypes.
+    """
+    data = bytes(data)
+    header = WKBHeader(data)
+    if header.subtype == TINSTANT:
+        return read_instants(data, header, header.size, 1) + (None,)
+    (count,) = struct.unpack_from(header.byteorder + "i", data, header.size)
+    if header.subtype == TINSTANTSET:
+        return read_instants(data, header, header.size + 4, count) + (None,)
+    if header.subtype == TSEQUENCE:
+        return read_instants(data, header, header.size + 5, count) + (None,)
+    if header.subtype != TSEQUENCESET:
+        raise ValueError("Unsupported temporal subtype: {}".format(header.subtype))
+
+    instant_size = header.instant_dtype().itemsize
+    offset = header.size + 4
+    sequences, segments = [], [0]
+    for _ in range(count):
+        (length,) = struct.unpack_from(header.byteorder + "i", data, offset)
+        sequences.append(read_instants(data, header, offset + 5, length))
+        offset += 5 + length * instant_size
+        segments.append(segments[-1] + length)
+    if not sequences:
+        raise ValueError("Empty temporal sequence set")
+    times, values = zip(*sequences)
+    return (
+        np.concatenate(times),
+        np.concatenate(values),
+        np.array(segments, dtype=np.int64),
+    )
+
+
+def _instant_records(temptype, times, values):
+    values = np.asarray(values)
+    has_z = values.ndim == 2 and values.shape[1] == 3
+
+    records = np.empty(len(values), dtype=instant_dtype(temptype, has_z))
+    records["value"] = values
+    records["t"] = (
+        np.asarray(times, dtype="datetime64[us]").view(np.int64) - POSTGRES_EPOCH_US
+    )
+    return records, has_z
+
+
+def _bounds(count, lower_inc, upper_inc):
+    # A sequence of a single instant must include its bounds
+    if count == 1:
+        return LOWER_INC | UPPER_INC
+    return (LOWER_INC if lower_inc else 0) | (UPPER_INC if upper_inc else 0)
+
+
+def write_sequence(
+    temptype, times, values, lower_inc=True, upper_inc=True, linear=False
+):
+    """
+    Encodes time sorted arrays of timestamps (``datetime64``, in UTC) and values
+    into the binary representation of a temporal sequence, in little endian order.
+    """
+    records, has_z = _instant_records(temptype, times, values)
+    flags = TSEQUENCE | (ZFLAG if has_z else 0) | (LINEARFLAG if linear else 0)
+    bounds = _bounds(len(records), lower_inc, upper_inc)
+    header = struct.pack("<BHBiB", 1, temptype, flags, len(records), bounds)
+    return header + records.tobytes()
+
+
+def write_instant(temptype, times, values):
+    """
+    Encodes arrays of a single timestamp and value into the binary representation
+    of a temporal instant, in little endian order.
+    """
+    records, has_z = _instant_records(temptype, times, values)
+    if len(records) != 1:
+        raise ValueError("Expected a single instant. Got: {}".format(len(records)))
+    flags = TINSTANT | (ZFLAG if has_z else 0)
+    return struct.pack("<BHB", 1, temptype, flags) + records.tobytes()
+
+
+def write_instant_set(temptype, times, values):
+    """
+    Encodes time sorted arrays of timestamps and values into the binary
+    representation of a temporal instant set, in little endian order.
+    """
+    records, has_z = _instant_records(temptype, times, values)
+    flags = TINSTANTSET | (ZFLAG if has_z else 0)
+    return struct.pack("<BHBi", 1, temptype, flags, len(records)) + records.tobytes()
+
+
+def write_sequence_set(
+    temptype, times, values, segments, lower_inc=True, upper_inc=True, linear=False
+):
+    """
+    Encodes time sorted arrays of timestamps and values into the binary
+    representation of a temporal sequence set, with one sequence for each range
+    of instants in ``segments`` (see ``read_temporal``). The bounds are the same
+    for all the sequences, or given per sequence as lists.
+    """
+    records, has_z = _instant_records(temptype, times, values)
+    flags = TSEQUENCESET | (ZFLAG if has_z else 0) | (LINEARFLAG if linear else 0)
+    count = len(segments) - 1
+    lower_inc = np.broadcast_to(lower_inc, count)
+    upper_inc = np.broadcast_to(upper_inc, count)
+    parts = [struct.pack("<BHBi", 1, temptype, flags, count)]
+    for i, (start, end) in enumerate(zip(segments[:-1], segments[1:])):
+        bounds = _bounds(end - start, lower_inc[i], upper_inc[i])
+        parts.append(struct.pack("<iB", end - start, bounds))
+        parts.append(records[start:end].tobytes())
+    return b"".join(parts)
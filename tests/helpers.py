@@ -0,0 +1,126 @@
+"""
+Helpers shared by the offline tests (and the benchmarks comparing against the
+previous implementation).
+"""
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from mobilitydb_sqlalchemy import wkb
+
+# 2012-01-01 08:00:00 UTC, in microseconds since the unix epoch
+T0 = 1325404800000000
+
+START = datetime.datetime(2012, 1, 1, 8, 0, 0)
+
+
+def make_df(values, column="value"):
+    """
+    Builds a time indexed DataFrame of the given values, five minutes apart from
+    2012-01-01 08:00:00.
+    """
+    return pd.DataFrame(
+        {
+            column: list(values),
+            "t": [
+                START + datetime.timedelta(minutes=5 * i) for i in range(len(values))
+            ],
+        }
+    ).set_index("t")
+
+
+def point_wkb(coords, step=1000000, segments=None):
+    """
+    Returns the binary representation of a temporal point, as returned by
+    ``asBinary``, of the given coordinates ``step`` microseconds apart from
+    2012-01-01 08:00:00. It is a sequence set if ``segments`` is given.
+    """
+    coords = np.asarray(coords, dtype=float)
+    times = T0 + step * np.arange(len(coords), dtype=np.int64)
+    if segments is None:
+        return wkb.write_sequence(wkb.T_GEOMPOINT, times, coords)
+    return wkb.write_sequence_set(wkb.T_GEOMPOINT, times, coords, segments)
+
+
+def legacy_bind(column_type, df):
+    """
+    Serializes a DataFrame the way the column types did before the bind path was
+    vectorized, building one pymeos instant per row.
+    """
+    from pymeos import GeomPoint
+
+    df = df.sort_index()
+    instants = set()
+    for t in df.index:
+        value = getattr(df.loc[t], column_type.pandas_value_column)
+        if column_type.pandas_value_column == "geometry":
+            value = GeomPoint(value.wkt)
+        instants.add(column_type.pymeos_instant_type(value, t))
+    sequence = column_type.pymeos_sequence_type(
+        instants, column_type.left_closed, column_type.right_closed
+    )
+    return str(sequence)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+        self.closed = False
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def copy_expert(self, sql, file, size=8192):
+        self.connection.sql = sql
+        while True:
+            data = file.read(size)
+            if not data:
+                break
+            self.connection.reads.append(data)
+
+    def close(self):
+        self.connection.closed_cursors += 1
+
+
+class FakeConnection:
+    """
+    A connection returning the given rows for any statement, and recording what
+    is sent to it through ``COPY``.
+    """
+
+    def __init__(self, rows=()):
+        self.result = FakeResult(list(rows))
+        self.options = {}
+        self.statement = None
+        self.sql = None
+        self.reads = []
+        self.closed_cursors = 0
+
+    def execution_options(self, **options):
+        self.options.update(options)
+        return self
+
+    def execute(self, statement):
+        self.statement = statement
+        return self.result
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    @property
+    def data(self):
+        return b"".join(self.reads)
@@ -1,3 +1,5 @@
+import datetime
+
 from sqlalchemy import (
     Column,
     DateTime,
@@ -7,6 +9,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.ext.declarative import declarative_base
 
+from mobilitydb_sqlalchemy.orm import DeferredTemporalMixin
+
 from mobilitydb_sqlalchemy import (
     Period,
     PeriodSet,
@@ -55,6 +59,12 @@ class Periods(Base):
     period = Column(Period)
 
 
+class CachedPeriods(Base):
+    __tablename__ = "period_test_008"
+    id = Column(Integer, primary_key=True)
+    period = Column(Period(cache_size=16))
+
+
 class PeriodSets(Base):
     __tablename__ = "periodset_test_001"
     id = Column(Integer, primary_key=True)
@@ -111,3 +121,24 @@ class GeogTripsWithMovingPandas(Base):
     car_id = Column(Integer, primary_key=True)
     trip_id = Column(Integer, primary_key=True)
     trip = Column(TGeogPoint(use_movingpandas=True))
+
+
+class TripsWithBinaryWireFormat(Base):
+    __tablename__ = "trips_bin_test_008"
+    car_id = Column(Integer, primary_key=True)
+    trip_id = Column(Integer, primary_key=True)
+    trip = Column(TGeomPoint(wire_format="binary"))
+
+
+class TripsWithGaps(Base):
+    __tablename__ = "trips_gaps_test_012"
+    car_id = Column(Integer, primary_key=True)
+    trip_id = Column(Integer, primary_key=True)
+    trip = Column(TGeomPoint(max_gap=datetime.timedelta(minutes=30)))
+
+
+class DeferredTrips(DeferredTemporalMixin, Base):
+    __tablename__ = "trips_deferred_test_019"
+    car_id = Column(Integer, primary_key=True)
+    trip_id = Column(Integer, primary_key=True)
+    trip = Column(TGeomPoint)
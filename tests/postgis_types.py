@@ -2,10 +2,14 @@ import sqlalchemy.types as types
 
 
 class Geometry(types.UserDefinedType):
+    cache_ok = True
+
     def get_col_spec(self, **kw):
         return "GEOMETRY"
 
 
 class Geography(types.UserDefinedType):
+    cache_ok = True
+
     def get_col_spec(self, **kw):
         return "GEOGRAPHY"
@@ -0,0 +1,207 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point
+
+from mobilitydb_sqlalchemy import (
+    TBool,
+    TFloat,
+    TGeomPoint,
+    TGeogPoint,
+    TInt,
+    parser,
+    wkb,
+)
+from mobilitydb_sqlalchemy.columnar import TemporalArray
+
+from .helpers import T0, legacy_bind, make_df
+
+
+@pytest.mark.parametrize(
+    "column_type, column, values",
+    [
+        (TInt(), "value", [0, 8, -6, 9]),
+        (TFloat(True, False), "value", [0, 8.2, 6.6, 9.1]),
+        (TBool(), "value", [True, False, False, True]),
+        (TGeomPoint(), "geometry", [Point(0, 0), Point(2, 0), Point(2, -1.9)]),
+        (TGeogPoint(), "geometry", [Point(1.5, 2), Point(-3, 4.25)]),
+    ],
+)
+def test_matches_pymeos_serialization(column_type, column, values):
+    df = make_df(values, column)
+    process = column_type.bind_processor(None)
+    assert process(df.copy()) == legacy_bind(column_type, df)
+
+
+def test_tfloat_literal():
+    df = make_df([8.2, 0, 6.6], "value")
+    process = TFloat(True, False).bind_processor(None)
+    assert process(df) == (
+        "[8.2@2012-01-01T08:00:00+0000, "
+        "0@2012-01-01T08:05:00+0000, "
+        "6.6@2012-01-01T08:10:00+0000)"
+    )
+
+
+def test_tgeompoint_literal():
+    df = make_df([Point(0, 0), Point(2, -1.9)], "geometry")
+    process = TGeomPoint().bind_processor(None)
+    assert process(df) == (
+        "[POINT(0 0)@2012-01-01T08:00:00+0000, POINT(2 -1.9)@2012-01-01T08:05:00+0000]"
+    )
+
+
+def test_unsorted_and_duplicate_instants():
+    df = pd.DataFrame(
+        [
+            {"value": 2, "t": datetime.datetime(2012, 1, 1, 8, 10, 0)},
+            {"value": 1, "t": datetime.datetime(2012, 1, 1, 8, 0, 0)},
+            {"value": 2, "t": datetime.datetime(2012, 1, 1, 8, 10, 0)},
+        ]
+    ).set_index("t")
+    process = TInt().bind_processor(None)
+    assert process(df) == "[1@2012-01-01T08:00:00+0000, 2@2012-01-01T08:10:00+0000]"
+
+
+def test_timezone_aware_index():
+    df = make_df([1.5, 2.5], "value")
+    df.index = df.index.tz_localize("Asia/Kolkata")
+    process = TFloat().bind_processor(None)
+    assert process(df) == (
+        "[1.5@2012-01-01T02:30:00+0000, 2.5@2012-01-01T02:35:00+0000]"
+    )
+
+
+def test_index_must_hold_times():
+    df = make_df([1.5, 2.5], "value").reset_index(drop=True)
+    with pytest.raises(TypeError):
+        TFloat().bind_processor(None)(df)
+
+    df = pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]})
+    with pytest.raises(TypeError):
+        TGeomPoint().bind_processor(None)(df)
+
+
+def test_non_point_geometries_are_invalid():
+    df = make_df(np.array(["Point(-3.1 4.7770)"], dtype=object), "geometry")
+    with pytest.raises(TypeError):
+        TGeomPoint().bind_processor(None)(df)
+
+
+def test_points_need_a_geometry_column():
+    with pytest.raises(TypeError):
+        TGeomPoint().bind_processor(None)(make_df([1.5, 2.5], "value"))
+
+
+def test_coordinates_must_be_points():
+    with pytest.raises(TypeError):
+        TGeomPoint().bind_processor(None)(make_df([1.5, 2.5], "geometry"))
+
+    times = np.array([T0, T0 + 1000000])
+    with pytest.raises(TypeError):
+        TGeomPoint().bind_processor(None)(TemporalArray(times, np.zeros((2, 4))))
+
+
+def test_frame_is_not_modified():
+    df = make_df([1, 2, 3], "value").iloc[[2, 0, 1]]
+    expected = df.copy()
+    process = TInt().bind_processor(None)
+    assert process(df) == (
+        "[1@2012-01-01T08:00:00+0000, "
+        "2@2012-01-01T08:05:00+0000, "
+        "3@2012-01-01T08:10:00+0000]"
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_assume_sorted():
+    df = make_df([Point(0, 0), Point(2, -1.9)], "geometry")
+    assert TGeomPoint(assume_sorted=True).bind_processor(None)(
+        df
+    ) == TGeomPoint().bind_processor(None)(df)
+
+
+def test_binary_drops_duplicate_instants():
+    df = make_df([Point(0, 0), Point(2, -1.9)], "geometry")
+    duplicated = pd.concat([df, df.iloc[[1]]])
+    column_type = TGeomPoint()
+    assert column_type.write_binary(duplicated) == column_type.write_binary(df)
+
+
+def test_sequence_set_from_segment_column():
+    df = make_df([1, 2, 3], "value")
+    df["segment"] = [0, 0, 1]
+    process = TInt().bind_processor(None)
+    assert process(df) == (
+        "{[1@2012-01-01T08:00:00+0000, 2@2012-01-01T08:05:00+0000], "
+        "[3@2012-01-01T08:10:00+0000]}"
+    )
+
+
+def test_sequence_set_from_max_gap():
+    df = make_df([1, 2, 3], "value").iloc[[0, 2]]
+    process = TInt(max_gap=datetime.timedelta(minutes=5)).bind_processor(None)
+    assert process(df) == (
+        "{[1@2012-01-01T08:00:00+0000], [3@2012-01-01T08:10:00+0000]}"
+    )
+
+
+def test_single_instant_sequences_include_their_bounds():
+    df = make_df([1, 2, 3, 4], "value").iloc[[0, 2, 3]]
+    column_type = TInt(False, False, max_gap=datetime.timedelta(minutes=5))
+    assert column_type.bind_processor(None)(df) == (
+        "{[1@2012-01-01T08:00:00+0000], "
+        "(3@2012-01-01T08:10:00+0000, 4@2012-01-01T08:15:00+0000)}"
+    )
+
+    data = column_type.write_binary(df)
+    record_size = wkb.instant_dtype(wkb.T_INT, False).itemsize
+    # Each sequence starts with its number of instants and its bounds byte
+    assert data[12] == wkb.LOWER_INC | wkb.UPPER_INC
+    assert data[12 + record_size + 5] == 0
+    assert TInt(False, False).bind_processor(None)(df.iloc[:1]) == (
+        "[1@2012-01-01T08:00:00+0000]"
+    )
+
+
+def test_instant_set():
+    df = make_df([1, 2], "value")
+    process = TInt(subtype="instantset").bind_processor(None)
+    assert process(df) == ("{1@2012-01-01T08:00:00+0000, 2@2012-01-01T08:05:00+0000}")
+
+
+def test_invalid_subtype():
+    with pytest.raises(ValueError):
+        TInt(subtype="sequenceset")
+
+
+def test_compact_literal():
+    df = make_df([8.123456, 0, 6.6], "value")
+    process = TFloat(precision=2, compact=True).bind_processor(None)
+    assert process(df) == (
+        "[8.12@2012-01-01T08:00:00Z,0@2012-01-01T08:05:00Z,6.6@2012-01-01T08:10:00Z]"
+    )
+
+
+@pytest.mark.parametrize("precision", [0, 3, 6])
+def test_precision_round_trip(precision):
+    rng = np.random.default_rng(0)
+    df = make_df([Point(x, y) for x, y in rng.normal(size=(50, 2)) * 1e3], "geometry")
+    column_type = TGeomPoint(precision=precision, compact=True)
+
+    text = column_type.bind_processor(None)(df)
+    times, coords, _ = parser.parse_temporal(text, parser.POINT)
+
+    assert len(text) < len(TGeomPoint().bind_processor(None)(df))
+    assert (times == df.index.values.astype("datetime64[us]").view(np.int64)).all()
+    expected = np.array([[p.x, p.y] for p in df.geometry])
+    assert np.array_equal(coords, np.round(expected, precision))
+
+
+def test_invalid_precision():
+    with pytest.raises(ValueError):
+        TFloat(precision=-1)
+    with pytest.raises(ValueError):
+        TFloat(precision=1.5)
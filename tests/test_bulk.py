@@ -0,0 +1,102 @@
+import struct
+
+import pytest
+from sqlalchemy import Boolean, Column, Integer, MetaData, String, Table
+
+from mobilitydb_sqlalchemy import Period, TFloat
+from mobilitydb_sqlalchemy.bulk import BINARY_HEADER, BINARY_TRAILER, copy_rows
+from mobilitydb_sqlalchemy.wkb import read_temporal
+
+from .helpers import FakeConnection, make_df
+
+metadata = MetaData()
+
+readings = Table(
+    "readings",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+    Column("ok", Boolean),
+    Column("reading", TFloat),
+)
+
+
+def test_copy_text():
+    connection = FakeConnection()
+    rows = [
+        {"id": 1, "name": "tab\there", "ok": True, "reading": make_df([1.5, 2])},
+        {"id": 2, "name": None, "ok": False, "reading": make_df([3.25])},
+    ]
+
+    assert copy_rows(connection, readings, rows) == 2
+    assert connection.sql == "COPY readings (id, name, ok, reading) FROM STDIN"
+    assert connection.data.decode("utf-8").splitlines() == [
+        "1\ttab\\there\tt\t"
+        "[1.5@2012-01-01T08:00:00+0000, 2@2012-01-01T08:05:00+0000]",
+        "2\t\\N\tf\t[3.25@2012-01-01T08:00:00+0000]",
+    ]
+    assert connection.closed_cursors == 1
+
+
+def test_copy_chunks_generator():
+    connection = FakeConnection()
+    rows = ((i, make_df([float(i)])) for i in range(25))
+
+    count = copy_rows(
+        connection, readings, rows, columns=["id", "reading"], chunk_size=10
+    )
+    assert count == 25
+    assert len(connection.data.splitlines()) == 25
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_invalid_chunk_size(chunk_size):
+    connection = FakeConnection()
+    with pytest.raises(ValueError):
+        copy_rows(
+            connection, readings, [(1, "a")], ["id", "name"], chunk_size=chunk_size
+        )
+    assert connection.sql is None
+
+
+def test_small_reads():
+    connection = FakeConnection()
+    rows = [(i, "row {}".format(i)) for i in range(100)]
+
+    copy_rows(connection, readings, rows, columns=["id", "name"], chunk_size=7)
+    lines = connection.data.decode("utf-8").splitlines()
+    assert lines[0] == "0\trow 0"
+    assert lines[99] == "99\trow 99"
+
+
+def test_copy_binary():
+    connection = FakeConnection()
+    rows = [(7, "a", True, make_df([1.5, 2]))]
+
+    copy_rows(connection, readings, rows, format="binary")
+    assert connection.sql.endswith("FROM STDIN WITH (FORMAT binary)")
+
+    data = connection.data
+    assert data.startswith(BINARY_HEADER)
+    assert data.endswith(BINARY_TRAILER)
+
+    position = len(BINARY_HEADER)
+    fields = []
+    (count,) = struct.unpack_from("!h", data, position)
+    position += 2
+    for _ in range(count):
+        (length,) = struct.unpack_from("!i", data, position)
+        fields.append(data[position + 4 : position + 4 + length])
+        position += 4 + length
+
+    assert struct.unpack("!i", fields[0]) == (7,)
+    assert fields[1] == b"a"
+    assert fields[2] == b"\x01"
+    times, values, _ = read_temporal(fields[3])
+    assert values.tolist() == [1.5, 2]
+
+
+def test_binary_unsupported_type():
+    table = Table("periods", MetaData(), Column("period", Period))
+    with pytest.raises(TypeError):
+        copy_rows(FakeConnection(), table, [], format="binary")
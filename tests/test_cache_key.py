@@ -0,0 +1,74 @@
+import datetime
+import warnings
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, bindparam, select
+from sqlalchemy.exc import SAWarning
+
+from mobilitydb_sqlalchemy import TBool, TFloat, TGeogPoint, TGeomPoint, TInt
+from mobilitydb_sqlalchemy.comparator import shared_type
+from mobilitydb_sqlalchemy.simplify import SpatioTemporalTolerance
+
+metadata = MetaData()
+trips = Table(
+    "trips",
+    metadata,
+    Column("car_id", Integer),
+    Column("trip", TGeomPoint),
+    Column("speed", TFloat),
+)
+
+
+def geofence_query(box):
+    return select([trips.c.car_id, trips.c.trip.distance(box)]).where(
+        trips.c.trip.bboxes_overlap(bindparam("box", box))
+        & trips.c.speed.temporal_less_than(50).ever_equal_to(True)
+    )
+
+
+@pytest.mark.parametrize(
+    "column_type",
+    [
+        TBool(),
+        TInt(left_closed=False),
+        TFloat(max_gap=datetime.timedelta(minutes=5), precision=3, compact=True),
+        TGeomPoint(use_movingpandas=True, crs="EPSG:4326"),
+        TGeogPoint(simplify=SpatioTemporalTolerance(2, 30), geometry="coords"),
+    ],
+)
+def test_types_have_hashable_cache_keys(column_type):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SAWarning)
+        key = column_type._static_cache_key
+
+    hash(key)
+    assert column_type._static_cache_key is key
+    assert key == type(column_type)(**dict(key[1:]))._static_cache_key
+
+
+def test_type_arguments_are_part_of_the_cache_key():
+    assert TGeomPoint()._static_cache_key != TGeomPoint(False)._static_cache_key
+    assert (
+        TGeomPoint()._static_cache_key
+        != TGeomPoint(use_movingpandas=True)._static_cache_key
+    )
+    assert TGeomPoint()._static_cache_key != TGeogPoint()._static_cache_key
+
+
+def test_repeated_queries_share_a_cache_key():
+    first, second = (
+        geofence_query("STBOX((0, 0), (1, 1))"),
+        geofence_query("STBOX((2, 2), (3, 3))"),
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SAWarning)
+        first, second = first._generate_cache_key(), second._generate_cache_key()
+
+    assert first is not None
+    assert first == second
+
+
+def test_result_types_are_shared():
+    assert shared_type("TBool") is shared_type("TBool")
+    assert trips.c.speed.temporal_equal(1).type is shared_type("TBool")
+    assert trips.c.trip.distance(trips.c.trip).type is shared_type("TFloat")
@@ -0,0 +1,142 @@
+import asyncio
+import struct
+
+import numpy as np
+import pytest
+from shapely.geometry import Point
+from sqlalchemy import create_engine
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint
+from mobilitydb_sqlalchemy.codecs import (
+    binary_codec,
+    default_types,
+    register_codecs,
+    register_engine_codecs,
+)
+
+from mobilitydb_sqlalchemy.wkb import (
+    LINEARFLAG,
+    POSTGRES_EPOCH_US,
+    SRIDFLAG,
+    T_GEOMPOINT,
+    TINSTANT,
+    TSEQUENCE,
+)
+
+from .helpers import T0, make_df
+
+
+class FakeAsyncpgConnection:
+    def __init__(self):
+        self.codecs = {}
+
+    async def set_type_codec(self, typename, schema, encoder, decoder, format):
+        self.codecs[typename] = (schema, encoder, decoder, format)
+
+
+class FakeAdaptedConnection:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def run_async(self, fn):
+        return asyncio.run(fn(self.connection))
+
+
+def test_register_codecs():
+    connection = FakeAsyncpgConnection()
+    asyncio.run(register_codecs(connection, [TFloat()]))
+
+    schema, encoder, decoder, format = connection.codecs["tfloat"]
+    assert (schema, format) == ("public", "text")
+
+    text = encoder(make_df([1.5, 2.5]))
+    assert text == "[1.5@2012-01-01T08:00:00+0000, 2.5@2012-01-01T08:05:00+0000]"
+    assert encoder(text) == text
+
+    df = decoder(text)
+    assert df.value.tolist() == [1.5, 2.5]
+    # Values decoded by the driver are passed through by the result processor
+    assert TFloat().result_processor(None, None)(df) is df
+
+
+def test_register_default_codecs():
+    connection = FakeAsyncpgConnection()
+    asyncio.run(register_codecs(connection))
+
+    assert len(connection.codecs) == len(default_types())
+    assert {"tgeompoint", "tfloat", "period", "stbox", "intrange"} <= set(
+        connection.codecs
+    )
+
+
+def test_register_point_codecs():
+    connection = FakeAsyncpgConnection()
+    asyncio.run(register_codecs(connection))
+
+    schema, encoder, decoder, format = connection.codecs["tgeompoint"]
+    assert format == "binary"
+
+    # As sent by MobilityDB's binary output function, with the SRID of the value
+    data = struct.pack(
+        "<BHBiiB", 1, T_GEOMPOINT, TSEQUENCE | SRIDFLAG | LINEARFLAG, 4326, 2, 0x03
+    )
+    for i in range(2):
+        data += struct.pack("<ddq", i, 2 * i, T0 + 1000000 * i - POSTGRES_EPOCH_US)
+
+    df = decoder(data)
+    assert df.geometry.tolist() == [Point(0, 0), Point(1, 2)]
+    assert df.index[1].second == 1
+
+    literal = "[POINT(0 0)@2012-01-01 08:00:00+00, POINT(1 2)@2012-01-01 08:00:01+00]"
+    assert encoder(literal) == encoder(df)
+    times, values, _ = TGeomPoint(wire_format="binary").read_temporal(encoder(df))
+    assert times.tolist() == [T0, T0 + 1000000]
+    np.testing.assert_array_equal(values, [[0, 0], [1, 2]])
+
+
+@pytest.mark.parametrize(
+    "options, segment",
+    [
+        ({}, None),
+        ({"left_closed": False, "right_closed": False}, None),
+        ({"subtype": "instantset"}, None),
+        ({"left_closed": False}, [0, 0, 1]),
+        ({}, [0, 1, 2]),
+    ],
+)
+def test_point_codecs_encode_bound_literals(options, segment):
+    encoder, _ = binary_codec(TGeomPoint(wire_format="binary"))
+    df = make_df([Point(0, 0), Point(1, 2), Point(2, 2)], "geometry")
+    if segment is not None:
+        df["segment"] = segment
+
+    literal = TGeomPoint(**options).bind_processor(None)(df)
+
+    assert encoder(literal) == TGeomPoint(wire_format="binary", **options).write_binary(
+        df
+    )
+
+
+def test_point_codecs_encode_instants():
+    encoder, _ = binary_codec(TGeomPoint(wire_format="binary"))
+
+    data = encoder("POINT(1 2)@2012-01-01 08:00:00+00")
+
+    assert data[3] == TINSTANT
+    times, values, _ = TGeomPoint(wire_format="binary").read_temporal(data)
+    assert times.tolist() == [T0]
+    assert values.tolist() == [[1, 2]]
+
+
+def test_text_wire_format_is_not_supported_for_points():
+    with pytest.raises(ValueError):
+        asyncio.run(register_codecs(FakeAsyncpgConnection(), [TGeomPoint()]))
+
+
+def test_register_engine_codecs():
+    engine = create_engine("sqlite://")
+    on_connect = register_engine_codecs(engine, [TFloat()])
+
+    connection = FakeAsyncpgConnection()
+    on_connect(FakeAdaptedConnection(connection), None)
+    assert list(connection.codecs) == ["tfloat"]
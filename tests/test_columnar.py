@@ -0,0 +1,232 @@
+import datetime
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint, TInt
+from mobilitydb_sqlalchemy.columnar import TemporalArray, TemporalBatch
+
+from .helpers import T0, point_wkb
+
+
+def test_to_dataframe():
+    array = TemporalArray([T0, T0 + 1000000], np.array([1.5, 2.5]))
+    df = array.to_dataframe()
+
+    assert len(array) == 2
+    assert df.index.name == "t"
+    assert df.index[1] == datetime.datetime(
+        2012, 1, 1, 8, 0, 1, tzinfo=datetime.timezone.utc
+    )
+    assert df.value.tolist() == [1.5, 2.5]
+    assert array.to_dataframe() is df
+
+
+def test_to_dataframe_timezone():
+    df = TemporalArray([T0], np.array([1.5]), tz="Asia/Kolkata").to_dataframe()
+    assert str(df.index.dtype) == "datetime64[ns, Asia/Kolkata]"
+    assert df.index[0].hour == 13
+    assert df.index[0] == pd.Timestamp(T0 * 1000, tz="UTC")
+
+    df = TemporalArray([T0], np.array([1.5]), tz=None).to_dataframe()
+    assert str(df.index.dtype) == "datetime64[ns]"
+    assert df.index[0] == pd.Timestamp(2012, 1, 1, 8)
+
+
+def test_column_timezone():
+    column_type = TFloat(tz="America/New_York")
+    df = column_type.from_arrays(np.array([T0]), np.array([1.5]))
+    assert str(df.index.tz) == "America/New_York"
+    assert df.index[0].hour == 3
+
+    with pytest.raises(ValueError):
+        TFloat(tz="Nowhere/Special")
+
+
+def test_points_to_dataframe():
+    array = TemporalArray([T0], np.array([[2.0, -1.9]]), "geometry")
+    assert array.to_dataframe().iloc[0].geometry == Point(2, -1.9)
+
+
+def test_timestamps():
+    array = TemporalArray([T0], np.array([1]))
+    assert array.timestamps[0] == np.datetime64("2012-01-01T08:00:00")
+
+
+def test_sequence_set_to_dataframe():
+    array = TemporalArray(
+        [T0, T0 + 1000000, T0 + 9000000], np.array([1.5, 2.5, 3.5]), segments=[0, 2, 3]
+    )
+    assert array.segment_ids.tolist() == [0, 0, 1]
+    assert array.to_dataframe().segment.tolist() == [0, 0, 1]
+
+
+def test_batch():
+    batch = TemporalBatch.concatenate(
+        [
+            (np.array([T0, T0 + 1000000]), np.array([1.5, 2.5])),
+            None,
+            (np.array([T0]), np.array([3.5])),
+        ]
+    )
+
+    assert len(batch) == 3
+    assert batch.offsets.tolist() == [0, 2, 2, 3]
+    assert batch[0].values.tolist() == [1.5, 2.5]
+    assert batch[1] is None
+    assert batch[2].t.tolist() == [T0]
+
+    df = batch.to_dataframe([["a", "b", "c"]], ["key"])
+    assert df.index.names == ["key", "t"]
+    assert df.value.tolist() == [1.5, 2.5, 3.5]
+    assert df.index.get_level_values("key").tolist() == ["a", "a", "c"]
+
+
+def test_batch_of_sequence_sets():
+    batch = TemporalBatch.concatenate(
+        [
+            (np.array([T0, T0 + 1000000]), np.array([1.5, 2.5]), None),
+            (
+                np.array([T0, T0 + 1000000, T0 + 9000000]),
+                np.array([1, 2, 3.0]),
+                [0, 2, 3],
+            ),
+        ]
+    )
+
+    assert batch.segment.tolist() == [0, 0, 0, 0, 1]
+    assert batch[0].segments is None
+    assert batch[1].segments.tolist() == [0, 2, 3]
+    assert batch.to_dataframe().segment.tolist() == [0, 0, 0, 0, 1]
+    assert (
+        TemporalBatch.concatenate([(np.array([T0]), np.array([1.5]))]).segment is None
+    )
+
+
+def test_numpy_return_type():
+    data = point_wkb([(0, 0), (2, 0)], 600000000)
+
+    column_type = TGeomPoint(wire_format="binary", return_type="numpy")
+    array = column_type.result_processor(None, None)(data)
+
+    assert isinstance(array, TemporalArray)
+    assert array.t.tolist() == [T0, T0 + 600000000]
+    assert array.values.tolist() == [[0, 0], [2, 0]]
+
+
+def test_bind_temporal_array():
+    points = TemporalArray([T0, T0 + 600000000], np.array([[0, 0], [2, -1.9]]))
+    process = TGeomPoint().bind_processor(None)
+    assert process(points) == (
+        "[POINT(0 0)@2012-01-01T08:00:00+0000, POINT(2 -1.9)@2012-01-01T08:10:00+0000]"
+    )
+
+    ints = TemporalArray([T0], np.array([3]))
+    process = TInt().bind_processor(None)
+    assert process(ints) == "[3@2012-01-01T08:00:00+0000]"
+
+
+def test_sequence_set_round_trip():
+    array = TemporalArray(
+        [T0, T0 + 1000000, T0 + 9000000], np.array([1.5, 2.5, 3.5]), segments=[0, 2, 3]
+    )
+    column_type = TFloat(return_type="numpy")
+    text = column_type.bind_processor(None)(array)
+    assert text == (
+        "{[1.5@2012-01-01T08:00:00+0000, 2.5@2012-01-01T08:00:01+0000], "
+        "[3.5@2012-01-01T08:00:09+0000]}"
+    )
+
+    result = column_type.result_processor(None, None)(text)
+    assert result.t.tolist() == array.t.tolist()
+    assert result.segments.tolist() == [0, 2, 3]
+
+
+def test_invalid_return_type():
+    with pytest.raises(ValueError):
+        TFloat(return_type="arrow")
+
+    with pytest.raises(ValueError):
+        TGeomPoint(use_movingpandas=True, return_type="numpy")
+
+
+def test_coordinate_columns():
+    array = TemporalArray(
+        [T0, T0 + 1000000], np.array([[0, 0], [2, -1.9]]), "geometry", geometry="coords"
+    )
+    df = array.to_dataframe()
+    assert list(df.columns) == ["x", "y"]
+    assert df.y.tolist() == [0, -1.9]
+    assert array.to_points()[1] == Point(2, -1.9)
+
+    process = TGeomPoint().bind_processor(None)
+    assert process(df) == (
+        "[POINT(0 0)@2012-01-01T08:00:00+0000, POINT(2 -1.9)@2012-01-01T08:00:01+0000]"
+    )
+
+
+def test_coords_return_type():
+    data = point_wkb([(1, 2)])
+
+    column_type = TGeomPoint(wire_format="binary", geometry="coords")
+    df = column_type.result_processor(None, None)(data)
+    assert df.x.tolist() == [1] and df.y.tolist() == [2]
+
+
+def test_geoseries_return_type():
+    geopandas = pytest.importorskip("geopandas")
+    array = TemporalArray(
+        [T0], np.array([[1.0, 2.0]]), "geometry", geometry="geoseries"
+    )
+    df = array.to_dataframe()
+    assert isinstance(df, geopandas.GeoDataFrame)
+    assert df.geometry.iloc[0] == Point(1, 2)
+
+
+def test_geoseries_crs():
+    pytest.importorskip("geopandas")
+    column_type = TGeomPoint(geometry="geoseries", crs="EPSG:4326")
+    df = column_type.from_arrays(np.array([T0]), np.array([[1.0, 2.0]]))
+    assert df.crs.to_epsg() == 4326
+
+
+def test_movingpandas_trajectory():
+    pytest.importorskip("movingpandas")
+    column_type = TGeomPoint(use_movingpandas=True, crs="EPSG:3857")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        trajectory = column_type.from_arrays(
+            np.array([T0, T0 + 1000000]), np.array([[1.0, 2.0], [3.0, 4.0]])
+        )
+    assert trajectory.crs.to_epsg() == 3857
+    assert trajectory.df.geometry.iloc[1] == Point(3, 4)
+    assert trajectory.df.index[1] == pd.Timestamp(2012, 1, 1, 8, 0, 1)
+
+    trajectory = TGeomPoint(use_movingpandas=True).from_arrays(
+        np.array([T0, T0 + 1000000]), np.array([[1.0, 2.0], [3.0, 4.0]])
+    )
+    assert trajectory.crs.to_epsg() == 31256
+
+
+def test_movingpandas_trajectory_round_trip():
+    pytest.importorskip("movingpandas")
+    column_type = TGeomPoint(use_movingpandas=True, tz="Asia/Kolkata")
+    text = "[POINT(0 0)@2012-01-01 08:00:00+00, POINT(1 1)@2012-01-01 08:05:00+00]"
+
+    trajectory = column_type.result_processor(None, None)(text)
+
+    assert trajectory.df.index[0] == pd.Timestamp(2012, 1, 1, 8)
+    assert column_type.bind_processor(None)(trajectory) == (
+        "[POINT(0 0)@2012-01-01T08:00:00+0000, POINT(1 1)@2012-01-01T08:05:00+0000]"
+    )
+
+
+def test_invalid_geometry():
+    with pytest.raises(ValueError):
+        TGeomPoint(geometry="wkt")
+
+    with pytest.raises(ValueError):
+        TGeomPoint(use_movingpandas=True, geometry="coords")
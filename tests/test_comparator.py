@@ -0,0 +1,62 @@
+import datetime
+
+from geoalchemy2 import Geography, Geometry
+from sqlalchemy import Column, Integer, MetaData, Table, select, types
+from sqlalchemy.dialects import postgresql
+
+from mobilitydb_sqlalchemy import Period, STBox, TBox, TFloat, TGeogPoint, TGeomPoint
+
+metadata = MetaData()
+trips = Table(
+    "trips",
+    metadata,
+    Column("car_id", Integer),
+    Column("trip", TGeomPoint),
+    Column("geog_trip", TGeogPoint),
+    Column("speed", TFloat),
+)
+
+
+def compile(expression):
+    return str(
+        select([expression]).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_bounding_boxes():
+    assert isinstance(trips.c.trip.stbox().type, STBox)
+    assert "CAST(trips.trip AS STBOX)" in compile(trips.c.trip.stbox())
+    assert isinstance(trips.c.speed.tbox().type, TBox)
+    assert "CAST(trips.speed AS TBOX)" in compile(trips.c.speed.tbox())
+
+
+def test_timespan():
+    assert isinstance(trips.c.trip.timespan().type, Period)
+    assert "CAST(trips.trip AS PERIOD)" in compile(trips.c.trip.timespan())
+    assert isinstance(trips.c.trip.duration().type, types.Interval)
+    assert isinstance(trips.c.trip.start_timestamp().type, types.DateTime)
+    assert "endTimestamp(trips.trip)" in compile(trips.c.trip.end_timestamp())
+
+
+def test_start_and_end_values():
+    assert "startValue(trips.trip)" in compile(trips.c.trip.start_value())
+    assert "endValue(trips.trip)" in compile(trips.c.trip.end_value())
+    assert isinstance(trips.c.trip.start_value().type, Geometry)
+    assert isinstance(trips.c.geog_trip.end_value().type, Geography)
+    assert isinstance(trips.c.speed.start_value().type, types.Float)
+
+
+def test_num_instants():
+    assert isinstance(trips.c.trip.num_instants().type, types.Integer)
+    assert "numInstants(trips.trip)" in compile(trips.c.trip.num_instants())
+
+
+def test_value_at():
+    expression = trips.c.speed.value_at(datetime.datetime(2012, 1, 1, 8, 10))
+    assert isinstance(expression.type, types.Float)
+    assert (
+        "valueAtTimestamp(trips.speed, CAST(%(param_1)s AS TIMESTAMP WITH TIME ZONE))"
+        in str(select([expression]).compile(dialect=postgresql.dialect()))
+    )
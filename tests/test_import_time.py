@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+import pytest
+
+# Dependencies which must only be imported when they are first used
+HEAVY_MODULES = {
+    "pandas",
+    "pymeos",
+    "shapely",
+    "geopandas",
+    "geoalchemy2",
+    "movingpandas",
+    "fiona",
+}
+
+# Budget for importing the package itself, in microseconds
+PACKAGE_BUDGET = 50000
+
+
+def import_times(statement):
+    """
+    Returns the cumulative import time, in microseconds, of every module imported
+    by running ``statement`` in a new interpreter, using ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_package_import_is_lazy():
+    times = import_times("import mobilitydb_sqlalchemy")
+
+    assert times["mobilitydb_sqlalchemy"] < PACKAGE_BUDGET
+    assert not HEAVY_MODULES & set(times)
+
+
+def test_column_types_import_no_heavy_dependencies():
+    times = import_times(
+        "from mobilitydb_sqlalchemy import TBool, TFloat, TGeogPoint, TGeomPoint, TInt"
+    )
+
+    assert "mobilitydb_sqlalchemy.types.TGeomPoint" in times
+    assert not HEAVY_MODULES & {module.split(".")[0] for module in times}
+
+
+def test_unknown_attribute():
+    import mobilitydb_sqlalchemy
+
+    assert "TGeomPoint" in dir(mobilitydb_sqlalchemy)
+    with pytest.raises(AttributeError):
+        mobilitydb_sqlalchemy.TPoint
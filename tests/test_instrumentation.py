@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint, instrumentation
+from mobilitydb_sqlalchemy.types.BaseType import BaseType
+from mobilitydb_sqlalchemy.types.TBaseGeomPoint import MOVING_PANDAS
+
+from .helpers import make_df
+
+TFLOAT_TEXT = "[1.5@2012-01-01 08:00:00+00, 2.5@2012-01-01 08:05:00+00]"
+
+
+class TextType(BaseType):
+    base_class = str
+
+    def get_col_spec(self):
+        return "TEXT"
+
+
+@pytest.fixture(autouse=True)
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_records_nothing():
+    instrumentation.disable()
+    TFloat().bind_processor(None)(make_df([1.5, 2.5]))
+    TFloat().result_processor(None, None)(TFLOAT_TEXT)
+
+    assert instrumentation.snapshot() == {}
+
+
+def test_bind_counters():
+    process = TFloat().bind_processor(None)
+    literal = process(make_df([1.5, 2.5, 3.5]))
+    process(make_df([1.5]))
+
+    counters = instrumentation.snapshot()["TFloat"]["bind"]
+    assert counters["values"] == 2
+    assert counters["instants"] == 4
+    # int64 timestamps and float64 values
+    assert counters["bytes_in"] == 4 * 16
+    assert counters["bytes_out"] > len(literal)
+    assert counters["nanoseconds"] > 0
+
+
+def test_result_counters():
+    process = TFloat().result_processor(None, None)
+    process(TFLOAT_TEXT)
+    process(None)
+
+    counters = instrumentation.snapshot()["TFloat"]["result"]
+    assert counters["values"] == 1
+    assert counters["instants"] == 2
+    assert counters["bytes_in"] == len(TFLOAT_TEXT)
+    assert counters["bytes_out"] == 2 * 16
+
+
+def test_lazy_values_are_counted_when_decoded():
+    value = TFloat(lazy=True).result_processor(None, None)(TFLOAT_TEXT)
+    assert instrumentation.snapshot() == {}
+
+    len(value)
+    assert instrumentation.snapshot()["TFloat"]["result"]["values"] == 1
+
+
+def test_base_type_counters():
+    column_type = TextType()
+    column_type.bind_processor(None)("abc")
+    column_type.result_processor(None, None)("abcd")
+
+    counters = instrumentation.snapshot()["TextType"]
+    assert counters["bind"]["bytes_out"] == 3
+    assert counters["result"]["bytes_in"] == 4
+    assert counters["result"]["instants"] == 0
+
+
+@pytest.mark.skipif(not MOVING_PANDAS, reason="movingpandas is not installed")
+def test_movingpandas_counters():
+    literal = "[POINT(0 0)@2012-01-01 08:00:00+00, POINT(2 1)@2012-01-01 08:05:00+00]"
+    TGeomPoint(use_movingpandas=True).result_processor(None, None)(literal)
+
+    counters = instrumentation.snapshot()["TGeomPoint"]
+    assert counters["movingpandas"]["instants"] == 2
+    assert counters["movingpandas"]["nanoseconds"] <= counters["result"]["nanoseconds"]
+
+
+def test_listen_records_statements():
+    engine = create_engine("sqlite://")
+    instrumentation.listen(engine)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with pytest.raises(Exception):
+                connection.execute(text("SELECT * FROM missing"))
+            assert connection.info["mobilitydb_execute_start"] == []
+    finally:
+        instrumentation.remove(engine)
+
+    assert instrumentation.snapshot()["database"]["execute"]["values"] == 1
@@ -0,0 +1,59 @@
+import pandas as pd
+from shapely.geometry import Point
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint
+from mobilitydb_sqlalchemy.lazy import LazyTemporal
+
+from .helpers import point_wkb
+
+
+def trip_wkb():
+    return point_wkb([(0, 0), (2, -1.9)], 600000000)
+
+
+def test_decodes_on_first_access():
+    calls = []
+
+    def decode(raw):
+        calls.append(raw)
+        return pd.DataFrame({"value": [1.5, 2.5]})
+
+    proxy = LazyTemporal("raw", decode)
+    assert not proxy.loaded
+    assert calls == []
+
+    assert len(proxy) == 2
+    assert proxy.iloc[1].value == 2.5
+    assert proxy["value"].tolist() == [1.5, 2.5]
+    assert proxy.loaded
+    assert calls == ["raw"]
+
+
+def test_lazy_column():
+    process = TGeomPoint(wire_format="binary", lazy=True).result_processor(None, None)
+    proxy = process(trip_wkb())
+
+    assert isinstance(proxy, LazyTemporal)
+    assert not proxy.loaded
+    assert proxy.size == 2
+    assert proxy.iloc[1].geometry == Point(2, -1.9)
+    assert proxy.value is proxy.value
+
+    assert process(None) is None
+
+
+def test_unread_text_is_written_back_unchanged():
+    raw = "[1.5@2012-01-01 08:00:00+00, 2.5@2012-01-01 08:10:00+00]"
+    proxy = TFloat(lazy=True).result_processor(None, None)(raw)
+
+    assert TFloat().bind_processor(None)(proxy) == raw
+    assert not proxy.loaded
+
+
+def test_read_binary_is_written_back():
+    proxy = TGeomPoint(wire_format="binary", lazy=True).result_processor(None, None)(
+        trip_wkb()
+    )
+    assert TGeomPoint().bind_processor(None)(proxy) == (
+        "[POINT(0 0)@2012-01-01T08:00:00+0000, POINT(2 -1.9)@2012-01-01T08:10:00+0000]"
+    )
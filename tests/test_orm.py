@@ -0,0 +1,61 @@
+import datetime
+
+import pandas as pd
+from shapely.geometry import Point
+from sqlalchemy import Column, Integer, event, inspect
+from sqlalchemy.ext.declarative import declarative_base
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint
+from mobilitydb_sqlalchemy.orm import (
+    DeferredTemporalMixin,
+    deferred_temporal_attributes,
+    undefer_bulk,
+)
+from .models import DeferredTrips
+
+
+def test_mixin_defers_temporal_columns():
+    Base = declarative_base()
+
+    class Vehicles(DeferredTemporalMixin, Base):
+        __tablename__ = "vehicles"
+        id = Column(Integer, primary_key=True)
+        trip = Column(TGeomPoint)
+        speed = Column(TFloat, info={"deferred": False})
+
+    mapper = inspect(Vehicles)
+    assert deferred_temporal_attributes(mapper) == ["trip"]
+    assert mapper.attrs.trip.group == "temporal"
+    assert not mapper.attrs.id.deferred
+    assert not mapper.attrs.speed.deferred
+
+
+def test_undefer_bulk(session):
+    for i in range(5):
+        df = pd.DataFrame(
+            [
+                {"geometry": Point(i, 0), "t": datetime.datetime(2012, 1, 1, 8)},
+                {"geometry": Point(i, 1), "t": datetime.datetime(2012, 1, 1, 8, 10)},
+            ]
+        ).set_index("t")
+        session.add(DeferredTrips(car_id=i, trip_id=1, trip=df))
+    session.commit()
+    session.expunge_all()
+
+    trips = session.query(DeferredTrips).all()
+    assert all("trip" in inspect(trip).unloaded for trip in trips)
+
+    statements = []
+
+    def listener(connection, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(session.bind, "before_cursor_execute", listener)
+    try:
+        undefer_bulk(session, trips, chunk_size=3)
+        assert [trip.trip.iloc[0].geometry.x for trip in trips] == [0, 1, 2, 3, 4]
+    finally:
+        event.remove(session.bind, "before_cursor_execute", listener)
+
+    assert len(statements) == 2
+    assert not session.dirty
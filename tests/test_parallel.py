@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from sqlalchemy import Column, Integer, MetaData, Table, select
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint
+from mobilitydb_sqlalchemy.columnar import TemporalArray
+from mobilitydb_sqlalchemy.parallel import decode_values, fetch_parallel
+
+from .helpers import T0, FakeConnection
+
+
+def float_text(i, n=3):
+    return "[{}]".format(
+        ", ".join("{}@2012-01-01 08:00:{:02d}+00".format(i + j, j) for j in range(n))
+    )
+
+
+class UnusedExecutor:
+    def map(self, *args):
+        raise AssertionError("Small results must be decoded in the current process")
+
+
+class RecordingExecutor:
+    def __init__(self):
+        self.chunks = []
+
+    def map(self, fn, column_types, chunks):
+        self.chunks = list(chunks)
+        return map(fn, column_types, self.chunks)
+
+
+def test_decode_values_small_results_bypass_the_pool():
+    values = [float_text(i) for i in range(10)]
+
+    decoded = decode_values(TFloat(return_type="numpy"), values, UnusedExecutor())
+
+    assert [array.values[0] for array in decoded] == list(range(10))
+
+
+def test_decode_values_keeps_order_and_nulls():
+    values = [float_text(i) for i in range(50)]
+    values[7] = None
+
+    with ThreadPoolExecutor(3) as executor:
+        decoded = decode_values(
+            TFloat(return_type="numpy"), values, executor, chunk_size=4, min_bytes=0
+        )
+
+    assert decoded[7] is None
+    assert [a.values[0] for a in decoded if a is not None] == [
+        i for i in range(50) if i != 7
+    ]
+
+
+def test_decode_values_chunks_per_worker():
+    values = [float_text(i) for i in range(16)]
+
+    executor = RecordingExecutor()
+    decode_values(TFloat(), values, executor, workers=2, min_bytes=0)
+
+    assert [len(chunk) for chunk in executor.chunks] == [2] * 8
+
+
+def test_decode_values_in_processes():
+    values = [float_text(i, 5) for i in range(20)]
+
+    decoded = decode_values(TFloat(), values, workers=2, min_bytes=0)
+
+    assert len(decoded) == 20
+    assert list(decoded[19]["value"]) == [19.0, 20.0, 21.0, 22.0, 23.0]
+    assert decoded[0].index[0].second == 0
+
+
+def test_fetch_parallel_decodes_temporal_columns():
+    column_type = TGeomPoint(wire_format="binary", return_type="numpy")
+    trips = Table(
+        "trips", MetaData(), Column("car_id", Integer), Column("trip", column_type)
+    )
+    times = np.arange(3, dtype=np.int64) * 1000000 + T0
+    trip = column_type.write_binary(
+        TemporalArray(times, np.arange(6, dtype=float).reshape(3, 2))
+    )
+
+    connection = FakeConnection([(1, trip), (2, None)])
+    rows = fetch_parallel(connection, select([trips]), min_bytes=0, workers=1)
+
+    assert [row[0] for row in rows] == [1, 2]
+    assert list(rows[0][1].t) == list(times)
+    assert rows[1][1] is None
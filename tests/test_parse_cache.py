@@ -0,0 +1,65 @@
+import pytest
+
+from mobilitydb_sqlalchemy.types.BaseType import BaseType
+
+
+class Parsed:
+    count = 0
+
+    def __init__(self, value):
+        Parsed.count += 1
+        self.value = value
+
+
+class ParsedType(BaseType):
+    base_class = Parsed
+
+    def get_col_spec(self):
+        return "PARSED"
+
+
+@pytest.fixture(autouse=True)
+def reset_count():
+    Parsed.count = 0
+
+
+def test_cache_disabled_by_default():
+    column_type = ParsedType()
+    process = column_type.result_processor(None, None)
+
+    assert process("a") is not process("a")
+    assert Parsed.count == 2
+    assert column_type.cache_info() is None
+
+
+def test_cache_reuses_parsed_values():
+    column_type = ParsedType(cache_size=2)
+    process = column_type.result_processor(None, None)
+
+    values = [process(value) for value in ["a", "b", "a", "a", "b", None]]
+
+    assert values[0] is values[2] is values[3]
+    assert values[1] is values[4]
+    assert values[5] is None
+    assert Parsed.count == 2
+    info = column_type.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (3, 2, 2, 2)
+
+
+def test_cache_is_bounded():
+    column_type = ParsedType(cache_size=2)
+    process = column_type.result_processor(None, None)
+
+    for value in ["a", "b", "c", "a"]:
+        process(value)
+
+    assert Parsed.count == 4
+    assert column_type.cache_info().currsize == 2
+
+    column_type.cache_clear()
+    assert column_type.cache_info().currsize == 0
+
+
+def test_negative_cache_size():
+    with pytest.raises(ValueError):
+        ParsedType(cache_size=-1)
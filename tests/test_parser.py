@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+
+from mobilitydb_sqlalchemy import TBool, TFloat, TGeomPoint, TInt
+from mobilitydb_sqlalchemy.parser import (
+    ParseError,
+    parse_layout,
+    parse_temporal,
+)
+
+from .helpers import T0
+
+
+def test_sequence():
+    times, values, _ = parse_temporal(
+        "[1.5@2012-01-01 08:00:00+00, 2@2012-01-01 08:05:00.25+00)", "float"
+    )
+    assert times.tolist() == [T0, T0 + 300250000]
+    assert values.tolist() == [1.5, 2.0]
+
+
+def test_instant_and_instant_set():
+    assert parse_temporal("8@2012-01-01 08:00:00+00", "int")[1].tolist() == [8]
+
+    times, values, _ = parse_temporal(
+        "{t@2012-01-01 08:00:00+00, f@2012-01-01 08:00:01+00}", "bool"
+    )
+    assert times.tolist() == [T0, T0 + 1000000]
+    assert values.tolist() == [True, False]
+
+
+def test_prefixes_and_offsets():
+    times, values, _ = parse_temporal(
+        "SRID=4326;Interp=Stepwise;[POINT(1 2)@2012-01-01 13:30:00+05:30, "
+        "POINT(3 -4.5)@2012-01-01T08:00:01Z]",
+        "point",
+    )
+    assert times.tolist() == [T0, T0 + 1000000]
+    assert values.tolist() == [[1, 2], [3, -4.5]]
+
+
+def test_points_with_z():
+    _, values, _ = parse_temporal("[POINT Z(1 2 3)@2012-01-01 08:00:00+00]", "point")
+    assert values.shape == (1, 3)
+
+
+def test_sequence_set():
+    times, values, segments = parse_temporal(
+        "SRID=4326;{[POINT(1 2)@2012-01-01 08:00:00+00, POINT(3 4)@2012-01-01 08:00:01+00), "
+        "[POINT(5 6)@2012-01-01 09:00:00+00]}",
+        "point",
+    )
+    assert times.tolist() == [T0, T0 + 1000000, T0 + 3600000000]
+    assert values.tolist() == [[1, 2], [3, 4], [5, 6]]
+    assert segments.tolist() == [0, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "text, layout",
+    [
+        ("1@2012-01-01 08:00:00+00", ("instant", False, [], [])),
+        ("{1@2012-01-01 08:00:00+00}", ("instantset", False, [], [])),
+        (
+            "(1@2012-01-01 08:00:00+00, 2@2012-01-01 08:05:00+00]",
+            ("sequence", False, [False], [True]),
+        ),
+        (
+            "Interp=Stepwise;{[1@2012-01-01 08:00:00+00], (2@2012-01-01 08:05:00+00, 3@2012-01-01 08:10:00+00)}",
+            ("sequenceset", True, [True, False], [True, False]),
+        ),
+        (
+            "SRID=4326;[POINT(0 0)@2012-01-01 08:00:00+00, POINT(1 1)@2012-01-01 08:05:00+00)",
+            ("sequence", False, [True], [False]),
+        ),
+    ],
+)
+def test_layout(text, layout):
+    assert parse_layout(text) == layout
+
+
+def test_unordered_sequence_set():
+    with pytest.raises(ParseError):
+        parse_temporal(
+            "{[2@2012-01-01 09:00:00+00], [1@2012-01-01 08:00:00+00]}", "int"
+        )
+
+
+def test_unsorted_instants_are_sorted():
+    times, values, _ = parse_temporal(
+        "{2@2012-01-01 08:00:01+00, 1@2012-01-01 08:00:00+00}", "int"
+    )
+    assert times.tolist() == [T0, T0 + 1000000]
+    assert values.tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "text, kind",
+    [
+        ("{[1@2012-01-01 08:00:00+00], x}", "int"),
+        ("[1.5@2012-01-01 08:00:00+00]", "int"),
+        ("[1@2012-01-01 08:00:00+00, x, 2@2012-01-01 08:00:01+00]", "int"),
+        (
+            "[POINT(1 2)@2012-01-01 08:00:00+00, POINT Z(1 2 3)@2012-01-01 08:00:01+00]",
+            "point",
+        ),
+        ("[LINESTRING(1 2, 3 4)@2012-01-01 08:00:00+00]", "point"),
+        ("[]", "float"),
+        ("", "float"),
+    ],
+)
+def test_unsupported_input(text, kind):
+    with pytest.raises(ParseError):
+        parse_temporal(text, kind)
+
+
+def random_literal(rng, column_type, n, start=T0):
+    times = start + np.cumsum(rng.integers(1, 10**9, n))
+    if rng.random() < 0.5:
+        times -= times % 1000000
+    offset = int(rng.choice([0, 60, -300, 330]))
+    local = times + offset * 60000000
+    stamps = np.datetime_as_string(local.astype("datetime64[us]"), unit="us")
+    suffix = "{}{:02d}:{:02d}".format(
+        "-" if offset < 0 else "+", abs(offset) // 60, abs(offset) % 60
+    )
+
+    if isinstance(column_type, TGeomPoint):
+        values = rng.normal(scale=1000, size=(n, 2)).round(int(rng.integers(0, 8)))
+        values = ["POINT({} {})".format(x, y) for x, y in values.tolist()]
+    elif isinstance(column_type, TFloat):
+        values = list(map(repr, rng.normal(scale=1000, size=n).tolist()))
+    elif isinstance(column_type, TInt):
+        values = list(map(str, rng.integers(-(2**31), 2**31, n).tolist()))
+    else:
+        values = ["t" if v else "f" for v in (rng.random(n) < 0.5).tolist()]
+
+    instants = ", ".join(
+        "{}@{}{}".format(v, t.replace("T", " "), suffix) for v, t in zip(values, stamps)
+    )
+    return "{}{}{}".format(
+        "[" if rng.random() < 0.5 else "(", instants, "]" if rng.random() < 0.5 else ")"
+    )
+
+
+@pytest.mark.parametrize("column_type", [TBool(), TFloat(), TGeomPoint(), TInt()])
+def test_matches_pymeos(column_type):
+    rng = np.random.default_rng(9)
+    for _ in range(200):
+        text = random_literal(rng, column_type, int(rng.integers(2, 50)))
+        times, values, _ = parse_temporal(text, column_type.text_value_kind)
+        expected_times, expected_values, _ = column_type.read_temporal_pymeos(text)
+        np.testing.assert_array_equal(times, expected_times)
+        np.testing.assert_array_equal(values, expected_values)
+
+
+@pytest.mark.parametrize("column_type", [TFloat(), TGeomPoint()])
+def test_sequence_sets_match_pymeos(column_type):
+    rng = np.random.default_rng(12)
+    for _ in range(50):
+        text = "{{{}}}".format(
+            ", ".join(
+                random_literal(
+                    rng, column_type, int(rng.integers(2, 10)), T0 + i * 10**12
+                )
+                for i in range(int(rng.integers(1, 5)))
+            )
+        )
+        times, values, segments = parse_temporal(text, column_type.text_value_kind)
+        expected = column_type.read_temporal_pymeos(text)
+        np.testing.assert_array_equal(times, expected[0])
+        np.testing.assert_array_equal(values, expected[1])
+        np.testing.assert_array_equal(segments, expected[2])
@@ -3,7 +3,7 @@ import pytest
 from pymeos.time import Period
 from sqlalchemy.exc import StatementError
 
-from .models import Periods
+from .models import CachedPeriods, Periods
 
 
 def test_simple_insert(session):
@@ -35,3 +35,18 @@ def test_str_values_are_invalid(session):
     with pytest.raises(StatementError):
         session.add(Periods(period=period))
         session.commit()
+
+
+def test_cached_parse(session):
+    period = Period(
+        datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2018, 1, 2, tzinfo=datetime.timezone.utc),
+    )
+
+    session.add_all([CachedPeriods(period=period) for _ in range(3)])
+    session.commit()
+
+    results = session.query(CachedPeriods).all()
+    assert len(results) == 3
+    assert all(result.period.lower == period.lower for result in results)
+    assert CachedPeriods.period.type.cache_info().hits >= 2
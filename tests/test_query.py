@@ -0,0 +1,254 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point
+from sqlalchemy import Column, Integer, MetaData, Table, select
+from sqlalchemy.dialects import postgresql
+
+from mobilitydb_sqlalchemy import TFloat, TGeomPoint
+from mobilitydb_sqlalchemy.columnar import TemporalBatch
+from mobilitydb_sqlalchemy.query import (
+    raw_column,
+    read_long_frame,
+    read_trajectory_collection,
+    stream_temporal,
+)
+from .helpers import FakeConnection, point_wkb
+from .models import Trips
+
+trips = Table(
+    "trips",
+    MetaData(),
+    Column("car_id", Integer),
+    Column("trip", TGeomPoint(wire_format="binary")),
+)
+
+
+def trip_wkb(n, segments=None):
+    return point_wkb(np.arange(2 * n).reshape(n, 2), segments=segments)
+
+
+def test_raw_column():
+    sql = str(raw_column(trips.c.trip).compile(dialect=postgresql.dialect()))
+    assert sql == "asBinary(trips.trip)"
+
+
+def test_stream_in_chunks():
+    rows = [(i, trip_wkb(i + 1) if i != 2 else None) for i in range(5)]
+    connection = FakeConnection(rows)
+
+    chunks = list(
+        stream_temporal(
+            connection, select([trips.c.car_id, trips.c.trip]), chunk_size=2
+        )
+    )
+
+    assert connection.options == {"stream_results": True}
+    assert connection.result.closed
+    assert [chunk["car_id"] for chunk in chunks] == [[0, 1], [2, 3], [4]]
+    assert all(isinstance(chunk["trip"], TemporalBatch) for chunk in chunks)
+
+    batch = chunks[1]["trip"]
+    assert batch[0] is None
+    assert len(batch[1]) == 4
+    assert batch[1].values[3].tolist() == [6, 7]
+    assert len(batch.t) == 4
+
+
+def test_read_long_frame():
+    rows = [(7, trip_wkb(2)), (9, trip_wkb(3))]
+    connection = FakeConnection(rows)
+
+    df = read_long_frame(connection, select([trips.c.car_id, trips.c.trip]))
+
+    assert df.index.names == ["car_id", "t"]
+    assert len(df) == 5
+    assert df.loc[9].iloc[2].geometry == Point(4, 5)
+    assert df.loc[7].index[1] == datetime.datetime(
+        2012, 1, 1, 8, 0, 1, tzinfo=datetime.timezone.utc
+    )
+
+
+def test_read_long_frame_of_sequence_sets():
+    connection = FakeConnection([(7, trip_wkb(3, segments=[0, 1, 3]))])
+
+    df = read_long_frame(connection, select([trips.c.car_id, trips.c.trip]))
+
+    assert df.segment.tolist() == [0, 1, 1]
+
+
+@pytest.mark.parametrize("rows", [[], [(7, None)]])
+def test_read_long_frame_of_no_instants(rows):
+    connection = FakeConnection(rows)
+
+    df = read_long_frame(connection, select([trips.c.car_id, trips.c.trip]))
+
+    assert len(df) == 0
+    assert df.geometry.dtype == object
+
+
+def test_read_long_frame_uses_the_column_options():
+    pytest.importorskip("geopandas")
+    column_type = TGeomPoint(
+        wire_format="binary", geometry="geoseries", crs="EPSG:3857", tz="Asia/Kolkata"
+    )
+    table = Table("trips", MetaData(), Column("trip", column_type))
+    connection = FakeConnection([(trip_wkb(2),)])
+
+    df = read_long_frame(connection, select([table]))
+
+    assert df.crs.to_epsg() == 3857
+    assert str(df.index.get_level_values("t").tz) == "Asia/Kolkata"
+
+
+def test_batch_rows_use_the_column_options():
+    pytest.importorskip("geopandas")
+    column_type = TGeomPoint(
+        wire_format="binary", geometry="geoseries", crs="EPSG:3857", tz="Asia/Kolkata"
+    )
+    value = trip_wkb(2)
+
+    row = column_type.read_batch([value])[0].to_dataframe()
+
+    expected = column_type.result_processor(None, None)(value)
+    assert row.crs == expected.crs
+    assert row.index.equals(expected.index)
+    assert row.geometry.tolist() == expected.geometry.tolist()
+
+
+def test_read_long_frame_without_keys():
+    connection = FakeConnection([(trip_wkb(1),), (trip_wkb(1),)])
+
+    df = read_long_frame(connection, select([trips.c.trip]))
+
+    assert df.index.names == ["row", "t"]
+    assert df.index.get_level_values("row").tolist() == [0, 1]
+
+
+def test_read_trajectory_collection():
+    pytest.importorskip("movingpandas")
+    rows = [(7, trip_wkb(2)), (8, None), (9, trip_wkb(3))]
+    connection = FakeConnection(rows)
+
+    collection = read_trajectory_collection(
+        connection, select([trips.c.car_id, trips.c.trip])
+    )
+
+    assert len(collection) == 2
+    trajectory = collection.get_trajectory(9)
+    assert trajectory.df.geometry.iloc[2] == Point(4, 5)
+    assert trajectory.df.car_id.tolist() == [9, 9, 9]
+    assert trajectory.df.index[1] == pd.Timestamp(2012, 1, 1, 8, 0, 1)
+    assert trajectory.crs.to_epsg() == 31256
+
+
+@pytest.mark.parametrize("rows", [[], [(7, None), (8, None)]])
+def test_read_empty_trajectory_collection(rows):
+    pytest.importorskip("movingpandas")
+    connection = FakeConnection(rows)
+
+    collection = read_trajectory_collection(
+        connection, select([trips.c.car_id, trips.c.trip])
+    )
+
+    assert len(collection) == 0
+
+
+def test_read_trajectory_collection_of_other_types():
+    pytest.importorskip("movingpandas")
+    table = Table("speeds", MetaData(), Column("speed", TFloat))
+
+    with pytest.raises(ValueError):
+        read_trajectory_collection(FakeConnection(), select([table]))
+
+
+def test_read_trajectory_collection_of_sequence_sets():
+    pytest.importorskip("movingpandas")
+    rows = [(7, trip_wkb(2)), (9, trip_wkb(4, segments=[0, 2, 4]))]
+    connection = FakeConnection(rows)
+
+    collection = read_trajectory_collection(
+        connection, select([trips.c.car_id, trips.c.trip])
+    )
+
+    assert sorted(t.id for t in collection) == [(7, 0), (9, 0), (9, 1)]
+    assert collection.get_trajectory((9, 1)).df.geometry.tolist() == [
+        Point(4, 5),
+        Point(6, 7),
+    ]
+
+
+def test_read_trajectory_collection_times_are_utc():
+    pytest.importorskip("movingpandas")
+    table = Table(
+        "trips",
+        MetaData(),
+        Column("trip", TGeomPoint(wire_format="binary", tz="Asia/Kolkata")),
+    )
+    connection = FakeConnection([(trip_wkb(2),)])
+
+    collection = read_trajectory_collection(connection, select([table]))
+
+    assert collection.trajectories[0].df.index[0] == pd.Timestamp(2012, 1, 1, 8)
+
+
+def test_read_trajectory_collection_of_composite_keys():
+    pytest.importorskip("movingpandas")
+    table = Table(
+        "trips",
+        MetaData(),
+        Column("car_id", Integer),
+        Column("trip_id", Integer),
+        Column("trip", TGeomPoint(wire_format="binary", crs="EPSG:3857")),
+    )
+    connection = FakeConnection([(1, 1, trip_wkb(2)), (1, 2, trip_wkb(2))])
+
+    collection = read_trajectory_collection(connection, select([table]))
+
+    assert sorted(t.id for t in collection) == [(1, 1), (1, 2)]
+    assert collection.get_trajectory((1, 2)).crs.to_epsg() == 3857
+
+
+def test_stream_from_database(session):
+    df = pd.DataFrame(
+        [
+            {"geometry": Point(0, 0), "t": datetime.datetime(2012, 1, 1, 8, 0, 0)},
+            {"geometry": Point(2, 0), "t": datetime.datetime(2012, 1, 1, 8, 10, 0)},
+        ]
+    ).set_index("t")
+    session.add_all([Trips(car_id=i, trip_id=1, trip=df) for i in range(3)])
+    session.commit()
+
+    chunks = list(
+        stream_temporal(
+            session,
+            select([Trips.car_id, Trips.trip]).order_by(Trips.car_id),
+            chunk_size=2,
+        )
+    )
+
+    assert [chunk["car_id"] for chunk in chunks] == [[0, 1], [2]]
+    trip = chunks[1]["trip"][0]
+    assert trip.values.tolist() == [[0, 0], [2, 0]]
+    assert trip.to_dataframe().iloc[1].geometry == Point(2, 0)
+
+
+def test_read_long_frame_from_database(session):
+    df = pd.DataFrame(
+        [
+            {"geometry": Point(0, 0), "t": datetime.datetime(2012, 1, 1, 8, 0, 0)},
+            {"geometry": Point(2, 0), "t": datetime.datetime(2012, 1, 1, 8, 10, 0)},
+        ]
+    ).set_index("t")
+    session.add_all([Trips(car_id=i, trip_id=1, trip=df) for i in range(3)])
+    session.commit()
+
+    long_df = read_long_frame(
+        session, select([Trips.car_id, Trips.trip_id, Trips.trip])
+    )
+
+    assert long_df.index.names == ["car_id", "trip_id", "t"]
+    assert len(long_df) == 6
+    assert long_df.loc[(2, 1)].iloc[1].geometry == Point(2, 0)
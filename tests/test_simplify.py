@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point
+
+from mobilitydb_sqlalchemy import TGeogPoint, TGeomPoint
+from mobilitydb_sqlalchemy.simplify import (
+    SpatioTemporalTolerance,
+    simplify,
+    simplify_mask,
+)
+
+
+def seconds(*values):
+    return np.datetime64("2012-01-01T08:00:00") + np.array(values).astype(
+        "timedelta64[s]"
+    )
+
+
+def test_collinear_points_are_dropped():
+    times = seconds(0, 1, 2, 3, 4)
+    coords = np.array([[0, 0], [1, 0], [2, 0], [3, 0], [4, 0]], dtype=float)
+    keep = simplify_mask(times, coords, SpatioTemporalTolerance(meters=0.5))
+    assert keep.tolist() == [True, False, False, False, True]
+
+
+def test_corners_are_kept():
+    times = seconds(0, 1, 2, 3, 4)
+    coords = np.array([[0, 0], [1, 0], [2, 0], [2, 1], [2, 2]], dtype=float)
+    keep = simplify_mask(times, coords, SpatioTemporalTolerance(meters=0.5))
+    assert keep.tolist() == [True, False, True, False, True]
+
+
+def test_changes_in_speed_are_kept():
+    # A straight line, but the object stops for a while at x=1
+    times = seconds(0, 1, 2, 3, 4)
+    coords = np.array([[0, 0], [1, 0], [1, 0], [1, 0], [4, 0]], dtype=float)
+    keep = simplify_mask(times, coords, SpatioTemporalTolerance(meters=0.5))
+    assert keep[1] and keep[3]
+
+
+def test_max_seconds_between_points():
+    times = seconds(*range(0, 101, 10))
+    coords = np.column_stack([np.arange(11), np.zeros(11)]).astype(float)
+    keep = simplify_mask(times, coords, SpatioTemporalTolerance(1, seconds=30))
+    assert 1 < keep.sum() < 11
+    assert np.diff(times[keep]).max() <= np.timedelta64(30, "s")
+
+
+def test_geographic_coordinates():
+    times = seconds(0, 1, 2)
+    # The middle point is 0.0001 degrees, or about 11m, away from the line
+    coords = np.array([[13.4, 52.5], [13.4001, 52.5001], [13.4002, 52.5]])
+    assert simplify_mask(times, coords, SpatioTemporalTolerance(5), True)[1]
+    assert not simplify_mask(times, coords, SpatioTemporalTolerance(20), True)[1]
+
+
+def test_sequence_sets():
+    times = seconds(0, 1, 2, 10, 11, 12)
+    coords = np.column_stack([np.arange(6), np.zeros(6)]).astype(float)
+    times, coords, segments = simplify(
+        times, coords, SpatioTemporalTolerance(1), segments=np.array([0, 3, 6])
+    )
+    assert coords[:, 0].tolist() == [0, 2, 3, 5]
+    assert segments.tolist() == [0, 2, 4]
+
+
+def test_invalid_tolerance():
+    with pytest.raises(ValueError):
+        SpatioTemporalTolerance(meters=-1)
+    with pytest.raises(ValueError):
+        SpatioTemporalTolerance(meters=1, seconds=0)
+
+
+def test_simplify_on_bind():
+    df = pd.DataFrame(
+        {"geometry": [Point(i, 0) for i in range(5)]},
+        index=pd.date_range("2012-01-01 08:00", periods=5, freq="s").rename("t"),
+    )
+    column_type = TGeomPoint(simplify=SpatioTemporalTolerance(meters=2))
+
+    assert column_type.bind_processor(None)(df) == (
+        "[POINT(0 0)@2012-01-01T08:00:00+0000, POINT(4 0)@2012-01-01T08:00:04+0000]"
+    )
+    assert column_type.simplify_info() == (1, 5, 3)
+    assert TGeomPoint().simplify_info() is None
+
+
+def test_geographic_columns():
+    assert TGeogPoint.geographic and not TGeomPoint.geographic
@@ -11,7 +11,12 @@ from sqlalchemy import alias, func
 from sqlalchemy.exc import StatementError
 
 from mobilitydb_sqlalchemy.utils import epoch
-from .models import Trips, TripsWithMovingPandas
+from .models import (
+    Trips,
+    TripsWithBinaryWireFormat,
+    TripsWithGaps,
+    TripsWithMovingPandas,
+)
 
 
 def test_simple_insert(session):
@@ -103,6 +108,127 @@ def test_simple_insert_with_movingpandas(session):
         assert result.trip.df.iloc[2].geometry == Point(2, -1.98)
 
 
+def test_simple_insert_with_binary_wire_format(session):
+    df = pd.DataFrame(
+        [
+            {
+                "geometry": Point(0, 0),
+                "t": datetime.datetime(2012, 1, 1, 8, 0, 0),
+            },
+            {
+                "geometry": Point(2, 0),
+                "t": datetime.datetime(2012, 1, 1, 8, 10, 0),
+            },
+            {
+                "geometry": Point(2, -1.9),
+                "t": datetime.datetime(2012, 1, 1, 8, 15, 0),
+            },
+        ]
+    ).set_index("t")
+
+    session.add(
+        TripsWithBinaryWireFormat(
+            car_id=1,
+            trip_id=1,
+            trip=df,
+        )
+    )
+    session.commit()
+
+    sql = session.query(TripsWithBinaryWireFormat).filter(
+        TripsWithBinaryWireFormat.trip_id == 1
+    )
+    assert sql.count() == 1
+
+    results = sql.all()
+    for result in results:
+        assert result.car_id == 1
+        assert result.trip_id == 1
+        assert result.trip.size == 3
+        assert result.trip.iloc[0].geometry == Point(0, 0)
+        assert result.trip.iloc[1].geometry == Point(2, 0)
+        assert result.trip.iloc[2].geometry == Point(2, -1.9)
+        assert result.trip.index[2] == datetime.datetime(
+            2012, 1, 1, 8, 15, tzinfo=datetime.timezone.utc
+        )
+
+
+def test_projection_helpers(session):
+    df = pd.DataFrame(
+        [
+            {"geometry": Point(0, 0), "t": datetime.datetime(2012, 1, 1, 8, 0, 0)},
+            {"geometry": Point(2, 0), "t": datetime.datetime(2012, 1, 1, 8, 10, 0)},
+            {"geometry": Point(2, -1.9), "t": datetime.datetime(2012, 1, 1, 8, 15, 0)},
+        ]
+    ).set_index("t")
+    session.add(Trips(car_id=1, trip_id=1, trip=df))
+    session.commit()
+
+    num_instants, start, end, duration = session.query(
+        Trips.trip.num_instants(),
+        Trips.trip.start_timestamp(),
+        func.ST_AsText(Trips.trip.end_value()),
+        Trips.trip.duration(),
+    ).one()
+    assert num_instants == 3
+    assert start == datetime.datetime(2012, 1, 1, 8, tzinfo=datetime.timezone.utc)
+    assert loads(end) == Point(2, -1.9)
+    assert duration == datetime.timedelta(minutes=15)
+
+    value = session.query(
+        func.ST_AsText(
+            Trips.trip.value_at(
+                datetime.datetime(2012, 1, 1, 8, 5, tzinfo=datetime.timezone.utc)
+            )
+        )
+    ).scalar()
+    assert loads(value) == Point(1, 0)
+
+
+def test_insert_with_gaps(session):
+    df = pd.DataFrame(
+        [
+            {"geometry": Point(0, 0), "t": datetime.datetime(2012, 1, 1, 8, 0, 0)},
+            {"geometry": Point(2, 0), "t": datetime.datetime(2012, 1, 1, 8, 10, 0)},
+            {"geometry": Point(5, 5), "t": datetime.datetime(2012, 1, 1, 11, 0, 0)},
+        ]
+    ).set_index("t")
+
+    session.add(TripsWithGaps(car_id=1, trip_id=1, trip=df))
+    session.commit()
+
+    assert session.query(func.numSequences(TripsWithGaps.trip)).scalar() == 2
+
+    result = session.query(TripsWithGaps).one()
+    assert len(result.trip) == 3
+    assert result.trip.segment.tolist() == [0, 0, 1]
+    assert result.trip.iloc[2].geometry == Point(5, 5)
+
+
+def test_sequence_set_with_binary_wire_format(session):
+    df = pd.DataFrame(
+        [
+            {
+                "geometry": Point(0, 0),
+                "segment": 0,
+                "t": datetime.datetime(2012, 1, 1, 8, 0, 0),
+            },
+            {
+                "geometry": Point(2, 0),
+                "segment": 1,
+                "t": datetime.datetime(2012, 1, 1, 8, 10, 0),
+            },
+        ]
+    ).set_index("t")
+
+    session.add(TripsWithBinaryWireFormat(car_id=1, trip_id=1, trip=df))
+    session.commit()
+
+    result = session.query(TripsWithBinaryWireFormat).one()
+    assert result.trip.segment.tolist() == [0, 1]
+    assert result.trip.iloc[1].geometry == Point(2, 0)
+
+
 def test_wkt_values_are_valid(session):
     df = pd.DataFrame(
         [
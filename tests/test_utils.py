@@ -0,0 +1,36 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from mobilitydb_sqlalchemy.utils import epoch, epoch_array, to_datetime_index
+
+
+def test_epoch_array_matches_epoch():
+    times = [datetime.datetime(2012, 1, 1, 8), datetime.datetime(2012, 1, 1, 8, 5)]
+    assert epoch_array(times).tolist() == [
+        epoch(2012, 1, 1, 8),
+        epoch(2012, 1, 1, 8, 5),
+    ]
+
+
+def test_epoch_array_converts_to_utc():
+    index = pd.date_range("2012-01-01 13:30", periods=2, freq="min", tz="Asia/Kolkata")
+    assert epoch_array(index).tolist() == [
+        epoch(2012, 1, 1, 8),
+        epoch(2012, 1, 1, 8) + 60000,
+    ]
+    assert epoch_array(pd.Series(index), unit="us").tolist() == [
+        epoch(2012, 1, 1, 8) * 1000,
+        (epoch(2012, 1, 1, 8) + 60000) * 1000,
+    ]
+
+
+def test_to_datetime_index():
+    times = np.array([epoch(2012, 1, 1, 8) * 1000], dtype=np.int64)
+
+    index = to_datetime_index(times)
+    assert str(index.dtype) == "datetime64[ns, UTC]"
+    assert epoch_array(index, unit="us").tolist() == times.tolist()
+
+    assert to_datetime_index(times, "Europe/Paris")[0].hour == 9
@@ -0,0 +1,108 @@
+import struct
+
+import numpy as np
+import pytest
+
+from mobilitydb_sqlalchemy.wkb import (
+    POSTGRES_EPOCH_US,
+    SRIDFLAG,
+    T_FLOAT,
+    T_GEOMPOINT,
+    TINSTANT,
+    TINSTANTSET,
+    TSEQUENCE,
+    TSEQUENCESET,
+    ZFLAG,
+    read_temporal,
+    write_instant_set,
+    write_sequence_set,
+)
+
+from .helpers import T0
+
+
+def header(temptype, flags, srid=None, byteorder="<"):
+    data = struct.pack(byteorder + "BHB", 1 if byteorder == "<" else 0, temptype, flags)
+    if srid is not None:
+        data += struct.pack(byteorder + "i", srid)
+    return data
+
+
+def instant(fmt, values, t, byteorder="<"):
+    return struct.pack(byteorder + fmt + "q", *values, t - POSTGRES_EPOCH_US)
+
+
+def test_point_sequence():
+    data = header(T_GEOMPOINT, TSEQUENCE) + struct.pack("<iB", 3, 0x03)
+    data += instant("dd", (0, 0), T0)
+    data += instant("dd", (2, 0), T0 + 600000000)
+    data += instant("dd", (2, -1.9), T0 + 900000000)
+
+    times, coords, _ = read_temporal(memoryview(data))
+    assert times.tolist() == [T0, T0 + 600000000, T0 + 900000000]
+    assert coords.tolist() == [[0, 0], [2, 0], [2, -1.9]]
+
+
+def test_point_z_sequence_with_srid():
+    data = header(T_GEOMPOINT, TSEQUENCE | ZFLAG | SRIDFLAG, srid=4326)
+    data += struct.pack("<iB", 2, 0x01)
+    data += instant("ddd", (1, 2, 3), T0)
+    data += instant("ddd", (4, 5, 6), T0 + 1000000)
+
+    times, coords, _ = read_temporal(data)
+    assert times.tolist() == [T0, T0 + 1000000]
+    assert coords.shape == (2, 3)
+    assert coords.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_big_endian_float_instant():
+    data = header(T_FLOAT, TINSTANT, byteorder=">") + instant("d", (8.2,), T0, ">")
+
+    times, values, _ = read_temporal(data)
+    assert times.tolist() == [T0]
+    assert values.tolist() == [8.2]
+    assert values.dtype == np.float64
+
+
+def test_unsupported_subtype():
+    data = header(T_GEOMPOINT, 5) + struct.pack("<i", 0)
+    with pytest.raises(ValueError):
+        read_temporal(data)
+
+
+def test_sequence_set():
+    data = header(T_FLOAT, TSEQUENCESET) + struct.pack("<i", 2)
+    data += struct.pack("<iB", 2, 0x03)
+    data += instant("d", (1.5,), T0) + instant("d", (2.5,), T0 + 1000000)
+    data += struct.pack("<iB", 1, 0x03) + instant("d", (3.5,), T0 + 9000000)
+
+    times, values, segments = read_temporal(data)
+    assert times.tolist() == [T0, T0 + 1000000, T0 + 9000000]
+    assert values.tolist() == [1.5, 2.5, 3.5]
+    assert segments.tolist() == [0, 2, 3]
+
+
+def test_instant_set():
+    data = header(T_FLOAT, TINSTANTSET) + struct.pack("<i", 2)
+    data += instant("d", (1.5,), T0) + instant("d", (2.5,), T0 + 1000000)
+
+    times, values, segments = read_temporal(data)
+    assert times.tolist() == [T0, T0 + 1000000]
+    assert segments is None
+
+
+def test_write_sets():
+    times = np.array([T0, T0 + 1000000, T0 + 9000000]).astype("datetime64[us]")
+    coords = np.array([[0, 0], [2, 0], [2, -1.9]])
+
+    data = write_sequence_set(T_GEOMPOINT, times, coords, [0, 2, 3], linear=True)
+    read_times, read_coords, segments = read_temporal(data)
+    assert read_times.tolist() == times.view(np.int64).tolist()
+    assert read_coords.tolist() == coords.tolist()
+    assert segments.tolist() == [0, 2, 3]
+
+    read_times, read_coords, segments = read_temporal(
+        write_instant_set(T_GEOMPOINT, times, coords)
+    )
+    assert read_coords.tolist() == coords.tolist()
+    assert segments is None